@@ -15,6 +15,7 @@ from homeassistant.helpers import device_registry as dr
 from homeassistant.helpers import entity_registry as er
 
 from .combined_coordinator import CombinedDeviceCoordinator
+from .combined_daily_meter import async_remove_combined_daily_meters
 from .const import (
     CONF_ENTRY_TYPE,
     DEFAULT_PORT,
@@ -46,8 +47,12 @@ from .device_utils import (
     migrate_subentry_device_identifiers,
     resolve_entity_id_strategy,
 )
+from .expression_compiler import get_expression_stats
+from .io_queue import DEFAULT_SLAVE_TURNAROUND_S, PriorityIOQueue
 from .logger import ModbusManagerLogger
 from .performance_monitor import PerformanceMonitor
+from .pipelined_transport import DEFAULT_MAX_IN_FLIGHT, PipelinedModbusTcpTransport
+from .read_planner_store import async_remove_read_planner_data
 from .register_optimizer import RegisterOptimizer
 from .template_loader import (
     get_template_by_name,
@@ -434,6 +439,32 @@ async def async_setup(hass: HomeAssistant, config: dict[str, Any]) -> bool:
     return True
 
 
+def _get_pipelined_transport(
+    hass: HomeAssistant, entry: ConfigEntry, host: str, port: int
+) -> PipelinedModbusTcpTransport | None:
+    """Return the shared pipelined read transport if the entry enables it."""
+    if str(entry.data.get("transport") or "").lower() != "pipelined":
+        return None
+    modbus_type = entry.data.get("modbus_type") or entry.data.get("type", "tcp")
+    if modbus_type != "tcp":
+        _LOGGER.warning(
+            "Pipelined transport needs Modbus TCP (type %s), using the hub",
+            modbus_type,
+        )
+        return None
+    global_transport_key = f"global_transport_{host}_{port}"
+    transport = hass.data[DOMAIN].get(global_transport_key)
+    if transport is None:
+        transport = PipelinedModbusTcpTransport(
+            host,
+            port,
+            timeout=entry.data.get("timeout", 5),
+            max_in_flight=entry.data.get("max_in_flight", DEFAULT_MAX_IN_FLIGHT),
+        )
+        hass.data[DOMAIN][global_transport_key] = transport
+    return transport
+
+
 async def _setup_coordinator_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up Modbus Manager using coordinator pattern (experimental)."""
     try:
@@ -500,12 +531,37 @@ async def _setup_coordinator_entry(hass: HomeAssistant, entry: ConfigEntry) -> b
         hass.data[DOMAIN][hub_name] = hub
         hass.data[DOMAIN][global_hub_key] = hub
 
+        # One I/O queue per host:port: all entries behind the same gateway are
+        # interleaved round-robin with a turnaround pause between slaves.
+        global_io_key = f"global_io_{host}_{port}"
+        turnaround_s = (
+            entry.data.get(
+                "slave_turnaround_milliseconds", DEFAULT_SLAVE_TURNAROUND_S * 1000
+            )
+            / 1000.0
+        )
+        io_queue = hass.data[DOMAIN].get(global_io_key)
+        if io_queue is None:
+            io_queue = PriorityIOQueue(slave_turnaround=turnaround_s)
+            hass.data[DOMAIN][global_io_key] = io_queue
+        else:
+            io_queue.slave_turnaround = max(io_queue.slave_turnaround, turnaround_s)
+        # Entries using this endpoint; the queue and transport outlive each one
+        hass.data[DOMAIN].setdefault(f"global_io_users_{host}_{port}", set()).add(
+            entry.entry_id
+        )
+
+        # Optional pipelined read transport, one connection per host:port
+        transport = _get_pipelined_transport(hass, entry, host, port)
+
         # Create coordinator
         coordinator = ModbusCoordinator(
             hass=hass,
             hub=hub,
             device_config=entry.data,
             entry=entry,
+            io_queue=io_queue,
+            transport=transport,
         )
 
         # Store coordinator in hass.data
@@ -792,8 +848,8 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
                 )
                 if coordinator and hasattr(coordinator, "mark_as_unloading"):
                     coordinator.mark_as_unloading()
-                if coordinator and hasattr(coordinator, "async_remove_daily_meters"):
-                    await coordinator.async_remove_daily_meters()
+                if coordinator and hasattr(coordinator, "unload_daily_meters"):
+                    coordinator.unload_daily_meters()
                 del hass.data[DOMAIN][entry.entry_id]
             _LOGGER.debug(
                 "Unloaded combined device placeholder for %s",
@@ -840,6 +896,14 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
                 port = entry.data.get("port", 502)
                 hub_name = f"modbus_manager_{host}_{port}"
                 global_hub_key = f"global_hub_{host}_{port}"
+                global_io_key = f"global_io_{host}_{port}"
+                global_transport_key = f"global_transport_{host}_{port}"
+                global_io_users_key = f"global_io_users_{host}_{port}"
+
+                # The I/O queue is shared per endpoint and outlives the entry
+                io_queue = hass.data[DOMAIN].get(global_io_key)
+                if isinstance(io_queue, PriorityIOQueue):
+                    io_queue.forget_client(entry.entry_id)
 
                 if is_reload:
                     _LOGGER.debug(
@@ -862,6 +926,22 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
                     except Exception as e:
                         _LOGGER.warning("Error closing Modbus hub: %s", str(e))
 
+                    # Other entries on this endpoint keep the shared queue and
+                    # transport; drop them with the last user only
+                    io_users = hass.data[DOMAIN].get(global_io_users_key, set())
+                    io_users.discard(entry.entry_id)
+                    if not io_users:
+                        hass.data[DOMAIN].pop(global_io_users_key, None)
+                        hass.data[DOMAIN].pop(global_io_key, None)
+                        transport = hass.data[DOMAIN].pop(global_transport_key, None)
+                        if isinstance(transport, PipelinedModbusTcpTransport):
+                            try:
+                                await transport.async_close()
+                            except Exception as e:
+                                _LOGGER.warning(
+                                    "Error closing pipelined transport: %s", str(e)
+                                )
+
             # Delete data (but hub reference remains for reload)
             if not is_reload:
                 del hass.data[DOMAIN][entry.entry_id]
@@ -879,6 +959,19 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         return False
 
 
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Remove persisted data of a deleted config entry."""
+    try:
+        await async_remove_read_planner_data(hass, entry.entry_id)
+    except Exception as e:
+        _LOGGER.warning("Error removing learned read planner data: %s", str(e))
+    if entry.data.get(CONF_ENTRY_TYPE) == ENTRY_TYPE_COMBINED_DEVICE:
+        try:
+            await async_remove_combined_daily_meters(hass, entry.entry_id)
+        except Exception as e:
+            _LOGGER.warning("Error removing combined daily meters: %s", str(e))
+
+
 # Service Handlers
 async def async_setup_services(hass: HomeAssistant) -> None:
     """Set up services for Modbus Manager."""
@@ -952,6 +1045,11 @@ async def async_setup_services(hass: HomeAssistant) -> None:
                                                 f"  Total Batch Reads: {total_ranges}\n"
                                             )
                                             message += f"  Total Registers Read: {total_regs}\n"
+                                            total_unchanged = sum(
+                                                op.get("unchanged_registers_count", 0)
+                                                for op in recent_ops
+                                            )
+                                            message += f"  Unchanged (not decoded): {total_unchanged}\n"
                                             if optimization_ratio > 1:
                                                 savings = (
                                                     (total_regs - total_ranges)
@@ -959,6 +1057,58 @@ async def async_setup_services(hass: HomeAssistant) -> None:
                                                 ) * 100
                                                 message += f"  Efficiency: {savings:.1f}% fewer reads"
 
+                                    planner_stats = (
+                                        coordinator.get_optimization_stats()
+                                        if hasattr(
+                                            coordinator, "get_optimization_stats"
+                                        )
+                                        else {}
+                                    )
+                                    if planner_stats.get("estimated_cycle_time_s"):
+                                        message += f"\n\n⏱️ Read Planner:\n"
+                                        message += f"  Estimated Cycle: {planner_stats['estimated_cycle_time_s']:.3f}s\n"
+                                        if "achieved_cycle_time_s" in planner_stats:
+                                            message += f"  Achieved Cycle: {planner_stats['achieved_cycle_time_s']:.3f}s\n"
+                                        message += f"  Padding Words: {planner_stats.get('padding_words', 0)}"
+                                    phase_plan = planner_stats.get("phase_plan")
+                                    if phase_plan:
+                                        strategy = phase_plan["strategy"]
+                                        message += f"\n  Phase Strategy: {strategy}"
+                                        for candidate in ("align", "spread"):
+                                            load = phase_plan.get(candidate, {})
+                                            message += f"\n    {candidate}: avg {load.get('average_requests', 0):.2f} / max {load.get('max_requests', 0)} requests per tick"
+
+                                    schedule = device_metrics.get("schedule", {})
+                                    if schedule:
+                                        message += (
+                                            f"\n\n⏰ Schedule Lateness (avg / max):\n"
+                                        )
+                                        for interval, stats in schedule.items():
+                                            message += f"  {interval}s group: {stats['average_lateness']:.3f}s / {stats['max_lateness']:.3f}s\n"
+
+                                    breakers = (
+                                        coordinator.get_circuit_breaker_status()
+                                        if hasattr(
+                                            coordinator, "get_circuit_breaker_status"
+                                        )
+                                        else []
+                                    )
+                                    if breakers:
+                                        message += f"\n\n🚧 Failing Ranges:\n"
+                                        for breaker in breakers:
+                                            message += f"  {breaker['range']}: {breaker['state']} ({breaker['consecutive_failures']} failures"
+                                            if breaker["state"] == "open":
+                                                message += f", retry in {breaker['retry_in_s']:.0f}s"
+                                            message += ")\n"
+
+                                    expression_stats = get_expression_stats()
+                                    if any(expression_stats.values()):
+                                        message += f"\n\n🧮 Calculated Templates:\n"
+                                        message += f"  Compiled (fast path): {expression_stats['fast_path']}\n"
+                                        message += (
+                                            f"  Jinja: {expression_stats['jinja']}"
+                                        )
+
                                     if device_metrics.get("last_operation"):
                                         message += f"\n\nLast Operation: {device_metrics.get('last_operation')}"
                                 else:
@@ -976,7 +1126,20 @@ async def async_setup_services(hass: HomeAssistant) -> None:
                                 )
 
                                 # Return data for UI display
-                                return {"device_id": device_id, "metrics": summary}
+                                result = {"device_id": device_id, "metrics": summary}
+                                if hasattr(coordinator, "get_optimization_stats"):
+                                    result[
+                                        "read_planner"
+                                    ] = coordinator.get_optimization_stats()
+                                if hasattr(coordinator, "get_io_queue_status"):
+                                    result[
+                                        "io_queue"
+                                    ] = coordinator.get_io_queue_status()
+                                if hasattr(coordinator, "get_circuit_breaker_status"):
+                                    result[
+                                        "circuit_breakers"
+                                    ] = coordinator.get_circuit_breaker_status()
+                                return result
                 if not found:
                     _LOGGER.warning(
                         "Device %s not found or has no performance monitor", device_id
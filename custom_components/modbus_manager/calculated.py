@@ -8,9 +8,9 @@ from homeassistant.components.binary_sensor import BinarySensorEntity
 from homeassistant.components.sensor import SensorEntity
 from homeassistant.core import callback
 from homeassistant.helpers.entity import EntityCategory
-from homeassistant.helpers.event import async_track_state_change_event
 from homeassistant.helpers.template import Template
 
+from .calculated_graph import CalculatedEntityGraph
 from .const import DOMAIN
 from .device_utils import (
     create_base_extra_state_attributes,
@@ -19,6 +19,7 @@ from .device_utils import (
     is_coordinator_connected,
     resolve_mm_registry_markers_ex,
 )
+from .expression_compiler import CompiledExpression, compile_expression
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -49,6 +50,26 @@ def _filter_placeholder_entity_deps(entity_ids: set[str]) -> set[str]:
     return {e for e in entity_ids if e and not e.endswith(".unknown")}
 
 
+def _render_template(
+    hass, template: Template, expression: CompiledExpression | None
+) -> Any:
+    """Render with the compiled expression if there is one, else with Jinja."""
+    if expression is not None:
+        try:
+            return expression.async_render(hass)
+        except Exception as e:
+            # Unusual input (e.g. missing default): Jinja gives the exact result/error
+            if not expression.fallback_logged:
+                expression.fallback_logged = True
+                _LOGGER.debug(
+                    "Compiled template fell back to Jinja (%s: %s): %s",
+                    type(e).__name__,
+                    str(e),
+                    expression.source,
+                )
+    return template.async_render()
+
+
 def _mm_template_fields_have_markers(
     *parts: str | None,
 ) -> bool:
@@ -114,7 +135,6 @@ class ModbusCalculatedSensor(SensorEntity):
         self._raw_icon = config.get("icon_template")
         # Required before _mm_rebuild_registry_templates (uses _static_icon / _raw_icon)
         self._static_icon = config.get("icon")
-        self._unsubscribe_dependency_listener = None
         if self._static_icon:
             self._attr_icon = self._static_icon
             _LOGGER.debug(
@@ -213,7 +233,7 @@ class ModbusCalculatedSensor(SensorEntity):
             return True
 
         try:
-            # Use executor_job to avoid event loop issues
+            # Cached result of the availability template (rendered in _async_render)
             if not hasattr(self, "_availability_result"):
                 # Initialize with default value
                 self._availability_result = True
@@ -301,6 +321,14 @@ class ModbusCalculatedSensor(SensorEntity):
                 )
                 raise
 
+        self._state_expression = compile_expression(state_s)
+        self._availability_expression = (
+            compile_expression(avail_s) if self._raw_availability else None
+        )
+        self._icon_expression = (
+            compile_expression(icon_s) if self._mm_icon_jinja else None
+        )
+
         self._mm_state_res = state_s
         self._mm_avail_res = avail_s if self._raw_availability else None
         self._mm_icon_res = icon_s if self._raw_icon else None
@@ -326,22 +354,16 @@ class ModbusCalculatedSensor(SensorEntity):
         )
 
     def _mm_sync_dependency_listeners(self) -> None:
-        """(Re)subscribe when dependency entity_ids change (e.g. after MM resolution)."""
+        """(Re)register in the calculated entity graph when dependencies change."""
         if not self._mm_hass_add_done:
             return
         new_ids = frozenset(self._dependency_entity_ids)
         if new_ids == getattr(self, "_mm_listener_ids", None):
             return
         self._mm_listener_ids = new_ids
-        if self._unsubscribe_dependency_listener is not None:
-            self._unsubscribe_dependency_listener()
-            self._unsubscribe_dependency_listener = None
-        if new_ids:
-            self._unsubscribe_dependency_listener = async_track_state_change_event(
-                self.hass,
-                list(new_ids),
-                self._handle_dependency_state_change,
-            )
+        CalculatedEntityGraph.get(self.hass).async_register(
+            self.entity_id, self, new_ids
+        )
 
     @property
     def extra_state_attributes(self) -> Dict[str, Any]:
@@ -381,7 +403,7 @@ class ModbusCalculatedSensor(SensorEntity):
         return not bool(self._dependency_entity_ids)
 
     async def async_added_to_hass(self) -> None:
-        """Register dependency listener for targeted recalculation."""
+        """Register in the calculated entity graph for targeted recalculation."""
         await super().async_added_to_hass()
         self._mm_hass_add_done = True
         self._mm_rebuild_registry_templates()
@@ -389,19 +411,27 @@ class ModbusCalculatedSensor(SensorEntity):
         self.async_schedule_update_ha_state(True)
 
     async def async_will_remove_from_hass(self) -> None:
-        """Remove dependency listener when entity is unloaded."""
-        if self._unsubscribe_dependency_listener is not None:
-            self._unsubscribe_dependency_listener()
-            self._unsubscribe_dependency_listener = None
+        """Leave the calculated entity graph when the entity is unloaded."""
+        self._mm_hass_add_done = False
+        self._mm_listener_ids = None
+        CalculatedEntityGraph.get(self.hass).async_unregister(self.entity_id)
         await super().async_will_remove_from_hass()
 
     @callback
-    def _handle_dependency_state_change(self, _event: Any) -> None:
-        """Recalculate only when a referenced source entity changes."""
-        self.async_schedule_update_ha_state(True)
+    def async_recalculate(self) -> None:
+        """Render and write the state (called by the calculated entity graph)."""
+        if not self._mm_hass_add_done:
+            return
+        self._async_render()
+        self.async_write_ha_state()
 
     async def async_update(self) -> None:
         """Update the calculated sensor value."""
+        self._async_render()
+
+    @callback
+    def _async_render(self) -> None:
+        """Render availability, state and icon templates on the event loop."""
         if not self._is_data_available():
             self._attr_native_value = None
             return
@@ -413,9 +443,10 @@ class ModbusCalculatedSensor(SensorEntity):
         # Update availability first if template exists
         if self._availability_template is not None:
             try:
-                # Use executor_job to safely run the sync render method
-                availability_result = await self.hass.async_add_executor_job(
-                    self._availability_template.render
+                availability_result = _render_template(
+                    self.hass,
+                    self._availability_template,
+                    self._availability_expression,
                 )
                 self._availability_result = bool(availability_result)
             except Exception as e:
@@ -430,30 +461,9 @@ class ModbusCalculatedSensor(SensorEntity):
             return
 
         try:
-            # Handle template rendering with proper async/sync detection
-            try:
-                # Use executor_job to safely run the sync render method
-                rendered_value = await self.hass.async_add_executor_job(
-                    self._template.render
-                )
-            except Exception as e:
-                if "Cannot be called from within the event loop" in str(e):
-                    _LOGGER.debug(
-                        "Template rendering issue for %s, trying alternative method",
-                        self._attr_name,
-                    )
-                    # Try to get the value directly
-                    try:
-                        rendered_value = self._template.template
-                        if hasattr(rendered_value, "result"):
-                            rendered_value = rendered_value.result()
-                        else:
-                            # If all else fails, set to None
-                            rendered_value = None
-                    except Exception:
-                        rendered_value = None
-                else:
-                    raise
+            rendered_value = _render_template(
+                self.hass, self._template, self._state_expression
+            )
 
             if rendered_value is None:
                 self._attr_native_value = None
@@ -499,8 +509,8 @@ class ModbusCalculatedSensor(SensorEntity):
             # Update dynamic icon if template is configured
             if self._mm_icon_jinja and self._attr_native_value is not None:
                 try:
-                    rendered_icon = await self.hass.async_add_executor_job(
-                        self._mm_icon_jinja.render
+                    rendered_icon = _render_template(
+                        self.hass, self._mm_icon_jinja, self._icon_expression
                     )
                     if rendered_icon and isinstance(rendered_icon, str):
                         self._attr_icon = rendered_icon.strip()
@@ -530,11 +540,6 @@ class ModbusCalculatedSensor(SensorEntity):
                     self._attr_name,
                 )
                 self._attr_native_value = None
-            elif "Cannot be called from within the event loop" in message:
-                _LOGGER.debug(
-                    "Template rendering issue for %s, setting to None", self._attr_name
-                )
-                self._attr_native_value = None
             else:
                 if not self._template_error_logged:
                     _LOGGER.info(
@@ -612,8 +617,6 @@ class ModbusCalculatedBinarySensor(BinarySensorEntity):
         self._mm_hass_add_done = False
         self._mm_rebuild_registry_templates_binary()
 
-        self._unsubscribe_dependency_listener = None
-
         # Entity attributes
         self._attr_device_class = config.get("device_class")
         self._attr_is_on = None
@@ -724,6 +727,11 @@ class ModbusCalculatedBinarySensor(BinarySensorEntity):
         else:
             self._availability_template = None
 
+        self._state_expression = compile_expression(state_s)
+        self._availability_expression = (
+            compile_expression(avail_s) if self._raw_availability else None
+        )
+
         fully = field_ok(self._raw_state, s_ok) and field_ok(
             self._raw_availability, a_ok
         )
@@ -742,22 +750,16 @@ class ModbusCalculatedBinarySensor(BinarySensorEntity):
         )
 
     def _mm_sync_dependency_listeners_binary(self) -> None:
-        """(Re)subscribe when dependency entity_ids change."""
+        """(Re)register in the calculated entity graph when dependencies change."""
         if not self._mm_hass_add_done:
             return
         new_ids = frozenset(self._dependency_entity_ids)
         if new_ids == getattr(self, "_mm_listener_ids", None):
             return
         self._mm_listener_ids = new_ids
-        if self._unsubscribe_dependency_listener is not None:
-            self._unsubscribe_dependency_listener()
-            self._unsubscribe_dependency_listener = None
-        if new_ids:
-            self._unsubscribe_dependency_listener = async_track_state_change_event(
-                self.hass,
-                list(new_ids),
-                self._handle_dependency_state_change,
-            )
+        CalculatedEntityGraph.get(self.hass).async_register(
+            self.entity_id, self, new_ids
+        )
 
     @property
     def extra_state_attributes(self) -> Dict[str, Any]:
@@ -797,7 +799,7 @@ class ModbusCalculatedBinarySensor(BinarySensorEntity):
         return not bool(self._dependency_entity_ids)
 
     async def async_added_to_hass(self) -> None:
-        """Register dependency listener for targeted recalculation."""
+        """Register in the calculated entity graph for targeted recalculation."""
         await super().async_added_to_hass()
         self._mm_hass_add_done = True
         self._mm_rebuild_registry_templates_binary()
@@ -805,19 +807,27 @@ class ModbusCalculatedBinarySensor(BinarySensorEntity):
         self.async_schedule_update_ha_state(True)
 
     async def async_will_remove_from_hass(self) -> None:
-        """Remove dependency listener when entity is unloaded."""
-        if self._unsubscribe_dependency_listener is not None:
-            self._unsubscribe_dependency_listener()
-            self._unsubscribe_dependency_listener = None
+        """Leave the calculated entity graph when the entity is unloaded."""
+        self._mm_hass_add_done = False
+        self._mm_listener_ids = None
+        CalculatedEntityGraph.get(self.hass).async_unregister(self.entity_id)
         await super().async_will_remove_from_hass()
 
     @callback
-    def _handle_dependency_state_change(self, _event: Any) -> None:
-        """Recalculate only when a referenced source entity changes."""
-        self.async_schedule_update_ha_state(True)
+    def async_recalculate(self) -> None:
+        """Render and write the state (called by the calculated entity graph)."""
+        if not self._mm_hass_add_done:
+            return
+        self._async_render()
+        self.async_write_ha_state()
 
     async def async_update(self) -> None:
         """Update the calculated binary sensor value."""
+        self._async_render()
+
+    @callback
+    def _async_render(self) -> None:
+        """Render availability and state templates on the event loop."""
         if not self._is_data_available():
             self._attr_is_on = None
             return
@@ -829,8 +839,10 @@ class ModbusCalculatedBinarySensor(BinarySensorEntity):
         # Update availability first if template exists
         if self._availability_template is not None:
             try:
-                availability_result = await self.hass.async_add_executor_job(
-                    self._availability_template.render
+                availability_result = _render_template(
+                    self.hass,
+                    self._availability_template,
+                    self._availability_expression,
                 )
                 self._availability_result = bool(availability_result)
             except Exception as e:
@@ -845,34 +857,19 @@ class ModbusCalculatedBinarySensor(BinarySensorEntity):
             return
 
         try:
-            # Handle template rendering
             try:
-                rendered_value = await self.hass.async_add_executor_job(
-                    self._template.render
+                rendered_value = _render_template(
+                    self.hass, self._template, self._state_expression
                 )
-            except Exception as e:
-                if "Cannot be called from within the event loop" in str(e):
-                    _LOGGER.debug(
-                        "Template rendering issue for %s, trying alternative method",
+            except Exception:
+                if not self._template_error_logged:
+                    _LOGGER.info(
+                        "Calculated binary sensor %s template unavailable; waiting for source entities",
                         self._attr_name,
                     )
-                    try:
-                        rendered_value = self._template.template
-                        if hasattr(rendered_value, "result"):
-                            rendered_value = rendered_value.result()
-                        else:
-                            rendered_value = None
-                    except Exception:
-                        rendered_value = None
-                else:
-                    if not self._template_error_logged:
-                        _LOGGER.info(
-                            "Calculated binary sensor %s template unavailable; waiting for source entities",
-                            self._attr_name,
-                        )
-                        self._template_error_logged = True
-                    self._attr_is_on = None
-                    return
+                    self._template_error_logged = True
+                self._attr_is_on = None
+                return
 
             if rendered_value is None:
                 self._attr_is_on = None
@@ -0,0 +1,160 @@
+"""Dependency graph that evaluates calculated entities in topological order."""
+
+from __future__ import annotations
+
+from typing import Any, Dict, FrozenSet, List, Optional, Set, Tuple
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.event import async_track_state_change_event
+
+from .const import DOMAIN
+from .logger import ModbusManagerLogger
+
+_LOGGER = ModbusManagerLogger(__name__)
+
+_GRAPH_KEY = "calculated_entity_graph"
+
+
+class CalculatedEntityGraph:
+    """Recalculate entities whose template inputs changed, once, in DAG order.
+
+    Calculated entities register the entity_ids their templates reference.
+    A single state-change subscription collects changed inputs; evaluation
+    walks the topologically sorted nodes and recalculates every node with a
+    changed input. A node's own state change marks its dependents, so chains
+    (power -> balance -> ratio) settle in one pass. The coordinator evaluates
+    right after notifying its entities; other changes are evaluated on the
+    next loop iteration.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        self._hass = hass
+        # entity_id -> (entity, input entity_ids)
+        self._nodes: Dict[str, Tuple[Any, FrozenSet[str]]] = {}
+        self._order: Optional[List[str]] = None
+        self._dirty: Set[str] = set()
+        self._tracked: FrozenSet[str] = frozenset()
+        self._unsubscribe: Optional[CALLBACK_TYPE] = None
+        self._evaluate_scheduled = False
+        self._evaluating = False
+
+    @classmethod
+    def get(cls, hass: HomeAssistant) -> CalculatedEntityGraph:
+        """Return the graph shared by all config entries."""
+        domain_data = hass.data.setdefault(DOMAIN, {})
+        graph = domain_data.get(_GRAPH_KEY)
+        if graph is None:
+            graph = cls(hass)
+            domain_data[_GRAPH_KEY] = graph
+        return graph
+
+    @callback
+    def async_register(
+        self, entity_id: str, entity: Any, inputs: FrozenSet[str]
+    ) -> None:
+        """Add or update a calculated entity and the entity_ids it reads."""
+        if not inputs:
+            self.async_unregister(entity_id)
+            return
+        self._nodes[entity_id] = (entity, frozenset(inputs))
+        self._order = None
+        self._async_track_inputs()
+
+    @callback
+    def async_unregister(self, entity_id: str) -> None:
+        """Remove a calculated entity (e.g. when it is unloaded)."""
+        if self._nodes.pop(entity_id, None) is None:
+            return
+        self._order = None
+        self._async_track_inputs()
+
+    @callback
+    def _async_track_inputs(self) -> None:
+        """Keep one state-change subscription for the union of all inputs."""
+        tracked: Set[str] = set()
+        for _, inputs in self._nodes.values():
+            tracked |= inputs
+        tracked_ids = frozenset(tracked)
+        if tracked_ids == self._tracked:
+            return
+        self._tracked = tracked_ids
+        if self._unsubscribe is not None:
+            self._unsubscribe()
+            self._unsubscribe = None
+        if tracked_ids:
+            self._unsubscribe = async_track_state_change_event(
+                self._hass, list(tracked_ids), self._async_input_changed
+            )
+
+    @callback
+    def _async_input_changed(self, event: Any) -> None:
+        """Mark an input as changed and make sure an evaluation follows."""
+        self._dirty.add(event.data["entity_id"])
+        if self._evaluating or self._evaluate_scheduled:
+            return
+        self._evaluate_scheduled = True
+        self._hass.loop.call_soon(self._async_scheduled_evaluate)
+
+    @callback
+    def _async_scheduled_evaluate(self) -> None:
+        self._evaluate_scheduled = False
+        self.async_evaluate()
+
+    def _topological_order(self) -> List[str]:
+        """Return nodes so that every node follows the nodes it reads (Kahn)."""
+        if self._order is not None:
+            return self._order
+        dependents: Dict[str, List[str]] = {entity_id: [] for entity_id in self._nodes}
+        pending: Dict[str, int] = {}
+        for entity_id, (_, inputs) in self._nodes.items():
+            upstream = [
+                dep for dep in inputs if dep in self._nodes and dep != entity_id
+            ]
+            pending[entity_id] = len(upstream)
+            for dep in upstream:
+                dependents[dep].append(entity_id)
+
+        ready = sorted(entity_id for entity_id, count in pending.items() if not count)
+        order: List[str] = []
+        while ready:
+            entity_id = ready.pop()
+            order.append(entity_id)
+            for dependent in dependents[entity_id]:
+                pending[dependent] -= 1
+                if not pending[dependent]:
+                    ready.append(dependent)
+
+        if len(order) < len(self._nodes):
+            cyclic = sorted(set(self._nodes) - set(order))
+            _LOGGER.warning(
+                "Calculated entities reference each other in a cycle: %s",
+                ", ".join(cyclic),
+            )
+            order.extend(cyclic)
+        self._order = order
+        return order
+
+    @callback
+    def async_evaluate(self) -> None:
+        """Recalculate every node with a changed input, in topological order."""
+        if not self._dirty or self._evaluating:
+            return
+        self._evaluating = True
+        try:
+            for entity_id in self._topological_order():
+                node = self._nodes.get(entity_id)
+                if node is None or node[1].isdisjoint(self._dirty):
+                    continue
+                entity = node[0]
+                try:
+                    # Writing the state marks entity_id dirty for its dependents
+                    entity.async_recalculate()
+                except Exception as e:
+                    _LOGGER.error(
+                        "Error recalculating calculated entity %s: %s",
+                        entity_id,
+                        str(e),
+                    )
+        finally:
+            self._dirty.clear()
+            self._evaluating = False
@@ -0,0 +1,121 @@
+"""Per-range circuit breaker for Modbus reads."""
+
+from __future__ import annotations
+
+import random
+from dataclasses import dataclass
+from typing import Any, Collection, Dict, Hashable, List
+
+from .logger import ModbusManagerLogger
+
+_LOGGER = ModbusManagerLogger(__name__)
+
+STATE_CLOSED = "closed"
+STATE_OPEN = "open"
+STATE_HALF_OPEN = "half_open"
+
+DEFAULT_FAILURE_THRESHOLD = 3
+DEFAULT_BASE_BACKOFF_S = 30.0
+DEFAULT_MAX_BACKOFF_S = 900.0
+
+# +/- fraction applied to every backoff so ranges do not retry in lockstep
+_BACKOFF_JITTER = 0.2
+
+
+@dataclass
+class BreakerState:
+    """Failure bookkeeping for one read range."""
+
+    state: str = STATE_CLOSED
+    consecutive_failures: int = 0
+    open_count: int = 0  # Times opened without a success in between
+    retry_at: float = 0.0
+    skipped: int = 0
+
+
+class RangeCircuitBreaker:
+    """Skip read ranges that keep failing, retrying them with exponential backoff.
+
+    After ``failure_threshold`` consecutive failures a range is opened and
+    skipped until its backoff expires; the next attempt is half-open. A
+    success closes the breaker, another failure re-opens it with twice the
+    backoff (capped at ``max_backoff``).
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = DEFAULT_FAILURE_THRESHOLD,
+        base_backoff: float = DEFAULT_BASE_BACKOFF_S,
+        max_backoff: float = DEFAULT_MAX_BACKOFF_S,
+    ) -> None:
+        self.failure_threshold = max(1, failure_threshold)
+        self.base_backoff = base_backoff
+        self.max_backoff = max_backoff
+        self._states: Dict[Hashable, BreakerState] = {}
+
+    def allow(self, key: Hashable, now: float) -> bool:
+        """Return True if the range may be read now."""
+        state = self._states.get(key)
+        if state is None or state.state != STATE_OPEN:
+            return True
+        if now >= state.retry_at:
+            state.state = STATE_HALF_OPEN
+            return True
+        state.skipped += 1
+        return False
+
+    def record_success(self, key: Hashable) -> None:
+        """Close the breaker for a range after a successful read."""
+        state = self._states.pop(key, None)
+        if state is not None and state.open_count:
+            _LOGGER.info("Read range %s recovered, circuit closed", key)
+
+    def record_failure(self, key: Hashable, now: float) -> None:
+        """Count a failed read and open the breaker when the threshold is hit."""
+        state = self._states.setdefault(key, BreakerState())
+        state.consecutive_failures += 1
+        if (
+            state.state != STATE_HALF_OPEN
+            and state.consecutive_failures < self.failure_threshold
+        ):
+            return
+        backoff = min(self.max_backoff, self.base_backoff * 2**state.open_count)
+        backoff *= random.uniform(  # nosec B311 - jitter, not security relevant
+            1 - _BACKOFF_JITTER, 1 + _BACKOFF_JITTER
+        )
+        state.open_count += 1
+        state.state = STATE_OPEN
+        state.retry_at = now + backoff
+        _LOGGER.warning(
+            "Read range %s failed %d times in a row, skipping it for %.0fs",
+            key,
+            state.consecutive_failures,
+            backoff,
+        )
+
+    def reset(self) -> None:
+        """Forget all breaker state (e.g. after the register cache was dropped)."""
+        self._states.clear()
+
+    def prune(self, valid_keys: Collection[Hashable]) -> None:
+        """Forget state of ranges that are no longer planned."""
+        for key in [key for key in self._states if key not in valid_keys]:
+            del self._states[key]
+
+    def get_status(self, now: float) -> List[Dict[str, Any]]:
+        """Return state of all ranges with recent failures."""
+        return [
+            {
+                "range": str(key),
+                "state": state.state,
+                "consecutive_failures": state.consecutive_failures,
+                "open_count": state.open_count,
+                "skipped": state.skipped,
+                "retry_in_s": (
+                    round(max(0.0, state.retry_at - now), 1)
+                    if state.state == STATE_OPEN
+                    else 0.0
+                ),
+            }
+            for key, state in self._states.items()
+        ]
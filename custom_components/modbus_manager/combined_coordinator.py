@@ -2,12 +2,14 @@
 
 from __future__ import annotations
 
+from collections.abc import Mapping
 from datetime import timedelta
 from typing import Any
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
 from homeassistant.helpers import entity_registry as er
+from homeassistant.helpers.debounce import Debouncer
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
 from homeassistant.util import dt as dt_util
 
@@ -27,6 +29,12 @@ _LOGGER = ModbusManagerLogger(__name__)
 
 _CONSUMED_FORMULA = "pv - export + import - battery_charge + battery_discharge"
 
+# Refresh is driven by source coordinator updates; the interval only picks up
+# sources that were (re)loaded after this coordinator subscribed
+_SOURCE_RECHECK_INTERVAL = timedelta(seconds=60)
+# Coalesce updates of both sources that arrive close together
+_SOURCE_UPDATE_COOLDOWN_S = 1.0
+
 
 class CombinedDeviceCoordinator(DataUpdateCoordinator[dict[str, Any]]):
     """Cache-only coordinator that aggregates data from two source entries."""
@@ -37,16 +45,69 @@ class CombinedDeviceCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         self._is_unloading = False
         self._daily_meters: CombinedDailyMeterPair | None = None
         self._daily_meters_loaded = False
+        # Source entry id -> (subscribed coordinator, unsubscribe callback)
+        self._source_listeners: dict[str, tuple[Any, CALLBACK_TYPE]] = {}
+        # (id(source data), candidates) -> (source data, key count, bound keys)
+        self._metric_bindings: dict[
+            tuple[int, tuple[str, ...]], tuple[Any, int, tuple[str, ...]]
+        ] = {}
+        # Metric key -> (input signature, value, metadata) of the last recompute
+        self._metric_cache: dict[str, tuple[tuple, Any, Any]] = {}
         super().__init__(
             hass,
             _LOGGER,
             name=f"Combined Coordinator {entry.data.get('combined_prefix', entry.entry_id)}",
-            update_interval=timedelta(seconds=5),
+            update_interval=_SOURCE_RECHECK_INTERVAL,
+            request_refresh_debouncer=Debouncer(
+                hass,
+                _LOGGER,
+                cooldown=_SOURCE_UPDATE_COOLDOWN_S,
+                immediate=True,
+            ),
         )
 
     def mark_as_unloading(self) -> None:
         """Stop future refresh processing during unload."""
         self._is_unloading = True
+        for _, remove_listener in self._source_listeners.values():
+            remove_listener()
+        self._source_listeners = {}
+
+    @callback
+    def _async_source_updated(self) -> None:
+        """Recompute after a source coordinator published new data."""
+        if not self._is_unloading:
+            self.hass.async_create_task(self.async_request_refresh())
+
+    def _ensure_source_listeners(self) -> None:
+        """Subscribe to both source coordinators (again after a source reload)."""
+        for source_entry_id in (
+            self.entry.data.get("source_entry_id_a"),
+            self.entry.data.get("source_entry_id_b"),
+        ):
+            if not source_entry_id:
+                continue
+            source_data = self.hass.data.get(DOMAIN, {}).get(source_entry_id)
+            source_coordinator = (
+                source_data.get("coordinator")
+                if isinstance(source_data, dict)
+                else None
+            )
+            subscribed = self._source_listeners.get(source_entry_id)
+            if subscribed is not None and subscribed[0] is source_coordinator:
+                continue
+            if subscribed is not None:
+                subscribed[1]()
+                del self._source_listeners[source_entry_id]
+                # Bindings may point at the replaced coordinator's data
+                self._metric_bindings = {}
+            if source_coordinator is not None and hasattr(
+                source_coordinator, "async_add_listener"
+            ):
+                self._source_listeners[source_entry_id] = (
+                    source_coordinator,
+                    source_coordinator.async_add_listener(self._async_source_updated),
+                )
 
     async def async_load_daily_meters(self) -> None:
         """Load persisted daily grid counters."""
@@ -58,10 +119,11 @@ class CombinedDeviceCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             await self._daily_meters.async_load()
             self._daily_meters_loaded = True
 
-    async def async_remove_daily_meters(self) -> None:
-        """Remove persisted daily counters for this combined entry."""
+    def unload_daily_meters(self) -> None:
+        """Hand the daily counters back to the shared store (kept for a reload)."""
         if self._daily_meters is not None:
-            await self._daily_meters.async_remove_entry()
+            self._daily_meters.unload()
+            self._daily_meters_loaded = False
 
     def _update_ihm_daily_meters(
         self, role_data: dict[str, dict[str, Any]]
@@ -113,13 +175,29 @@ class CombinedDeviceCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             "data": coordinator_data,
         }
 
-    @staticmethod
-    def _extract_metric_record(
-        source_data: dict[str, Any], metric_candidates: list[str]
-    ) -> dict[str, Any] | None:
-        """Extract first matching numeric metric and source metadata."""
-        for register_data in source_data.values():
-            if not isinstance(register_data, dict):
+    def _bound_register_keys(
+        self, source_data: dict[str, Any], metric_candidates: list[str]
+    ) -> tuple[str, ...]:
+        """Return source register keys whose unique_id ends with a candidate.
+
+        The binding is computed once per source cache generation: register
+        keys are only ever added, so the key count identifies the generation.
+        """
+        if not source_data:
+            return ()
+        binding_key = (id(source_data), tuple(metric_candidates))
+        binding = self._metric_bindings.get(binding_key)
+        if (
+            binding is not None
+            and binding[0] is source_data
+            and binding[1] == len(source_data)
+        ):
+            return binding[2]
+
+        suffixes = tuple(f"_{candidate}" for candidate in metric_candidates)
+        bound_keys = []
+        for register_key, register_data in source_data.items():
+            if not isinstance(register_data, Mapping):
                 continue
             register_config = register_data.get("register_config", {})
             if not isinstance(register_config, dict):
@@ -127,13 +205,25 @@ class CombinedDeviceCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             register_unique_id = (
                 str(register_config.get("unique_id", "")).strip().lower()
             )
-            if not register_unique_id:
-                continue
-            if not any(
-                register_unique_id.endswith(f"_{candidate}")
-                for candidate in metric_candidates
-            ):
-                continue
+            if register_unique_id and register_unique_id.endswith(suffixes):
+                bound_keys.append(register_key)
+        self._metric_bindings[binding_key] = (
+            source_data,
+            len(source_data),
+            tuple(bound_keys),
+        )
+        return tuple(bound_keys)
+
+    def _extract_metric_record(
+        self, source_data: dict[str, Any], metric_candidates: list[str]
+    ) -> dict[str, Any] | None:
+        """Extract first matching numeric metric and source metadata."""
+        for register_key in self._bound_register_keys(source_data, metric_candidates):
+            register_data = source_data[register_key]
+            register_config = register_data.get("register_config", {})
+            register_unique_id = (
+                str(register_config.get("unique_id", "")).strip().lower()
+            )
 
             value = register_data.get(
                 "numeric_value", register_data.get("processed_value")
@@ -494,28 +584,12 @@ class CombinedDeviceCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         }
         return combined_value, metadata
 
-    @staticmethod
     def _extract_boolean_value(
-        source_data: dict[str, Any], metric_candidates: list[str]
+        self, source_data: dict[str, Any], metric_candidates: list[str]
     ) -> bool | None:
         """Extract first matching boolean-like value from one source payload."""
-        for register_data in source_data.values():
-            if not isinstance(register_data, dict):
-                continue
-            register_config = register_data.get("register_config", {})
-            if not isinstance(register_config, dict):
-                continue
-            register_unique_id = (
-                str(register_config.get("unique_id", "")).strip().lower()
-            )
-            if not register_unique_id:
-                continue
-            if not any(
-                register_unique_id.endswith(f"_{candidate}")
-                for candidate in metric_candidates
-            ):
-                continue
-
+        for register_key in self._bound_register_keys(source_data, metric_candidates):
+            register_data = source_data[register_key]
             value = register_data.get("processed_value")
             if isinstance(value, bool):
                 return value
@@ -582,11 +656,126 @@ class CombinedDeviceCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             source_entry_id, metric_candidates
         )
 
+    def _metric_inputs_signature(
+        self,
+        metric_spec: dict[str, Any],
+        source_datas: tuple[dict[str, Any], ...],
+        daily_meter_values: dict[str, float | None],
+    ) -> tuple:
+        """Values of all source registers bound to a metric (and daily meters)."""
+        candidate_lists = [metric_spec.get("source_candidates", [])]
+        operands = metric_spec.get("operands")
+        if isinstance(operands, dict):
+            for operand_spec in operands.values():
+                if not isinstance(operand_spec, dict):
+                    continue
+                candidate_lists.append(operand_spec.get("candidates", []))
+                fallback = operand_spec.get("fallback")
+                if isinstance(fallback, dict):
+                    candidate_lists.append(fallback.get("candidates", []))
+
+        signature: list[Any] = []
+        for candidates in candidate_lists:
+            if not isinstance(candidates, list):
+                continue
+            candidate_list = [str(candidate) for candidate in candidates]
+            for source_data in source_datas:
+                for register_key in self._bound_register_keys(
+                    source_data, candidate_list
+                ):
+                    register_data = source_data[register_key]
+                    signature.append(
+                        (
+                            register_key,
+                            id(register_data.get("register_config")),
+                            register_data.get("processed_value"),
+                            register_data.get("numeric_value"),
+                        )
+                    )
+        if metric_spec.get("aggregation") in ("daily_meter", "formula"):
+            signature.append(tuple(sorted(daily_meter_values.items())))
+        return tuple(signature)
+
+    def _compute_metric(
+        self,
+        metric_spec: dict[str, Any],
+        role_data: dict[str, dict[str, Any]],
+        source_a_data: dict[str, Any],
+        source_b_data: dict[str, Any],
+        daily_meter_values: dict[str, float | None],
+    ) -> tuple[float | None, dict[str, Any] | None]:
+        """Compute one sensor metric from the source payloads."""
+        aggregation = str(metric_spec.get("aggregation", "sum"))
+        candidates = metric_spec.get("source_candidates", [])
+
+        combined_value: float | None = None
+        combined_meta: dict[str, Any] | None = None
+
+        if aggregation == "daily_meter":
+            meter_key = str(metric_spec.get("meter_key", "")).strip().lower()
+            if not meter_key or self._daily_meters is None:
+                return None, None
+            daily_value = daily_meter_values.get(meter_key)
+            if daily_value is None:
+                return None, None
+            precision = metric_spec.get("precision")
+            combined_value = float(daily_value)
+            if isinstance(precision, int):
+                combined_value = round(combined_value, precision)
+            combined_meta = self._daily_meters.metadata(meter_key)
+            combined_meta["unit_of_measurement"] = metric_spec.get(
+                "unit_of_measurement", "kWh"
+            )
+            combined_meta["device_class"] = metric_spec.get("device_class")
+            combined_meta["state_class"] = metric_spec.get("state_class")
+            combined_meta["precision"] = precision
+        elif aggregation == "formula":
+            combined_value, combined_meta = self._formula_metric(
+                role_data,
+                metric_spec,
+                daily_meter_values=daily_meter_values,
+            )
+        elif aggregation == "single":
+            source_role = str(metric_spec.get("source", "")).strip().lower()
+            if not source_role or not isinstance(candidates, list):
+                return None, None
+            combined_value, combined_meta = self._single_metric(
+                role_data,
+                source_role,
+                [str(candidate) for candidate in candidates],
+                metric_spec.get("unit_of_measurement"),
+            )
+        elif aggregation in {"sum", "avg", "max", "min"} and isinstance(
+            candidates, list
+        ):
+            source_role = metric_spec.get("source")
+            if source_role:
+                combined_value, combined_meta = self._single_metric(
+                    role_data,
+                    str(source_role),
+                    [str(candidate) for candidate in candidates],
+                    metric_spec.get("unit_of_measurement"),
+                )
+            else:
+                required_sources = str(metric_spec.get("required_sources", "both"))
+                combined_value, combined_meta = self._combine_metric(
+                    source_a_data=source_a_data,
+                    source_b_data=source_b_data,
+                    metric_candidates=[str(candidate) for candidate in candidates],
+                    aggregation=aggregation,
+                    required_sources=required_sources,
+                )
+        else:
+            return None, None
+
+        return combined_value, combined_meta
+
     async def _async_update_data(self) -> dict[str, Any]:
         """Aggregate source coordinator snapshots without additional Modbus I/O."""
         if self._is_unloading:
             return self.data or {}
 
+        self._ensure_source_listeners()
         source_a_id = self.entry.data.get("source_entry_id_a")
         source_b_id = self.entry.data.get("source_entry_id_b")
         source_a = self._source_payload(source_a_id)
@@ -616,73 +805,28 @@ class CombinedDeviceCoordinator(DataUpdateCoordinator[dict[str, Any]]):
                 daily_meter_values = self._update_ihm_daily_meters(role_data)
 
         if metric_specs:
+            source_datas = (source_a_data, source_b_data)
             for metric_key, metric_spec in metric_specs.items():
-                aggregation = str(metric_spec.get("aggregation", "sum"))
-                candidates = metric_spec.get("source_candidates", [])
-
-                combined_value: float | None = None
-                combined_meta: dict[str, Any] | None = None
-
-                if aggregation == "daily_meter":
-                    meter_key = str(metric_spec.get("meter_key", "")).strip().lower()
-                    if not meter_key or self._daily_meters is None:
-                        continue
-                    daily_value = daily_meter_values.get(meter_key)
-                    if daily_value is None:
-                        continue
-                    precision = metric_spec.get("precision")
-                    combined_value = float(daily_value)
-                    if isinstance(precision, int):
-                        combined_value = round(combined_value, precision)
-                    combined_meta = self._daily_meters.metadata(meter_key)
-                    combined_meta["unit_of_measurement"] = metric_spec.get(
-                        "unit_of_measurement", "kWh"
-                    )
-                    combined_meta["device_class"] = metric_spec.get("device_class")
-                    combined_meta["state_class"] = metric_spec.get("state_class")
-                    combined_meta["precision"] = precision
-                elif aggregation == "formula":
-                    combined_value, combined_meta = self._formula_metric(
-                        role_data,
+                signature = self._metric_inputs_signature(
+                    metric_spec, source_datas, daily_meter_values
+                )
+                cached = self._metric_cache.get(metric_key)
+                if cached is not None and cached[0] == signature:
+                    # Bound source registers unchanged: reuse the last result
+                    combined_value, combined_meta = cached[1], cached[2]
+                else:
+                    combined_value, combined_meta = self._compute_metric(
                         metric_spec,
-                        daily_meter_values=daily_meter_values,
-                    )
-                elif aggregation == "single":
-                    source_role = str(metric_spec.get("source", "")).strip().lower()
-                    if not source_role or not isinstance(candidates, list):
-                        continue
-                    combined_value, combined_meta = self._single_metric(
                         role_data,
-                        source_role,
-                        [str(candidate) for candidate in candidates],
-                        metric_spec.get("unit_of_measurement"),
+                        source_a_data,
+                        source_b_data,
+                        daily_meter_values,
+                    )
+                    self._metric_cache[metric_key] = (
+                        signature,
+                        combined_value,
+                        combined_meta,
                     )
-                elif aggregation in {"sum", "avg", "max", "min"} and isinstance(
-                    candidates, list
-                ):
-                    source_role = metric_spec.get("source")
-                    if source_role:
-                        combined_value, combined_meta = self._single_metric(
-                            role_data,
-                            str(source_role),
-                            [str(candidate) for candidate in candidates],
-                            metric_spec.get("unit_of_measurement"),
-                        )
-                    else:
-                        required_sources = str(
-                            metric_spec.get("required_sources", "both")
-                        )
-                        combined_value, combined_meta = self._combine_metric(
-                            source_a_data=source_a_data,
-                            source_b_data=source_b_data,
-                            metric_candidates=[
-                                str(candidate) for candidate in candidates
-                            ],
-                            aggregation=aggregation,
-                            required_sources=required_sources,
-                        )
-                else:
-                    continue
 
                 if combined_value is None:
                     continue
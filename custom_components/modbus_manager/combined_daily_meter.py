@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 from dataclasses import dataclass
 from datetime import datetime
 from typing import Any
@@ -17,6 +18,9 @@ _LOGGER = ModbusManagerLogger(__name__)
 
 STORAGE_VERSION = 1
 STORAGE_KEY = f"{DOMAIN}.combined_daily_meters"
+# Counters are flushed at most this often (plus on day rollover and shutdown)
+SAVE_DELAY_S = 300
+_SHARED_STORE_KEY = "combined_daily_meter_store"
 
 
 @dataclass
@@ -125,57 +129,130 @@ class _DailyEnergyMeter:
         return self._state.daily
 
 
+class _CombinedDailyMeterStore:
+    """Daily meter state of all combined entries, shared through hass.data.
+
+    The store file is read once per process; afterwards the in-memory state is
+    authoritative. Updates schedule one delayed save (at most every
+    ``SAVE_DELAY_S``), a day rollover saves right away, and pending data is
+    written by the Store's final-write listener when Home Assistant stops.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        self._store = Store(hass, STORAGE_VERSION, STORAGE_KEY)
+        self._load_lock = asyncio.Lock()
+        self._loaded = False
+        self._save_pending = False
+        # Persisted state of entries without a loaded pair
+        self._entries: dict[str, Any] = {}
+        self._pairs: dict[str, CombinedDailyMeterPair] = {}
+
+    @classmethod
+    def get(cls, hass: HomeAssistant) -> _CombinedDailyMeterStore:
+        """Return the store shared by all combined entries."""
+        domain_data = hass.data.setdefault(DOMAIN, {})
+        store = domain_data.get(_SHARED_STORE_KEY)
+        if store is None:
+            store = cls(hass)
+            domain_data[_SHARED_STORE_KEY] = store
+        return store
+
+    async def async_load(self) -> None:
+        """Read the store file (once)."""
+        async with self._load_lock:
+            if self._loaded:
+                return
+            stored = await self._store.async_load() or {}
+            entries = stored.get("entries", {})
+            self._entries = dict(entries) if isinstance(entries, dict) else {}
+            self._loaded = True
+
+    def attach(self, entry_id: str, pair: CombinedDailyMeterPair) -> dict[str, Any]:
+        """Register a loaded pair and return its current state.
+
+        A pair that is still attached for the entry (reload without unload)
+        hands over its live state instead of the state read from the file.
+        """
+        previous = self._pairs.get(entry_id)
+        if previous is not None and previous is not pair:
+            self._entries[entry_id] = previous.export()
+        self._pairs[entry_id] = pair
+        entry_state = self._entries.get(entry_id, {})
+        return entry_state if isinstance(entry_state, dict) else {}
+
+    def detach(self, entry_id: str, pair: CombinedDailyMeterPair) -> None:
+        """Keep an unloaded pair's state in memory for the next attach."""
+        if self._pairs.get(entry_id) is not pair:
+            return
+        self._entries[entry_id] = pair.export()
+        del self._pairs[entry_id]
+
+    @callback
+    def async_schedule_save(self, delay: float = SAVE_DELAY_S) -> None:
+        """Save after delay; an already pending save is not postponed."""
+        if self._save_pending and delay > 0:
+            return
+        self._save_pending = True
+        self._store.async_delay_save(self._data_to_save, delay)
+
+    @callback
+    def _data_to_save(self) -> dict[str, Any]:
+        self._save_pending = False
+        entries = dict(self._entries)
+        for entry_id, pair in self._pairs.items():
+            entries[entry_id] = pair.export()
+        return {"entries": entries}
+
+    async def async_remove_entry(self, entry_id: str) -> None:
+        """Drop an entry's state and persist the removal."""
+        await self.async_load()
+        if entry_id not in self._entries and entry_id not in self._pairs:
+            return
+        self._entries.pop(entry_id, None)
+        self._pairs.pop(entry_id, None)
+        await self._store.async_save(self._data_to_save())
+
+
+async def async_remove_combined_daily_meters(
+    hass: HomeAssistant, entry_id: str
+) -> None:
+    """Remove persisted daily meters of a deleted combined config entry."""
+    await _CombinedDailyMeterStore.get(hass).async_remove_entry(entry_id)
+
+
 class CombinedDailyMeterPair:
     """Import/export daily meters for one combined config entry."""
 
     def __init__(self, hass: HomeAssistant, entry_id: str) -> None:
         self._hass = hass
         self._entry_id = entry_id
-        self._store = Store(hass, STORAGE_VERSION, STORAGE_KEY)
+        self._store = _CombinedDailyMeterStore.get(hass)
         self._import_meter = _DailyEnergyMeter("import")
         self._export_meter = _DailyEnergyMeter("export")
         self._loaded = False
-        self._dirty = False
 
     async def async_load(self) -> None:
         """Load persisted counters for this combined entry."""
         if self._loaded:
             return
-        stored = await self._store.async_load() or {}
-        entries = stored.get("entries", {})
-        entry_state = entries.get(self._entry_id, {})
-        if isinstance(entry_state, dict):
-            self._import_meter.load(entry_state.get("import"))
-            self._export_meter.load(entry_state.get("export"))
+        await self._store.async_load()
+        entry_state = self._store.attach(self._entry_id, self)
+        self._import_meter.load(entry_state.get("import"))
+        self._export_meter.load(entry_state.get("export"))
         self._loaded = True
 
-    @callback
-    def async_schedule_save(self) -> None:
-        """Persist counters when state changed."""
-        if not self._dirty:
-            return
-        self._dirty = False
-        self._hass.async_create_task(self._async_save())
-
-    async def _async_save(self) -> None:
-        stored = await self._store.async_load() or {}
-        entries = stored.get("entries", {})
-        if not isinstance(entries, dict):
-            entries = {}
-        entries[self._entry_id] = {
+    def export(self) -> dict[str, Any]:
+        """Serialize both meters for persistence."""
+        return {
             "import": self._import_meter.export(),
             "export": self._export_meter.export(),
         }
-        await self._store.async_save({"entries": entries})
 
-    async def async_remove_entry(self) -> None:
-        """Remove persisted state for this combined entry."""
-        stored = await self._store.async_load() or {}
-        entries = stored.get("entries", {})
-        if isinstance(entries, dict) and self._entry_id in entries:
-            entries = dict(entries)
-            del entries[self._entry_id]
-            await self._store.async_save({"entries": entries})
+    def unload(self) -> None:
+        """Detach from the shared store; the state is kept for a reload."""
+        if self._loaded:
+            self._store.detach(self._entry_id, self)
+            self._loaded = False
 
     def update(
         self,
@@ -189,20 +266,26 @@ class CombinedDailyMeterPair:
         timestamp = now or dt_util.now()
         import_daily: float | None = None
         export_daily: float | None = None
+        previous = self.export()
 
         if import_total is not None:
             import_daily = self._import_meter.update(
                 import_total, timestamp, import_unique_id
             )
-            self._dirty = True
         if export_total is not None:
             export_daily = self._export_meter.update(
                 export_total, timestamp, export_unique_id
             )
-            self._dirty = True
 
-        if self._dirty:
-            self.async_schedule_save()
+        current = self.export()
+        if current != previous:
+            day_changed = any(
+                previous[meter_key]["day"]
+                and previous[meter_key]["day"] != current[meter_key]["day"]
+                for meter_key in ("import", "export")
+            )
+            # Keep the finished day's totals even if HA stops uncleanly later
+            self._store.async_schedule_save(0 if day_changed else SAVE_DELAY_S)
 
         return {
             "import": import_daily,
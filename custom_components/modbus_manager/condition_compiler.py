@@ -0,0 +1,212 @@
+"""Compiled template conditions ("phases == 3 and (a == 1 or b in [x, y])")."""
+
+from __future__ import annotations
+
+from functools import lru_cache
+from typing import Any, Callable, List, Tuple
+
+from .logger import ModbusManagerLogger
+
+_LOGGER = ModbusManagerLogger(__name__)
+
+ConditionEvaluator = Callable[[dict], bool]
+
+
+def evaluate_condition(condition: str, dynamic_config: dict) -> bool:
+    """Evaluate a condition against dynamic_config (compiled once per string)."""
+    return compile_condition(condition)(dynamic_config)
+
+
+@lru_cache(maxsize=2048)
+def compile_condition(condition: str) -> ConditionEvaluator:
+    """Parse a condition into a tree of closures.
+
+    Supports nested ``and``/``or`` with parentheses (``or`` binds weaker) and
+    the single conditions of ``_compile_single_condition``.
+    """
+    condition = _strip_outer_parentheses(condition.strip())
+
+    # Find the operator with lowest precedence (outside parentheses):
+    # the last " or ", else the first " and "
+    depth = 0
+    or_pos = -1
+    and_pos = -1
+    for i, char in enumerate(condition):
+        if char == "(":
+            depth += 1
+        elif char == ")":
+            depth -= 1
+        elif depth == 0:
+            if condition[i : i + 4] == " or ":
+                or_pos = i
+            elif condition[i : i + 5] == " and " and and_pos == -1:
+                and_pos = i
+
+    if or_pos != -1:
+        left = compile_condition(condition[:or_pos].strip())
+        right = compile_condition(condition[or_pos + 4 :].strip())
+        return lambda dynamic_config: left(dynamic_config) or right(dynamic_config)
+    if and_pos != -1:
+        left = compile_condition(condition[:and_pos].strip())
+        right = compile_condition(condition[and_pos + 5 :].strip())
+        return lambda dynamic_config: left(dynamic_config) and right(dynamic_config)
+    return _compile_single_condition(condition)
+
+
+def _strip_outer_parentheses(condition: str) -> str:
+    """Remove parentheses that enclose the whole condition."""
+    while condition.startswith("(") and condition.endswith(")"):
+        depth = 0
+        for i, char in enumerate(condition):
+            if char == "(":
+                depth += 1
+            elif char == ")":
+                depth -= 1
+                if depth == 0 and i < len(condition) - 1:
+                    return condition
+        condition = condition[1:-1].strip()
+    return condition
+
+
+def _split_operands(condition: str, separator: str) -> Tuple[str, str] | None:
+    parts = condition.split(separator)
+    if len(parts) != 2:
+        return None
+    return parts[0].strip(), parts[1].strip()
+
+
+def _parse_value_list(values: str) -> List[str]:
+    if values.startswith("[") and values.endswith("]"):
+        values = values[1:-1]
+    return [value.strip().strip("'\"") for value in values.split(",") if value.strip()]
+
+
+def _compile_membership(
+    condition: str, variable_name: str, values: str, negate: bool
+) -> ConditionEvaluator:
+    required_values = _parse_value_list(values)
+
+    def evaluate(dynamic_config: dict) -> bool:
+        actual_value = dynamic_config.get(variable_name)
+        if isinstance(actual_value, (list, tuple, set)):
+            actual_values = {str(value) for value in actual_value}
+            result = any(value in actual_values for value in required_values)
+        else:
+            result = str(actual_value) in required_values
+        if negate:
+            result = not result
+        _LOGGER.debug(
+            "Evaluating condition '%s': variable=%s, required=%s, actual=%s, result=%s",
+            condition,
+            variable_name,
+            required_values,
+            actual_value,
+            result,
+        )
+        return result
+
+    return evaluate
+
+
+def _compile_equality(
+    condition: str, variable_name: str, value: str, negate: bool
+) -> ConditionEvaluator:
+    required_value_str = value.strip("'\"")
+    is_bool = required_value_str.lower() in ("true", "false")
+    required_bool = required_value_str.lower() == "true"
+    try:
+        required_int: int | None = int(required_value_str)
+    except ValueError:
+        required_int = None
+
+    def evaluate(dynamic_config: dict) -> bool:
+        actual_value = dynamic_config.get(variable_name)
+        required_value: Any
+        if is_bool:
+            required_value = required_bool
+            actual_value = bool(actual_value) if actual_value is not None else False
+        else:
+            try:
+                if required_int is None:
+                    raise ValueError(required_value_str)
+                required_value = required_int
+                actual_value = int(actual_value) if actual_value is not None else 0
+            except (ValueError, TypeError):
+                required_value = required_value_str
+                actual_value = str(actual_value) if actual_value is not None else ""
+        result = (
+            (actual_value != required_value)
+            if negate
+            else (actual_value == required_value)
+        )
+        _LOGGER.debug(
+            "Evaluating condition '%s': variable=%s, required=%s, actual=%s, result=%s",
+            condition,
+            variable_name,
+            required_value,
+            actual_value,
+            result,
+        )
+        return result
+
+    return evaluate
+
+
+def _compile_greater(
+    variable_name: str, value: str, or_equal: bool
+) -> ConditionEvaluator:
+    try:
+        required_value = int(value)
+    except ValueError:
+        return lambda dynamic_config: False
+
+    def evaluate(dynamic_config: dict) -> bool:
+        actual_value = dynamic_config.get(variable_name, 0)
+        if isinstance(actual_value, str):
+            try:
+                actual_value = int(actual_value)
+            except ValueError:
+                return False
+        if or_equal:
+            return actual_value >= required_value
+        return actual_value > required_value
+
+    return evaluate
+
+
+def _compile_single_condition(condition: str) -> ConditionEvaluator:
+    """Compile a single condition (without and/or).
+
+    Supports:
+    - "variable == value" / "variable != value" (string, int, bool)
+    - "variable >= value" / "variable > value" (int)
+    - "variable in [value1, value2]" / "variable not in [...]" (string list)
+    """
+    if " not in " in condition:
+        operands = _split_operands(condition, " not in ")
+        if operands:
+            return _compile_membership(condition, *operands, negate=True)
+    elif " in " in condition:
+        operands = _split_operands(condition, " in ")
+        if operands:
+            return _compile_membership(condition, *operands, negate=False)
+    elif "!=" in condition:
+        operands = _split_operands(condition, "!=")
+        if operands:
+            return _compile_equality(condition, *operands, negate=True)
+    elif "==" in condition:
+        operands = _split_operands(condition, "==")
+        if operands:
+            return _compile_equality(condition, *operands, negate=False)
+    elif ">=" in condition:
+        operands = _split_operands(condition, ">=")
+        if operands:
+            return _compile_greater(*operands, or_equal=True)
+    elif ">" in condition:
+        operands = _split_operands(condition, ">")
+        if operands:
+            return _compile_greater(*operands, or_equal=False)
+
+    # Unknown condition format - include the entity to be safe
+    _LOGGER.warning("Unknown condition format '%s', including sensor", condition)
+    return lambda dynamic_config: True
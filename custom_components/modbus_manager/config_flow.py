@@ -16,6 +16,7 @@ from homeassistant.helpers import device_registry as dr
 from homeassistant.helpers import entity_registry as er
 
 from .combined_specs import resolve_combination_type
+from .condition_compiler import evaluate_condition
 from .const import (
     CONF_ENTRY_TYPE,
     DEFAULT_DELAY,
@@ -55,10 +56,14 @@ from .device_utils import (
     resolve_device_role_type,
     resolve_firmware_profile_version,
 )
+from .io_queue import DEFAULT_SLAVE_TURNAROUND_S
 from .logger import ModbusManagerLogger
+from .phase_planner import PHASE_STRATEGIES, PHASE_STRATEGY_ALIGN
+from .pipelined_transport import DEFAULT_MAX_IN_FLIGHT
+from .register_optimizer import READ_STRATEGY_COST, READ_STRATEGY_GREEDY
 from .template_loader import (
-    _evaluate_condition,
     get_template_by_name,
+    get_template_index,
     get_template_names,
     resolve_template_key,
     set_hass_instance,
@@ -172,6 +177,99 @@ def _clamp_battery_config_for_connection(
     return value
 
 
+# Read transports of a Modbus TCP hub (see pipelined_transport.py)
+TRANSPORT_HUB = "hub"
+TRANSPORT_PIPELINED = "pipelined"
+MAX_IN_FLIGHT_LIMIT = 16
+# Optional per-device read planner overrides; cleared fields use the template
+_DEVICE_READ_PLANNER_FIELDS = ("max_gap", "read_strategy", "max_read_size")
+
+
+def _hub_scheduling_schema(entry_data: dict[str, Any]) -> dict[Any, Any]:
+    """Options-flow fields for transport, phase planning and slave turnaround."""
+    fields: dict[Any, Any] = {}
+    modbus_type = entry_data.get("modbus_type") or entry_data.get("type", "tcp")
+    if modbus_type == "tcp":
+        fields[
+            vol.Required(
+                "transport",
+                default=str(entry_data.get("transport") or TRANSPORT_HUB).lower(),
+            )
+        ] = vol.In([TRANSPORT_HUB, TRANSPORT_PIPELINED])
+        fields[
+            vol.Required(
+                "max_in_flight",
+                default=entry_data.get("max_in_flight", DEFAULT_MAX_IN_FLIGHT),
+            )
+        ] = vol.All(vol.Coerce(int), vol.Range(min=1, max=MAX_IN_FLIGHT_LIMIT))
+    fields[
+        vol.Required(
+            "phase_strategy",
+            default=entry_data.get("phase_strategy") or PHASE_STRATEGY_ALIGN,
+        )
+    ] = vol.In(list(PHASE_STRATEGIES))
+    fields[
+        vol.Required(
+            "slave_turnaround_milliseconds",
+            default=entry_data.get(
+                "slave_turnaround_milliseconds",
+                int(DEFAULT_SLAVE_TURNAROUND_S * 1000),
+            ),
+        )
+    ] = vol.All(vol.Coerce(int), vol.Range(min=0))
+    return fields
+
+
+def _device_read_planner_schema(device: dict[str, Any]) -> dict[Any, Any]:
+    """Optional read planner overrides for one device (empty = template default)."""
+    fields: dict[Any, Any] = {}
+    for field_name, validator in (
+        ("max_gap", vol.All(vol.Coerce(int), vol.Range(min=0))),
+        ("read_strategy", vol.In([READ_STRATEGY_GREEDY, READ_STRATEGY_COST])),
+        ("max_read_size", str),
+    ):
+        current = device.get(field_name)
+        description = (
+            {
+                "suggested_value": str(current)
+                if field_name == "max_read_size"
+                else current
+            }
+            if current is not None
+            else None
+        )
+        fields[vol.Optional(field_name, description=description)] = validator
+    return fields
+
+
+def _parse_max_read_size(value: Any) -> str | int:
+    """Validate a device max_read_size: ``auto`` or 1-125 registers."""
+    text = str(value).strip().lower()
+    if text == "auto":
+        return text
+    size = int(text)
+    if not 1 <= size <= 125:
+        raise ValueError(f"max_read_size {size} out of range")
+    return size
+
+
+def _apply_device_read_planner_input(
+    device: dict[str, Any], user_input: dict[str, Any]
+) -> None:
+    """Store read planner overrides from a form; missing fields are removed.
+
+    Raises ValueError for an invalid max_read_size.
+    """
+    for field_name in _DEVICE_READ_PLANNER_FIELDS:
+        value = user_input.get(field_name)
+        if value is None or (isinstance(value, str) and not value.strip()):
+            device.pop(field_name, None)
+        elif field_name == "max_read_size":
+            device[field_name] = _parse_max_read_size(value)
+        else:
+            device[field_name] = value
+
+
 # Hub-level keys copied onto per-device records when missing (legacy setups).
 _ENTRY_LEVEL_DEVICE_FIELD_FALLBACKS = (
     "connection_type",
@@ -920,7 +1018,7 @@ class ModbusManagerConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                     if isinstance(battery_config_def, dict)
                     else None
                 )
-                if condition and not _evaluate_condition(condition, combined_input):
+                if condition and not evaluate_condition(condition, combined_input):
                     _LOGGER.info(
                         "Skipping battery flow: condition '%s' not met (connection_type=%s)",
                         condition,
@@ -1746,7 +1844,7 @@ class ModbusManagerConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         # Check condition filter
         condition = sensor.get("condition")
         if condition:
-            if not _evaluate_condition(condition, dynamic_config):
+            if not evaluate_condition(condition, dynamic_config):
                 _LOGGER.debug(
                     "Excluding sensor due to condition '%s': %s (unique_id: %s)",
                     condition,
@@ -1810,149 +1908,6 @@ class ModbusManagerConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         # All other sensors are included
         return True
 
-    def _evaluate_single_condition(self, condition: str, dynamic_config: dict) -> bool:
-        """Evaluate a single condition (no AND/OR).
-
-        Supports:
-        - "variable == value" (string, int, bool)
-        - "variable != value" (string, int, bool)
-        - "variable >= value" (int)
-        - "variable in [value1, value2]" (string list)
-        - "variable not in [value1, value2]" (string list)
-        """
-        condition = condition.strip()
-
-        if " not in " in condition:
-            try:
-                parts = condition.split(" not in ")
-                if len(parts) == 2:
-                    variable_name = parts[0].strip()
-                    required_values_str = parts[1].strip()
-
-                    actual_value = dynamic_config.get(variable_name)
-
-                    if required_values_str.startswith(
-                        "["
-                    ) and required_values_str.endswith("]"):
-                        required_values_str = required_values_str[1:-1]
-                    required_values = [
-                        value.strip().strip("'\"")
-                        for value in required_values_str.split(",")
-                        if value.strip()
-                    ]
-
-                    if isinstance(actual_value, (list, tuple, set)):
-                        actual_values = {str(value) for value in actual_value}
-                        return not any(
-                            value in actual_values for value in required_values
-                        )
-                    return str(actual_value) not in required_values
-            except (ValueError, IndexError):
-                return False
-        elif " in " in condition:
-            try:
-                parts = condition.split(" in ")
-                if len(parts) == 2:
-                    variable_name = parts[0].strip()
-                    required_values_str = parts[1].strip()
-
-                    actual_value = dynamic_config.get(variable_name)
-
-                    if required_values_str.startswith(
-                        "["
-                    ) and required_values_str.endswith("]"):
-                        required_values_str = required_values_str[1:-1]
-                    required_values = [
-                        value.strip().strip("'\"")
-                        for value in required_values_str.split(",")
-                        if value.strip()
-                    ]
-
-                    if isinstance(actual_value, (list, tuple, set)):
-                        actual_values = {str(value) for value in actual_value}
-                        return any(value in actual_values for value in required_values)
-                    return str(actual_value) in required_values
-            except (ValueError, IndexError):
-                return False
-        elif "!=" in condition:
-            try:
-                parts = condition.split("!=")
-                if len(parts) == 2:
-                    variable_name = parts[0].strip()
-                    required_value_str = parts[1].strip().strip("'\"")
-
-                    actual_value = dynamic_config.get(variable_name)
-
-                    if required_value_str.lower() in ["true", "false"]:
-                        required_value = required_value_str.lower() == "true"
-                        actual_value = (
-                            bool(actual_value) if actual_value is not None else False
-                        )
-                    else:
-                        try:
-                            required_value = int(required_value_str)
-                            actual_value = (
-                                int(actual_value) if actual_value is not None else 0
-                            )
-                        except (ValueError, TypeError):
-                            required_value = required_value_str
-                            actual_value = (
-                                str(actual_value) if actual_value is not None else ""
-                            )
-
-                    return actual_value != required_value
-            except (ValueError, IndexError):
-                return False
-        elif "==" in condition:
-            try:
-                parts = condition.split("==")
-                if len(parts) == 2:
-                    variable_name = parts[0].strip()
-                    required_value_str = parts[1].strip().strip("'\"")
-
-                    actual_value = dynamic_config.get(variable_name)
-
-                    if required_value_str.lower() in ["true", "false"]:
-                        required_value = required_value_str.lower() == "true"
-                        actual_value = (
-                            bool(actual_value) if actual_value is not None else False
-                        )
-                    else:
-                        try:
-                            required_value = int(required_value_str)
-                            actual_value = (
-                                int(actual_value) if actual_value is not None else 0
-                            )
-                        except (ValueError, TypeError):
-                            required_value = required_value_str
-                            actual_value = (
-                                str(actual_value) if actual_value is not None else ""
-                            )
-
-                    return actual_value == required_value
-            except (ValueError, IndexError):
-                return False
-        elif ">=" in condition:
-            try:
-                parts = condition.split(">=")
-                if len(parts) == 2:
-                    variable_name = parts[0].strip()
-                    required_value_str = parts[1].strip()
-
-                    try:
-                        required_value = int(required_value_str)
-                        actual_value = dynamic_config.get(variable_name, 0)
-                        if isinstance(actual_value, str):
-                            actual_value = int(actual_value)
-                        return actual_value >= required_value
-                    except ValueError:
-                        return False
-            except (ValueError, IndexError):
-                return False
-
-        return True
-
-    # REGEX FUNCTIONS
     def _extract_mppt_number(self, search_text: str) -> int:
         """Extract MPPT number from sensor name or unique_id."""
         import re
@@ -2151,7 +2106,7 @@ class ModbusManagerConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 
         # Get available battery templates
         battery_templates = {}
-        template_names = await get_template_names()
+        template_index = await get_template_index()
         # Read connection_type from inverter_config; fallback to flow context
         # (context persists when flow is serialized between steps, _inverter_config may not)
         connection_type = "LAN"
@@ -2176,30 +2131,27 @@ class ModbusManagerConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         )
 
         filtered_out_notes = []
-        for template_name in template_names:
-            template_data = await get_template_by_name(template_name)
-            if template_data and isinstance(template_data, dict):
-                template_type = template_data.get("type", "")
-                if template_type == "battery":
-                    # Filter by requires_connection_type (string or list; e.g. SBR needs LAN/RS485)
-                    required_conn = template_data.get("requires_connection_type")
-                    if required_conn and not connection_type_allowed(
-                        connection_type_norm, required_conn
-                    ):
-                        _LOGGER.info(
-                            "Excluding battery template %s: requires connection %s, current is %s",
-                            template_name,
-                            required_conn,
-                            connection_type,
-                        )
-                        note = template_data.get("config_flow_note", "")
-                        if note:
-                            filtered_out_notes.append(f"{template_name}: {note}")
-                        continue
-                    display_name = (
-                        template_data.get("display_name") or ""
-                    ).strip() or template_name
-                    battery_templates[template_name] = display_name
+        for template_name, template_data in template_index.items():
+            if template_data.get("type", "") == "battery":
+                # Filter by requires_connection_type (string or list; e.g. SBR needs LAN/RS485)
+                required_conn = template_data.get("requires_connection_type")
+                if required_conn and not connection_type_allowed(
+                    connection_type_norm, required_conn
+                ):
+                    _LOGGER.info(
+                        "Excluding battery template %s: requires connection %s, current is %s",
+                        template_name,
+                        required_conn,
+                        connection_type,
+                    )
+                    note = template_data.get("config_flow_note", "")
+                    if note:
+                        filtered_out_notes.append(f"{template_name}: {note}")
+                    continue
+                display_name = (
+                    template_data.get("display_name") or ""
+                ).strip() or template_name
+                battery_templates[template_name] = display_name
 
         config_flow_note = ""
         if filtered_out_notes:
@@ -3311,7 +3263,7 @@ class ModbusManagerDeviceSubentryFlow(config_entries.ConfigSubentryFlow):
     @staticmethod
     async def _get_template_defaults(template_name: str) -> tuple[str, int]:
         """Return default prefix/slave_id for a template."""
-        template_data = await get_template_by_name(template_name)
+        template_data = (await get_template_index()).get(template_name)
         if not isinstance(template_data, dict):
             return "device", 1
         return (
@@ -3347,11 +3299,13 @@ class ModbusManagerDeviceSubentryFlow(config_entries.ConfigSubentryFlow):
         self._add_form_slave_default = slave_id_default
 
         template_data = await get_template_by_name(selected_template)
-        dynamic_config = (
-            template_data.get("dynamic_config", {})
-            if isinstance(template_data, dict)
-            else {}
-        )
+        if not isinstance(template_data, dict):
+            # Listed from its header, but the template failed to load
+            return self.async_abort(
+                reason="template_not_found",
+                description_placeholders={"template_name": selected_template},
+            )
+        dynamic_config = template_data.get("dynamic_config", {})
 
         schema_fields: dict[Any, Any] = {
             vol.Required("prefix", default=prefix_default): str,
@@ -3398,19 +3352,15 @@ class ModbusManagerDeviceSubentryFlow(config_entries.ConfigSubentryFlow):
 
     async def _show_add_template_select_form(self) -> FlowResult:
         """Render first add-device step with template selection only."""
-        template_names = sorted(await get_template_names())
+        template_index = await get_template_index()
+        template_names = sorted(template_index)
         if not template_names:
             return self.async_abort(reason="no_templates")
 
-        template_choices = {}
-        for tn in template_names:
-            td = await get_template_by_name(tn)
-            label = (
-                (td.get("display_name") or "").strip() or tn
-                if isinstance(td, dict)
-                else tn
-            )
-            template_choices[tn] = label
+        template_choices = {
+            tn: (template_index[tn].get("display_name") or "").strip() or tn
+            for tn in template_names
+        }
 
         default_template = template_names[0]
         self._add_form_template_name = None
@@ -3791,6 +3741,7 @@ class ModbusManagerDeviceSubentryFlow(config_entries.ConfigSubentryFlow):
             if isinstance(template_data, dict)
             else {}
         )
+        errors: dict[str, str] = {}
 
         if user_input is not None:
             new_prefix = str(
@@ -3822,7 +3773,12 @@ class ModbusManagerDeviceSubentryFlow(config_entries.ConfigSubentryFlow):
                 updated_device.get("battery_config"),
                 updated_device.get("connection_type"),
             )
+            try:
+                _apply_device_read_planner_input(updated_device, user_input)
+            except ValueError:
+                errors["max_read_size"] = "invalid_max_read_size"
 
+        if user_input is not None and not errors:
             updated_device = self._normalize_device_record(updated_device)
             new_device_id = updated_device.get("device_entry_id")
 
@@ -3986,10 +3942,12 @@ class ModbusManagerDeviceSubentryFlow(config_entries.ConfigSubentryFlow):
                     schema_fields[vol.Optional(field_name, default=current)] = float
                 else:
                     schema_fields[vol.Optional(field_name, default=str(current))] = str
+        schema_fields.update(_device_read_planner_schema(selected_device))
 
         return self.async_show_form(
             step_id="reconfigure",
             data_schema=vol.Schema(schema_fields),
+            errors=errors,
             description_placeholders={
                 "device": self._build_subentry_title(selected_device),
             },
@@ -4143,6 +4101,14 @@ class ModbusManagerOptionsFlow(config_entries.OptionsFlow):
                         )
                     ),
                 )
+                for field_name in (
+                    "transport",
+                    "max_in_flight",
+                    "phase_strategy",
+                    "slave_turnaround_milliseconds",
+                ):
+                    if field_name in user_input:
+                        new_data[field_name] = user_input[field_name]
                 new_data["host"] = new_host
                 new_data["port"] = new_port
                 hub_config = new_data.get("hub")
@@ -4205,6 +4171,7 @@ class ModbusManagerOptionsFlow(config_entries.OptionsFlow):
                 default=_entry_post_write_settle_ms(self.config_entry.data),
             ): int,
         }
+        schema_fields.update(_hub_scheduling_schema(self.config_entry.data))
 
         return self.async_show_form(
             step_id="init",
@@ -4647,25 +4614,23 @@ class ModbusManagerOptionsFlow(config_entries.OptionsFlow):
             return await self.async_step_battery_config()
 
         battery_templates_dict = {}
-        template_names = await get_template_names()
+        template_index = await get_template_index()
         connection_type = self.config_entry.data.get("connection_type", "LAN")
         connection_type_norm = (
             str(connection_type).strip().upper() if connection_type else "LAN"
         )
-        for template_name in template_names:
-            template_data = await get_template_by_name(template_name)
-            if template_data and isinstance(template_data, dict):
-                if template_data.get("type", "") == "battery":
-                    # Filter by requires_connection_type (string or list; e.g. SBR needs LAN/RS485)
-                    required_conn = template_data.get("requires_connection_type")
-                    if required_conn and not connection_type_allowed(
-                        connection_type_norm, required_conn
-                    ):
-                        continue
-                    display_name = (
-                        template_data.get("display_name") or ""
-                    ).strip() or template_name
-                    battery_templates_dict[template_name] = display_name
+        for template_name, template_data in template_index.items():
+            if template_data.get("type", "") == "battery":
+                # Filter by requires_connection_type (string or list; e.g. SBR needs LAN/RS485)
+                required_conn = template_data.get("requires_connection_type")
+                if required_conn and not connection_type_allowed(
+                    connection_type_norm, required_conn
+                ):
+                    continue
+                display_name = (
+                    template_data.get("display_name") or ""
+                ).strip() or template_name
+                battery_templates_dict[template_name] = display_name
 
         # Sort battery templates alphabetically by display name for better UX
         sorted_battery_templates = dict(
@@ -4841,7 +4806,7 @@ class ModbusManagerOptionsFlow(config_entries.OptionsFlow):
                 )
                 effective_data = {**self.config_entry.data, **user_input}
                 user_input = dict(user_input)
-                if condition and not _evaluate_condition(condition, effective_data):
+                if condition and not evaluate_condition(condition, effective_data):
                     user_input["battery_config"] = "none"
                     user_input["battery_template"] = "none"
                     _LOGGER.info(
@@ -5435,7 +5400,7 @@ class ModbusManagerOptionsFlow(config_entries.OptionsFlow):
         # Check condition filter
         condition = sensor.get("condition")
         if condition:
-            if not _evaluate_condition(condition, dynamic_config):
+            if not evaluate_condition(condition, dynamic_config):
                 _LOGGER.debug(
                     "Excluding sensor due to condition '%s': %s (unique_id: %s)",
                     condition,
@@ -5499,147 +5464,6 @@ class ModbusManagerOptionsFlow(config_entries.OptionsFlow):
         # All other sensors are included
         return True
 
-    def _evaluate_single_condition(self, condition: str, dynamic_config: dict) -> bool:
-        """Evaluate a single condition (no AND/OR).
-
-        Supports:
-        - "variable == value" (string, int, bool)
-        - "variable != value" (string, int, bool)
-        - "variable >= value" (int)
-        """
-        condition = condition.strip()
-
-        if " not in " in condition:
-            try:
-                parts = condition.split(" not in ")
-                if len(parts) == 2:
-                    variable_name = parts[0].strip()
-                    required_values_str = parts[1].strip()
-
-                    actual_value = dynamic_config.get(variable_name)
-
-                    if required_values_str.startswith(
-                        "["
-                    ) and required_values_str.endswith("]"):
-                        required_values_str = required_values_str[1:-1]
-                    required_values = [
-                        value.strip().strip("'\"")
-                        for value in required_values_str.split(",")
-                        if value.strip()
-                    ]
-
-                    if isinstance(actual_value, (list, tuple, set)):
-                        actual_values = {str(value) for value in actual_value}
-                        return not any(
-                            value in actual_values for value in required_values
-                        )
-                    return str(actual_value) not in required_values
-            except (ValueError, IndexError):
-                return False
-        elif " in " in condition:
-            try:
-                parts = condition.split(" in ")
-                if len(parts) == 2:
-                    variable_name = parts[0].strip()
-                    required_values_str = parts[1].strip()
-
-                    actual_value = dynamic_config.get(variable_name)
-
-                    if required_values_str.startswith(
-                        "["
-                    ) and required_values_str.endswith("]"):
-                        required_values_str = required_values_str[1:-1]
-                    required_values = [
-                        value.strip().strip("'\"")
-                        for value in required_values_str.split(",")
-                        if value.strip()
-                    ]
-
-                    if isinstance(actual_value, (list, tuple, set)):
-                        actual_values = {str(value) for value in actual_value}
-                        return any(value in actual_values for value in required_values)
-                    return str(actual_value) in required_values
-            except (ValueError, IndexError):
-                return False
-        elif "!=" in condition:
-            try:
-                parts = condition.split("!=")
-                if len(parts) == 2:
-                    variable_name = parts[0].strip()
-                    required_value_str = parts[1].strip().strip("'\"")
-
-                    actual_value = dynamic_config.get(variable_name)
-
-                    if required_value_str.lower() in ["true", "false"]:
-                        required_value = required_value_str.lower() == "true"
-                        actual_value = (
-                            bool(actual_value) if actual_value is not None else False
-                        )
-                    else:
-                        try:
-                            required_value = int(required_value_str)
-                            actual_value = (
-                                int(actual_value) if actual_value is not None else 0
-                            )
-                        except (ValueError, TypeError):
-                            required_value = required_value_str
-                            actual_value = (
-                                str(actual_value) if actual_value is not None else ""
-                            )
-
-                    return actual_value != required_value
-            except (ValueError, IndexError):
-                return False
-        elif "==" in condition:
-            try:
-                parts = condition.split("==")
-                if len(parts) == 2:
-                    variable_name = parts[0].strip()
-                    required_value_str = parts[1].strip().strip("'\"")
-
-                    actual_value = dynamic_config.get(variable_name)
-
-                    if required_value_str.lower() in ["true", "false"]:
-                        required_value = required_value_str.lower() == "true"
-                        actual_value = (
-                            bool(actual_value) if actual_value is not None else False
-                        )
-                    else:
-                        try:
-                            required_value = int(required_value_str)
-                            actual_value = (
-                                int(actual_value) if actual_value is not None else 0
-                            )
-                        except (ValueError, TypeError):
-                            required_value = required_value_str
-                            actual_value = (
-                                str(actual_value) if actual_value is not None else ""
-                            )
-
-                    return actual_value == required_value
-            except (ValueError, IndexError):
-                return False
-        elif ">=" in condition:
-            try:
-                parts = condition.split(">=")
-                if len(parts) == 2:
-                    variable_name = parts[0].strip()
-                    required_value_str = parts[1].strip()
-
-                    try:
-                        required_value = int(required_value_str)
-                        actual_value = dynamic_config.get(variable_name, 0)
-                        if isinstance(actual_value, str):
-                            actual_value = int(actual_value)
-                        return actual_value >= required_value
-                    except ValueError:
-                        return False
-            except (ValueError, IndexError):
-                return False
-
-        return True
-
-    # REGEX FUNCTIONS
     def _extract_mppt_number(self, search_text: str) -> int:
         """Extract MPPT number from sensor name or unique_id."""
         import re
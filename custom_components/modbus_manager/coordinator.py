@@ -3,21 +3,28 @@
 from __future__ import annotations
 
 import asyncio
+import inspect
 import json
+import math
 import re
 import struct
-from datetime import timedelta
-from typing import Any, Dict, List, Optional
+import time
+from collections.abc import Mapping
+from itertools import combinations
+from typing import Any, Callable, Dict, FrozenSet, List, Optional, Set, Tuple
 
 from homeassistant.components.modbus.const import (
     CALL_TYPE_REGISTER_HOLDING,
     CALL_TYPE_REGISTER_INPUT,
 )
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
 from homeassistant.helpers import device_registry as dr
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 
+from .calculated_graph import CalculatedEntityGraph
+from .circuit_breaker import RangeCircuitBreaker
+from .condition_compiler import evaluate_condition
 from .const import (
     DOMAIN,
     POST_WRITE_SETTLE_SECONDS,
@@ -40,19 +47,81 @@ from .device_utils import (
     resolve_entity_id_strategy,
     resolve_firmware_profile_version,
 )
+from .io_queue import (
+    PRIORITY_FAST_READ,
+    PRIORITY_SLOW_READ,
+    PRIORITY_WRITE,
+    PriorityIOQueue,
+)
 from .logger import ModbusManagerLogger
 from .modbus_utils import is_valid_modbus_address, registers_to_bytes
 from .performance_monitor import PerformanceMonitor
-from .register_optimizer import RegisterOptimizer
+from .phase_planner import (
+    PHASE_STRATEGIES,
+    PHASE_STRATEGY_ALIGN,
+    expected_tick_load,
+    plan_phases,
+)
+from .pipelined_transport import ModbusTransportError, PipelinedModbusTcpTransport
+from .range_decoder import RangeDecoder
+from .read_calibration import async_calibrate_read_size
+from .read_planner_store import BAD_ADDRESS_TTL_S, ReadPlannerStore
+from .register_optimizer import (
+    ReadPlan,
+    RegisterOptimizer,
+    RegisterRange,
+    read_size_key,
+    register_end_address,
+)
+from .register_value import RegisterValue
 from .sunspec_utils import (
     calculate_sunspec_register_address,
     detect_sunspec_model_addresses,
 )
-from .template_loader import _evaluate_condition, get_template_by_name
-from .value_processor import process_register_value
+from .template_loader import get_template_by_name
+from .value_processor import (
+    ValuePipeline,
+    coerce_numeric_register_value,
+    compile_value_pipeline,
+)
 
 _LOGGER = ModbusManagerLogger(__name__)
 
+# Compile read plans for every interval combination up front when there are at
+# most this many distinct scan_intervals (2^n - 1 plans); beyond that, on demand.
+_MAX_EAGER_PLAN_INTERVALS = 6
+
+# Deadline scheduler: groups due within this window are read in the same wake-up
+_DEADLINE_COALESCE_S = 0.25
+# Shortest sleep between polls, and the retry delay while nothing is scheduled
+_MIN_UPDATE_DELAY_S = 0.1
+_IDLE_UPDATE_DELAY_S = 5.0
+
+# Ranges holding a register polled at least this often get fast-read priority
+_FAST_READ_MAX_INTERVAL_S = 10
+
+# A range must fail this many polls in a row before it is bisected
+_BISECT_AFTER_FAILURES = 2
+# Only this Modbus exception response marks addresses as unsupported
+_EXCEPTION_ILLEGAL_DATA_ADDRESS = 2
+
+# How often measured request latencies are fed back into the cost-model planner
+_COST_MODEL_REFRESH_SECONDS = 60.0
+
+
+class _BisectAborted(Exception):
+    """A bisect read failed for a reason unrelated to the addresses."""
+
+
+def _device_id_kwargs(read_method: Callable, slave_id: int) -> Dict[str, int]:
+    """Return the slave keyword of a pymodbus read method (device_id or slave)."""
+    try:
+        if "slave" in inspect.signature(read_method).parameters:
+            return {"slave": slave_id}
+    except (TypeError, ValueError):
+        pass
+    return {"device_id": slave_id}
+
 
 def filter_by_firmware_version(entities: list, firmware_version: str) -> list:
     """Filter entities based on firmware version requirements.
@@ -116,12 +185,31 @@ class ModbusCoordinator(DataUpdateCoordinator):
         hub,
         device_config: Dict[str, Any],
         entry: ConfigEntry,
+        io_queue: PriorityIOQueue | None = None,
+        transport: PipelinedModbusTcpTransport | None = None,
     ):
-        """Initialize the Modbus coordinator."""
+        """Initialize the Modbus coordinator.
+
+        io_queue is shared by all coordinators on the same host:port so their
+        requests are interleaved on one bus; a private queue is used otherwise.
+        transport is the endpoint's shared pipelined read transport (entry
+        option transport: pipelined), None to read through the hub.
+        """
         self.hub = hub
         self.device_config = device_config
         self.entry = entry
-        self.register_data = {}
+        self.register_data: Dict[str, RegisterValue] = {}
+        # Lower-case unique_id -> register_data key (see find_register_key)
+        self._register_keys_by_unique_id: Dict[str, str] = {}
+        # Memoised substring lookups, dropped whenever a register key is added
+        self._register_key_lookups: Dict[Tuple[str, bool], Optional[str]] = {}
+        # Register keys whose value changed since listeners were last notified
+        self._changed_keys: Set[str] = set()
+        self._register_listeners: Dict[str, List[Callable[[], None]]] = {}
+        self._listeners_available: bool | None = None
+        self._remove_register_dispatch: CALLBACK_TYPE | None = None
+        # Compiled value pipelines by id(register): (register, display, numeric)
+        self._value_pipelines: Dict[int, tuple] = {}
         self.template_processor = None
         self.register_optimizer = RegisterOptimizer()
         self.performance_monitor = PerformanceMonitor()
@@ -130,12 +218,29 @@ class ModbusCoordinator(DataUpdateCoordinator):
         # Structured dict: {"sensors": [...], "controls": [...], "calculated": [...], "binary_sensors": [...]}
         self._cached_entities = None
         self._cached_registers_by_interval = {}  # Register grouped by scan_interval
+        # Compiled read plans keyed by the set of due scan_intervals
+        self._read_plans: Dict[FrozenSet[int], ReadPlan] = {}
+        self._next_cost_model_refresh = 0.0
+        self._last_full_cycle_duration: float | None = None
+        self._planner_store: ReadPlannerStore | None = None
+        # Slaves with learned bad addresses and the wall-clock time the next
+        # learned window expires (plans are then rebuilt without it)
+        self._bad_address_slaves: Set[int] = set()
+        self._bad_addresses_expire_at: float | None = None
+        # Consecutive failed polls per (slave_id, input_type, start, end) range
+        self._range_failures: Dict[tuple, int] = {}
+        # Skip ranges that keep failing instead of paying the timeout every poll
+        self._range_breaker = RangeCircuitBreaker()
         self._cache_initialized = False
         self._cache_signature: str | None = None
         self._logged_dynamic_config_sources: set[str] = set()
 
-        # Track when each interval group was last updated
-        self._last_update_time = {}
+        # Deadline scheduler: next due time (event loop clock) per interval group
+        self._next_due_time: Dict[int, float] = {}
+        # Deadlines sit on epoch + phase + n * interval (see _plan_phases)
+        self._schedule_epoch = 0.0
+        self._group_phase: Dict[int, int] = {}
+        self._phase_report: Dict[str, Any] = {}
 
         # Connection retry state (avoid log spam)
         self._next_connect_attempt = 0.0
@@ -145,24 +250,27 @@ class ModbusCoordinator(DataUpdateCoordinator):
         # Flag to indicate if coordinator is being unloaded
         self._is_unloading = False
 
-        # Serialize Modbus reads/writes; writes hold through post-write settle delay
-        self._modbus_io_lock = asyncio.Lock()
+        # Serialize Modbus reads/writes per request; writes (held through the
+        # post-write settle delay and readback) preempt reads between ranges
+        self._io_queue = io_queue or PriorityIOQueue()
+        # Optional pipelined TCP transport for reads, shared per host:port and
+        # used behind the I/O queue (one slot per window of in-flight ranges)
+        self._transport = transport
 
-        # Start with a short interval - will be adjusted after register analysis
-        # Use 5 seconds as base to ensure we can update frequently
-        update_interval = timedelta(seconds=5)
+        # Refreshes are scheduled by the deadline scheduler with loop.call_at
+        # (DataUpdateCoordinator would round update_interval to whole seconds)
+        self._deadline_timer: asyncio.TimerHandle | None = None
 
         super().__init__(
             hass,
             _LOGGER,
             name=f"Modbus Coordinator {entry.data.get('prefix', 'unknown')}",
-            update_interval=update_interval,
+            update_interval=None,
         )
 
         _LOGGER.debug(
-            "ModbusCoordinator initialized for %s with update interval %s",
+            "ModbusCoordinator initialized for %s",
             entry.data.get("prefix", "unknown"),
-            update_interval,
         )
 
     def invalidate_cache(self):
@@ -170,15 +278,21 @@ class ModbusCoordinator(DataUpdateCoordinator):
         _LOGGER.debug("Invalidating entity cache")
         self._cached_entities = None
         self._cached_registers_by_interval = {}
-        self._last_update_time = {}
+        self._read_plans = {}
+        self._range_failures = {}
+        self._range_breaker.reset()
+        self._value_pipelines = {}
+        self._next_due_time = {}
+        self._group_phase = {}
+        self._phase_report = {}
         self._cache_initialized = False
         self._cache_signature = None
         self._logged_dynamic_config_sources = set()
 
-    def _build_cache_signature(self) -> str:
-        """Build a lightweight signature for config that affects entity composition."""
+    def _register_config_payload(self) -> Dict[str, Any]:
+        """Config that decides which registers are read (templates and planner)."""
         devices = self.entry.data.get("devices", [])
-        signature_payload = {
+        return {
             "devices": devices if isinstance(devices, list) else [],
             "selected_model": self.entry.data.get("selected_model"),
             "connection_type": self.entry.data.get("connection_type"),
@@ -189,6 +303,16 @@ class ModbusCoordinator(DataUpdateCoordinator):
             "mppt_count": self.entry.data.get("mppt_count"),
             "string_count": self.entry.data.get("string_count"),
             "modules": self.entry.data.get("modules"),
+            "max_gap": self.entry.data.get("max_gap"),
+            "never_read": self.entry.data.get("never_read"),
+        }
+
+    def _build_cache_signature(self) -> str:
+        """Build a lightweight signature for config that affects entity composition."""
+        devices = self.entry.data.get("devices", [])
+        signature_payload = {
+            **self._register_config_payload(),
+            "phase_strategy": self.entry.data.get("phase_strategy"),
             "entity_ids_without_prefix": self.entry.data.get(
                 "entity_ids_without_prefix"
             ),
@@ -213,12 +337,73 @@ class ModbusCoordinator(DataUpdateCoordinator):
             return self.entry.data.get(key), "entry"
         return default, "default"
 
+    def _configure_device_read_planner(
+        self, device: Dict[str, Any], template: Dict[str, Any], slave_id: int
+    ) -> None:
+        """Apply template/device gap-bridging options to the register optimizer.
+
+        Template ``read_planner: {max_gap, never_read, strategy, max_read_size}``
+        provides defaults; a device (or legacy entry) ``max_gap``,
+        ``read_strategy`` or ``max_read_size`` overrides them, and its
+        ``never_read`` windows are added to the template's.
+        """
+        read_planner = template.get("read_planner") or {}
+        if not isinstance(read_planner, dict):
+            read_planner = {}
+        max_gap, _ = self._resolve_device_or_entry_value(
+            device, "max_gap", read_planner.get("max_gap", 0)
+        )
+        never_read = []
+        for raw in (
+            read_planner.get("never_read"),
+            self._resolve_device_or_entry_value(device, "never_read", None)[0],
+        ):
+            if isinstance(raw, (list, tuple)):
+                never_read.extend(raw)
+            elif raw is not None:
+                never_read.append(raw)
+        strategy, _ = self._resolve_device_or_entry_value(
+            device, "read_strategy", read_planner.get("strategy")
+        )
+        max_read_size, _ = self._resolve_device_or_entry_value(
+            device, "max_read_size", read_planner.get("max_read_size")
+        )
+        self.register_optimizer.configure_device(
+            slave_id,
+            max_gap=max_gap,
+            never_read=never_read,
+            strategy=strategy,
+            max_read_size=max_read_size,
+        )
+
     def mark_as_unloading(self):
         """Mark coordinator as unloading to stop further updates."""
         _LOGGER.debug("Marking coordinator as unloading")
         self._is_unloading = True
+        self._cancel_deadline_timer()
         self.invalidate_cache()
 
+    async def _async_call_read(
+        self, slave_id: int, address: int, count: int, call_type: str
+    ) -> Any:
+        """Send one read request through the pipelined transport or the hub."""
+        if self._transport is None:
+            return await self.hub.async_pb_call(slave_id, address, count, call_type)
+        function_code = 4 if call_type == CALL_TYPE_REGISTER_INPUT else 3
+        try:
+            return await self._transport.read_registers(
+                slave_id, address, count, function_code
+            )
+        except ModbusTransportError as e:
+            _LOGGER.debug(
+                "Pipelined read %d+%d (slave_id=%d) failed: %s",
+                address,
+                count,
+                slave_id,
+                str(e),
+            )
+            return None
+
     def _resolve_post_write_settle_ms(self) -> int | None:
         """Return configured post-write settle in ms, or None for legacy auto mode."""
         entry_data = self.entry.data
@@ -255,10 +440,17 @@ class ModbusCoordinator(DataUpdateCoordinator):
         *,
         refresh: bool = True,
     ) -> bool:
-        """Write a Modbus register with IO lock and post-write settle delay."""
+        """Write a Modbus register with write priority and post-write settle delay."""
         settle_s = self._post_write_settle_seconds()
         success = False
-        async with self._modbus_io_lock:
+        if refresh and not self._is_unloading:
+            # Building the cache may calibrate read sizes, which takes its own
+            # I/O slot; the queue is not reentrant, so do it before the write slot
+            try:
+                await self._ensure_register_interval_cache()
+            except Exception as e:
+                _LOGGER.debug("Register cache not ready for write readback: %s", e)
+        async with self._io_queue.slot(PRIORITY_WRITE, self.entry.entry_id, slave_id):
             result = await self.hub.async_pb_call(
                 slave_id,
                 address,
@@ -275,6 +467,58 @@ class ModbusCoordinator(DataUpdateCoordinator):
             self.async_update_listeners()
         return success
 
+    @callback
+    def async_update_listeners(self) -> None:
+        """Notify entities, then settle calculated entities fed by them."""
+        super().async_update_listeners()
+        CalculatedEntityGraph.get(self.hass).async_evaluate()
+
+    @callback
+    def async_add_register_listener(
+        self, register_key: str, update_callback: Callable[[], None]
+    ) -> CALLBACK_TYPE:
+        """Listen for changes of one register; returns a function to unsubscribe.
+
+        The callback runs only when the register value changed in the last
+        poll or write readback, or when coordinator availability changed.
+        """
+        if not self._register_listeners:
+            # One coordinator listener fans out to all registers (and keeps
+            # DataUpdateCoordinator polling while only register listeners exist)
+            self._remove_register_dispatch = self.async_add_listener(
+                self._async_dispatch_register_updates
+            )
+        listeners = self._register_listeners.setdefault(register_key, [])
+        listeners.append(update_callback)
+
+        @callback
+        def remove_listener() -> None:
+            if update_callback in listeners:
+                listeners.remove(update_callback)
+            if not listeners:
+                self._register_listeners.pop(register_key, None)
+            if not self._register_listeners and self._remove_register_dispatch:
+                self._remove_register_dispatch()
+                self._remove_register_dispatch = None
+
+        return remove_listener
+
+    @callback
+    def _async_dispatch_register_updates(self) -> None:
+        """Notify listeners of registers that changed since the last update."""
+        available = self.last_update_success and hub_is_connected(self.hub)
+        if available != self._listeners_available:
+            self._listeners_available = available
+            keys = list(self._register_listeners)
+        else:
+            keys = [
+                key for key in self._changed_keys if key in self._register_listeners
+            ]
+        self._changed_keys = set()
+        for key in keys:
+            for update_callback in list(self._register_listeners.get(key, ())):
+                update_callback()
+
     async def _ensure_register_interval_cache(self) -> None:
         """Build scan_interval register cache if not yet initialized."""
         if self._cached_registers_by_interval:
@@ -294,7 +538,556 @@ class ModbusCoordinator(DataUpdateCoordinator):
         self._cached_registers_by_interval = self._group_registers_by_interval(
             all_registers
         )
-        self._update_coordinator_interval(5)
+        await self._async_apply_bad_addresses()
+        await self._async_apply_read_size_calibration(all_registers)
+        for register in all_registers:
+            self._get_value_pipelines(register)
+        self._compile_read_plans()
+        self._plan_phases()
+        # Read everything once at startup; phases apply from the next deadline on
+        now = asyncio.get_running_loop().time()
+        self._schedule_epoch = now
+        self._next_due_time = {
+            interval: now for interval in self._cached_registers_by_interval
+        }
+
+    def _plan_phases(self) -> None:
+        """Choose start offsets for interval groups and report expected bus load.
+
+        Strategy comes from the entry's ``phase_strategy`` (``align`` default,
+        or ``spread``); the expected requests per tick are computed for both so
+        they can be compared in the ``performance_monitor`` service.
+        """
+        strategy = str(
+            self.entry.data.get("phase_strategy") or PHASE_STRATEGY_ALIGN
+        ).lower()
+        if strategy not in PHASE_STRATEGIES:
+            _LOGGER.warning(
+                "Unknown phase_strategy %s, using %s", strategy, PHASE_STRATEGY_ALIGN
+            )
+            strategy = PHASE_STRATEGY_ALIGN
+        try:
+            intervals = list(self._cached_registers_by_interval)
+            weights = {
+                interval: self._get_read_plan(frozenset({interval})).range_count
+                for interval in intervals
+            }
+
+            def _requests_for(due_intervals: FrozenSet[int]) -> int:
+                return self._get_read_plan(due_intervals).range_count
+
+            report: Dict[str, Any] = {"strategy": strategy}
+            for candidate in PHASE_STRATEGIES:
+                phases = plan_phases(intervals, weights, candidate)
+                report[candidate] = {
+                    "phases": phases,
+                    **expected_tick_load(phases, _requests_for),
+                }
+            self._group_phase = report[strategy]["phases"]
+            self._phase_report = report
+            _LOGGER.debug(
+                "Phase plan (%s): phases=%s, expected requests/tick avg %.2f max %d",
+                strategy,
+                self._group_phase,
+                report[strategy]["average_requests"],
+                report[strategy]["max_requests"],
+            )
+        except Exception as e:
+            _LOGGER.error("Error planning interval phases: %s", str(e))
+            self._group_phase = {}
+
+    def _planner_store_signature(self) -> str:
+        """Signature of everything learned planner data depends on.
+
+        Only inputs that change which addresses are read belong here; scheduling
+        options such as ``phase_strategy`` must not discard learned sizes.
+        """
+        hub_config = self.entry.data.get("hub", {})
+        return json.dumps(
+            {
+                "config": self._register_config_payload(),
+                "host": hub_config.get("host") or self.entry.data.get("host"),
+                "port": hub_config.get("port") or self.entry.data.get("port"),
+            },
+            sort_keys=True,
+            default=str,
+        )
+
+    async def _async_get_planner_store(self) -> ReadPlannerStore:
+        """Return the loaded persistent read planner store for this entry."""
+        if self._planner_store is None:
+            self._planner_store = ReadPlannerStore(self.hass, self.entry.entry_id)
+        await self._planner_store.async_load(self._planner_store_signature())
+        return self._planner_store
+
+    async def _async_apply_bad_addresses(self) -> None:
+        """Route plans around addresses the device rejected in earlier runs."""
+        try:
+            self._apply_bad_addresses(await self._async_get_planner_store())
+        except Exception as e:
+            _LOGGER.error("Error loading learned bad addresses: %s", str(e))
+
+    def _apply_bad_addresses(self, store: ReadPlannerStore) -> None:
+        """Hand the store's unexpired bad address windows to the optimizer."""
+        bad_addresses = store.get_bad_addresses()
+        for slave_id in self._bad_address_slaves | set(bad_addresses):
+            self.register_optimizer.set_bad_addresses(
+                slave_id, bad_addresses.get(slave_id, [])
+            )
+        self._bad_address_slaves = set(bad_addresses)
+        self._bad_addresses_expire_at = store.next_bad_address_expiry()
+
+    async def _async_read_ranges(self, ranges: List[Any]) -> List[Any]:
+        """Read ranges; returns raw registers, None or the exception per range.
+
+        Each range takes one slot of the I/O queue. With the pipelined
+        transport, consecutive ranges of the same slave and priority share one
+        slot and are in flight together (up to the transport's window), so
+        writes and other entries on the endpoint still get the bus between
+        windows.
+        """
+        window_size = self._transport.max_in_flight if self._transport else 1
+        results: List[Any] = []
+        index = 0
+        while index < len(ranges):
+            priority = self._range_priority(ranges[index])
+            slave_id = ranges[index].registers[0].get("slave_id", 1)
+            window = [ranges[index]]
+            index += 1
+            while (
+                index < len(ranges)
+                and len(window) < window_size
+                and self._range_priority(ranges[index]) == priority
+                and ranges[index].registers[0].get("slave_id", 1) == slave_id
+            ):
+                window.append(ranges[index])
+                index += 1
+            try:
+                async with self._io_queue.slot(priority, self.entry.entry_id, slave_id):
+                    if len(window) == 1:
+                        window_results = [await self._read_register_range(window[0])]
+                    else:
+                        window_results = await asyncio.gather(
+                            *(
+                                self._read_register_range(range_obj)
+                                for range_obj in window
+                            ),
+                            return_exceptions=True,
+                        )
+            except Exception as e:
+                window_results = [e] * len(window)
+            results.extend(window_results)
+        return results
+
+    @staticmethod
+    def _range_priority(range_obj) -> int:
+        """I/O priority of a read range: fast-interval ranges before slow ones."""
+        for register in range_obj.registers:
+            interval = register.get("scan_interval", 30)
+            if (
+                isinstance(interval, (int, float))
+                and interval <= _FAST_READ_MAX_INTERVAL_S
+            ):
+                return PRIORITY_FAST_READ
+        return PRIORITY_SLOW_READ
+
+    @staticmethod
+    def _range_breaker_key(range_obj) -> str:
+        """Circuit breaker key: slave, function code and address span."""
+        first = range_obj.registers[0]
+        function_key = read_size_key(
+            first.get("input_type", "holding"), first.get("read_function_code")
+        )
+        return (
+            f"slave {first.get('slave_id', 1)} {function_key} "
+            f"{range_obj.start_address}-{range_obj.end_address}"
+        )
+
+    def get_io_queue_status(self) -> Dict[str, Any]:
+        """Return state of the (hub-shared) I/O queue."""
+        return self._io_queue.get_status()
+
+    def get_circuit_breaker_status(self) -> List[Dict[str, Any]]:
+        """Return read ranges with recent failures and their breaker state."""
+        return self._range_breaker.get_status(asyncio.get_running_loop().time())
+
+    @staticmethod
+    def _range_failure_key(range_obj) -> tuple:
+        """Identify a planned range across polls."""
+        first = range_obj.registers[0]
+        return (
+            first.get("slave_id", 1),
+            first.get("input_type", "holding"),
+            range_obj.start_address,
+            range_obj.end_address,
+        )
+
+    async def _async_heal_failed_ranges(self, failed_ranges: List[Any]) -> bool:
+        """Bisect ranges that keep failing; return True if bad addresses were learned.
+
+        Only called when other ranges of the same poll succeeded, so the device
+        is known to be responsive. Addresses count as bad only when the device
+        answers with an "illegal data address" exception; any other failure
+        stops healing until the next poll.
+        """
+        bad_by_slave: Dict[int, List[tuple]] = {}
+        try:
+            for range_obj in failed_ranges:
+                key = self._range_failure_key(range_obj)
+                slave_id, input_type = key[0], key[1]
+                failures = self._range_failures.get(key, 0) + 1
+                self._range_failures[key] = failures
+                if failures < _BISECT_AFTER_FAILURES:
+                    continue
+                self._range_failures.pop(key, None)
+                bad: List[tuple] = []
+                aborted = False
+                try:
+                    await self._async_bisect_registers(range_obj.registers, bad)
+                except _BisectAborted as e:
+                    aborted = True
+                    _LOGGER.debug(
+                        "Stopped isolating failed range %d-%d (slave_id=%d): %s",
+                        range_obj.start_address,
+                        range_obj.end_address,
+                        slave_id,
+                        str(e),
+                    )
+                # Windows found before an abort were confirmed by the device
+                if bad:
+                    bad_by_slave.setdefault(slave_id, []).extend(
+                        (start, end, input_type) for start, end in bad
+                    )
+                if aborted:
+                    break
+
+            if not bad_by_slave:
+                return False
+            store = await self._async_get_planner_store()
+            for slave_id, windows in bad_by_slave.items():
+                _LOGGER.warning(
+                    "Device (slave_id=%d) rejects registers %s (illegal data "
+                    "address); they are skipped for the next %d days",
+                    slave_id,
+                    ", ".join(
+                        f"{input_type} {start}"
+                        if start == end
+                        else f"{input_type} {start}-{end}"
+                        for start, end, input_type in windows
+                    ),
+                    BAD_ADDRESS_TTL_S // 86400,
+                )
+                store.add_bad_addresses(slave_id, windows)
+            self._apply_bad_addresses(store)
+            store.async_schedule_save()
+            return True
+        except Exception as e:
+            _LOGGER.error("Error isolating failed register ranges: %s", str(e))
+            return bool(bad_by_slave)
+
+    async def _async_bisect_registers(
+        self, registers: List[Dict[str, Any]], bad: List[tuple]
+    ) -> bool:
+        """Split a rejected register list until the offending addresses are isolated.
+
+        Returns True if the registers read fine (their data is distributed
+        right away). If both halves of a rejected list read fine, the
+        bridged padding between them is bad. Raises _BisectAborted when a
+        read fails for any other reason than an illegal data address.
+        """
+        registers = sorted(registers, key=lambda r: r.get("address", 0))
+        range_obj = RegisterRange(
+            start_address=registers[0].get("address", 0),
+            end_address=max(register_end_address(r) for r in registers),
+            registers=registers,
+        )
+        data = await self._async_read_bisect_range(range_obj)
+        if data is not None:
+            self._distribute_data(data, range_obj)
+            return True
+        if len(registers) == 1:
+            bad.append((range_obj.start_address, range_obj.end_address))
+            return False
+
+        mid = len(registers) // 2
+        left, right = registers[:mid], registers[mid:]
+        left_ok = await self._async_bisect_registers(left, bad)
+        right_ok = await self._async_bisect_registers(right, bad)
+        left_end = max(register_end_address(r) for r in left)
+        right_start = right[0].get("address", 0)
+        if left_ok and right_ok and right_start > left_end + 1:
+            bad.append((left_end + 1, right_start - 1))
+        return False
+
+    async def _async_read_bisect_range(self, range_obj) -> Optional[List[int]]:
+        """Read a range while bisecting; None means the device rejected it.
+
+        Only an "illegal data address" exception response is a rejection.
+        Timeouts, lost connections, other exception codes and short
+        responses raise _BisectAborted: they say nothing about the addresses.
+        Each probe takes its own slow-read slot, so writes can go in between.
+        """
+        first = range_obj.registers[0]
+        slave_id = first.get("slave_id", 1)
+        call_type = self._resolve_read_call_type(first)
+        if not hub_is_connected(self.hub):
+            raise _BisectAborted("Modbus hub not connected")
+        try:
+            async with self._io_queue.slot(
+                PRIORITY_SLOW_READ, self.entry.entry_id, slave_id
+            ):
+                if self._transport is not None:
+                    result = await self._transport.read_registers(
+                        slave_id,
+                        range_obj.start_address,
+                        range_obj.count,
+                        4 if call_type == CALL_TYPE_REGISTER_INPUT else 3,
+                    )
+                else:
+                    result = await asyncio.wait_for(
+                        self._async_hub_client_read(
+                            slave_id,
+                            range_obj.start_address,
+                            range_obj.count,
+                            call_type,
+                        ),
+                        timeout=self.entry.data.get("timeout", 5),
+                    )
+        except ModbusTransportError as e:
+            if e.exception_code == _EXCEPTION_ILLEGAL_DATA_ADDRESS:
+                return None
+            raise _BisectAborted(str(e)) from e
+        except _BisectAborted:
+            raise
+        except Exception as e:
+            raise _BisectAborted(self._classify_modbus_error(e)) from e
+
+        if result is None:
+            raise _BisectAborted("no response")
+        if hasattr(result, "isError") and result.isError():
+            exception_code = getattr(result, "exception_code", None)
+            if exception_code == _EXCEPTION_ILLEGAL_DATA_ADDRESS:
+                return None
+            raise _BisectAborted(f"Modbus exception code {exception_code}")
+        registers = getattr(result, "registers", None)
+        if not registers or len(registers) < range_obj.count:
+            raise _BisectAborted("incomplete response")
+        return list(registers)
+
+    async def _async_hub_client_read(
+        self, slave_id: int, address: int, count: int, call_type: str
+    ) -> Any:
+        """Read with the hub's pymodbus client, keeping exception responses.
+
+        ModbusHub.async_pb_call turns every failure into None, so this reads
+        through the client under the hub lock (as device identification does).
+        """
+        async with self.hub._lock:
+            client = self.hub._client
+            if client is None:
+                raise _BisectAborted("Modbus client is not connected")
+            read = (
+                client.read_input_registers
+                if call_type == CALL_TYPE_REGISTER_INPUT
+                else client.read_holding_registers
+            )
+            return await read(address, count=count, **_device_id_kwargs(read, slave_id))
+
+    async def _async_apply_read_size_calibration(
+        self, registers: List[Dict[str, Any]]
+    ) -> None:
+        """Apply stored or freshly probed read sizes for ``max_read_size: auto``.
+
+        Each slave/function-code group is probed once with block sizes built
+        from its own template addresses; the largest reliable size is stored
+        per entry and reused after restarts.
+        """
+        auto_slaves = self.register_optimizer.auto_read_size_slaves()
+        if not auto_slaves:
+            return
+        try:
+            store = await self._async_get_planner_store()
+            groups: Dict[tuple, List[Dict[str, Any]]] = {}
+            for register in registers:
+                slave_id = register.get("slave_id", 1)
+                if slave_id in auto_slaves:
+                    key = (
+                        slave_id,
+                        register.get("input_type", "holding"),
+                        register.get("read_function_code"),
+                    )
+                    groups.setdefault(key, []).append(register)
+
+            calibrated = False
+            for (slave_id, input_type, read_fc), group in groups.items():
+                key = read_size_key(input_type, read_fc)
+                size = store.get_read_size(slave_id, key)
+                if size is None:
+                    call_type = self._resolve_read_call_type(group[0])
+
+                    async def _probe(start: int, count: int) -> bool:
+                        # One slow-read slot per probe so writes can go in between
+                        async with self._io_queue.slot(
+                            PRIORITY_SLOW_READ, self.entry.entry_id, slave_id
+                        ):
+                            return await self._async_probe_read(
+                                slave_id, start, count, call_type
+                            )
+
+                    size = await async_calibrate_read_size(
+                        _probe,
+                        group,
+                        input_type,
+                        self.register_optimizer.read_options_for(slave_id),
+                    )
+                    if size is None:
+                        _LOGGER.warning(
+                            "Read size calibration for slave_id %s (%s) failed; "
+                            "using the configured default",
+                            slave_id,
+                            key,
+                        )
+                        continue
+                    _LOGGER.info(
+                        "Calibrated max read size for slave_id %s (%s): %d registers",
+                        slave_id,
+                        key,
+                        size,
+                    )
+                    store.set_read_size(slave_id, key, size)
+                    calibrated = True
+                self.register_optimizer.set_read_size_limit(
+                    slave_id, input_type, read_fc, size
+                )
+            if calibrated:
+                store.async_schedule_save()
+        except Exception as e:
+            _LOGGER.error("Error during read size calibration: %s", str(e))
+
+    async def _async_probe_read(
+        self, slave_id: int, address: int, count: int, call_type: str
+    ) -> bool:
+        """Single calibration read; timeouts and Modbus exceptions count as failure."""
+        try:
+            result = await asyncio.wait_for(
+                self._async_call_read(slave_id, address, count, call_type),
+                timeout=self.entry.data.get("timeout", 5),
+            )
+        except Exception as e:
+            _LOGGER.debug(
+                "Probe read %d+%d (slave_id=%d) failed: %s",
+                address,
+                count,
+                slave_id,
+                self._classify_modbus_error(e),
+            )
+            return False
+        if not result or not hasattr(result, "registers"):
+            return False
+        if hasattr(result, "isError") and result.isError():
+            return False
+        return len(result.registers) >= count
+
+    def _compile_read_plans(self) -> None:
+        """Precompile read plans for the interval combinations polling will hit."""
+        self._read_plans = {}
+        intervals = sorted(self._cached_registers_by_interval)
+        if len(intervals) > _MAX_EAGER_PLAN_INTERVALS:
+            self._get_read_plan(frozenset(intervals))
+        else:
+            for size in range(1, len(intervals) + 1):
+                for combo in combinations(intervals, size):
+                    self._get_read_plan(frozenset(combo))
+            _LOGGER.debug(
+                "Compiled %d read plans for scan_intervals %s",
+                len(self._read_plans),
+                intervals,
+            )
+        self._prune_range_state()
+
+    def _prune_range_state(self) -> None:
+        """Drop breaker state and failure counts of ranges no longer planned."""
+        ranges = [
+            range_obj
+            for plan in self._read_plans.values()
+            for range_obj in plan.ranges
+            if range_obj.registers
+        ]
+        self._range_breaker.prune(
+            {self._range_breaker_key(range_obj) for range_obj in ranges}
+        )
+        if self._range_failures:
+            valid_keys = {self._range_failure_key(range_obj) for range_obj in ranges}
+            self._range_failures = {
+                key: failures
+                for key, failures in self._range_failures.items()
+                if key in valid_keys
+            }
+
+    def _get_read_plan(self, intervals: FrozenSet[int]) -> ReadPlan:
+        """Return the compiled read plan for a set of due intervals."""
+        plan = self._read_plans.get(intervals)
+        if plan is None:
+            registers = [
+                register
+                for interval in sorted(intervals)
+                for register in self._cached_registers_by_interval.get(interval, [])
+            ]
+            extra_registers = None
+            if self.register_optimizer.cost_model_slaves():
+                extra_registers = [
+                    register
+                    for interval, group in self._cached_registers_by_interval.items()
+                    if interval not in intervals
+                    for register in group
+                ]
+            plan = self.register_optimizer.build_read_plan(
+                intervals, registers, extra_registers
+            )
+            self._read_plans[intervals] = plan
+        return plan
+
+    def _refresh_cost_model(self) -> None:
+        """Feed measured read latencies into the planner's cost model.
+
+        Every polled slave gets its measured costs (cycle-time estimates use
+        them for greedy slaves too). Plans are recompiled only when a slave's
+        per-request or per-word cost moved by more than the optimizer's
+        re-plan threshold.
+        """
+        now = asyncio.get_running_loop().time()
+        if now < self._next_cost_model_refresh:
+            return
+        self._next_cost_model_refresh = now + _COST_MODEL_REFRESH_SECONDS
+
+        prefix = self.entry.data.get("prefix", "unknown")
+        changed = False
+        slave_ids = {
+            register.get("slave_id", 1)
+            for group in self._cached_registers_by_interval.values()
+            for register in group
+        }
+        for slave_id in sorted(slave_ids):
+            model = self.performance_monitor.get_latency_model(f"{prefix}:{slave_id}")
+            if model and self.register_optimizer.update_cost_model(slave_id, *model):
+                changed = True
+        if changed:
+            _LOGGER.debug("Measured read latency changed, recompiling read plans")
+            self._compile_read_plans()
+
+    def get_optimization_stats(self) -> Dict[str, Any]:
+        """Return planner statistics for all cached registers (estimate vs. measured)."""
+        registers = [
+            register
+            for group in self._cached_registers_by_interval.values()
+            for register in group
+        ]
+        stats = self.register_optimizer.calculate_optimization_stats(
+            registers, self._last_full_cycle_duration
+        )
+        if self._phase_report:
+            stats["phase_plan"] = self._phase_report
+        return stats
 
     def _find_registers_for_io(
         self, slave_id: int, address: int
@@ -311,11 +1104,15 @@ class ModbusCoordinator(DataUpdateCoordinator):
         return matches
 
     async def _async_read_written_register(self, slave_id: int, address: int) -> None:
-        """Read register(s) immediately after a control write (bypass scan_interval)."""
+        """Read register(s) immediately after a control write (bypass scan_interval).
+
+        Runs inside the write slot, so it must not build the register cache
+        (calibration would wait for a second slot); async_pb_write builds it
+        before taking the slot.
+        """
         if self._is_unloading or not hub_is_connected(self.hub):
             return
 
-        await self._ensure_register_interval_cache()
         registers = self._find_registers_for_io(slave_id, address)
         if not registers:
             _LOGGER.debug(
@@ -375,12 +1172,20 @@ class ModbusCoordinator(DataUpdateCoordinator):
 
             # 1. Group registers by scan_interval if not cached
             await self._ensure_register_interval_cache()
+            if (
+                self._bad_addresses_expire_at is not None
+                and time.time() >= self._bad_addresses_expire_at
+            ):
+                # Learned bad addresses expired: read them again from now on
+                await self._async_apply_bad_addresses()
+                self._compile_read_plans()
 
-            # 2. Determine which registers need to be read based on their scan_interval
-            registers_to_read = self._get_registers_due_for_update()
+            # 2. Determine which interval groups are due based on their scan_interval
+            due_intervals = self._get_due_intervals()
+            read_plan = self._get_read_plan(due_intervals) if due_intervals else None
 
             # Update operation with register count
-            total_registers = len(registers_to_read) if registers_to_read else 0
+            total_registers = read_plan.register_count if read_plan else 0
             device_id = self.entry.data.get("prefix", "unknown")
             device_metrics = self.performance_monitor.devices.get(device_id)
             if device_metrics and device_metrics.operations:
@@ -390,8 +1195,13 @@ class ModbusCoordinator(DataUpdateCoordinator):
                         op.register_count = total_registers
                         break
 
-            if not registers_to_read:
+            if not read_plan or not read_plan.ranges:
                 _LOGGER.debug("No registers due for update at this time")
+                if read_plan:
+                    self._advance_deadlines(
+                        read_plan.intervals, asyncio.get_running_loop().time()
+                    )
+                self._schedule_next_update()
                 self.performance_monitor.end_operation(
                     device_id=self.entry.data.get("prefix", "unknown"),
                     operation_id=operation_id,
@@ -399,52 +1209,80 @@ class ModbusCoordinator(DataUpdateCoordinator):
                 )
                 return self.register_data
 
-            # 3. Optimize reading (group consecutive registers)
-            optimized_ranges = self.register_optimizer.optimize_registers(
-                registers_to_read
-            )
-
-            # Calculate total bytes that will be transferred (2 bytes per register)
-            total_bytes = sum(
-                range_obj.register_count * 2 for range_obj in optimized_ranges
-            )
+            # 3. Use the precompiled plan (ranges were merged at cache build)
+            self._refresh_cost_model()
+            read_plan = self._get_read_plan(due_intervals)
+            optimized_ranges = read_plan.ranges
+            total_bytes = read_plan.total_bytes
 
             _LOGGER.debug(
                 "Reading %d registers in %d optimized ranges",
-                len(registers_to_read),
+                total_registers,
                 len(optimized_ranges),
             )
 
-            # 4. Read all data in minimal calls (queued behind in-flight writes)
-            async with self._modbus_io_lock:
-                for range_obj in optimized_ranges:
-                    try:
-                        data = await self._read_register_range(range_obj)
-                        if data:
-                            self._distribute_data(data, range_obj)
-                    except Exception as e:
-                        # Fallback log if _read_register_range raised (normally it catches all)
-                        register_type = (
-                            range_obj.registers[0].get("input_type", "holding")
-                            if range_obj.registers
-                            else "unknown"
-                        )
-                        entity_list = self._get_register_range_debug_info(range_obj)
-                        _LOGGER.error(
-                            "Error reading %s register range %d-%d: %s. "
-                            "Entities affected: [%s]",
-                            register_type,
-                            range_obj.start_address,
-                            range_obj.end_address,
-                            str(e),
-                            entity_list,
+            # 4. Read all data in minimal calls; the bus is taken per range so
+            #    pending writes (and faster groups of other pollers) go first
+            read_started = asyncio.get_running_loop().time()
+            failed_ranges = []
+            skipped_ranges = 0
+            unchanged_registers = 0
+            loop = asyncio.get_running_loop()
+            allowed_ranges = []
+            for range_obj in optimized_ranges:
+                if self._range_breaker.allow(
+                    self._range_breaker_key(range_obj), loop.time()
+                ):
+                    allowed_ranges.append(range_obj)
+                else:
+                    skipped_ranges += 1
+            results = await self._async_read_ranges(allowed_ranges)
+            for range_obj, data in zip(allowed_ranges, results):
+                breaker_key = self._range_breaker_key(range_obj)
+                if isinstance(data, Exception):
+                    # Fallback log if _read_register_range raised (normally it catches all)
+                    register_type = (
+                        range_obj.registers[0].get("input_type", "holding")
+                        if range_obj.registers
+                        else "unknown"
+                    )
+                    entity_list = self._get_register_range_debug_info(range_obj)
+                    _LOGGER.error(
+                        "Error reading %s register range %d-%d: %s. "
+                        "Entities affected: [%s]",
+                        register_type,
+                        range_obj.start_address,
+                        range_obj.end_address,
+                        str(data),
+                        entity_list,
+                    )
+                elif data:
+                    unchanged_registers += self._distribute_data(data, range_obj)
+                    self._range_breaker.record_success(breaker_key)
+                    if self._range_failures:
+                        self._range_failures.pop(
+                            self._range_failure_key(range_obj), None
                         )
+                else:
+                    failed_ranges.append(range_obj)
+                    self._range_breaker.record_failure(breaker_key, loop.time())
 
-            # 5. Update last_update_time for each interval
+            # 4.5. Isolate unsupported addresses while the device answers
+            if (
+                failed_ranges
+                and len(failed_ranges) < len(optimized_ranges) - skipped_ranges
+                and hub_is_connected(self.hub)
+            ):
+                healed = await self._async_heal_failed_ranges(failed_ranges)
+                if healed:
+                    self._compile_read_plans()
+
+            # 5. Advance each group's deadline and sleep until the earliest one
             current_time = asyncio.get_running_loop().time()
-            for register in registers_to_read:
-                interval = register.get("scan_interval", 30)
-                self._last_update_time[interval] = current_time
+            if len(read_plan.intervals) == len(self._cached_registers_by_interval):
+                self._last_full_cycle_duration = current_time - read_started
+            self._advance_deadlines(read_plan.intervals, read_started)
+            self._schedule_next_update()
 
             # 5.5. Update device firmware from register if available
             await self._update_device_firmware_from_register()
@@ -458,6 +1296,9 @@ class ModbusCoordinator(DataUpdateCoordinator):
                     if op.end_time is None:  # Still running
                         op.bytes_transferred = total_bytes
                         op.optimized_ranges_count = len(optimized_ranges)
+                        op.estimated_duration = read_plan.estimated_duration
+                        op.skipped_ranges_count = skipped_ranges
+                        op.unchanged_registers_count = unchanged_registers
                         break
 
             self.performance_monitor.end_operation(
@@ -475,6 +1316,7 @@ class ModbusCoordinator(DataUpdateCoordinator):
 
         except UpdateFailed:
             # UpdateFailed is handled by DataUpdateCoordinator; avoid extra log spam here
+            self._schedule_refresh_in(_IDLE_UPDATE_DELAY_S)
             if operation_id is not None:
                 self.performance_monitor.end_operation(
                     device_id=self.entry.data.get("prefix", "unknown"),
@@ -485,6 +1327,7 @@ class ModbusCoordinator(DataUpdateCoordinator):
             raise
         except Exception as e:
             _LOGGER.error("Error in coordinator update: %s", str(e))
+            self._schedule_refresh_in(_IDLE_UPDATE_DELAY_S)
             if operation_id is not None:
                 self.performance_monitor.end_operation(
                     device_id=self.entry.data.get("prefix", "unknown"),
@@ -623,6 +1466,9 @@ class ModbusCoordinator(DataUpdateCoordinator):
                     )
                     break
 
+            # Gap-bridging options are rebuilt together with the entity cache
+            self.register_optimizer.reset_device_options()
+
             device_count = len(devices)
             for device in devices:
                 device_type = device.get("type", "inverter")
@@ -665,6 +1511,8 @@ class ModbusCoordinator(DataUpdateCoordinator):
                     _LOGGER.error("Template %s not found for device", template_name)
                     continue
 
+                self._configure_device_read_planner(device, template, slave_id)
+
                 # Build dynamic_config dict dynamically from template's dynamic_config section
                 # This automatically includes ALL fields defined in the template (e.g., dual_channel_meter)
                 template_dynamic_config = template.get("dynamic_config", {})
@@ -1738,7 +2586,7 @@ class ModbusCoordinator(DataUpdateCoordinator):
                 # Check condition filter first
                 condition = entity.get("condition")
                 if condition:
-                    if not _evaluate_condition(condition, dynamic_config):
+                    if not evaluate_condition(condition, dynamic_config):
                         _LOGGER.debug(
                             "Excluding entity due to condition '%s': %s (unique_id: %s)",
                             condition,
@@ -1763,195 +2611,6 @@ class ModbusCoordinator(DataUpdateCoordinator):
             _LOGGER.error("Error filtering by conditions: %s", str(e))
             return entities  # Return unfiltered on error
 
-    def _evaluate_single_condition(self, condition: str, dynamic_config: dict) -> bool:
-        """Evaluate a single condition (no AND/OR).
-
-        Supports:
-        - "variable == value" (string, int, bool)
-        - "variable != value" (string, int, bool)
-        - "variable >= value" (int)
-        - "variable in [value1, value2]" (string list)
-        """
-        condition = condition.strip()
-
-        if " not in " in condition:
-            try:
-                parts = condition.split(" not in ")
-                if len(parts) == 2:
-                    variable_name = parts[0].strip()
-                    required_values_str = parts[1].strip()
-
-                    actual_value = dynamic_config.get(variable_name)
-
-                    if required_values_str.startswith(
-                        "["
-                    ) and required_values_str.endswith("]"):
-                        required_values_str = required_values_str[1:-1]
-                    required_values = [
-                        value.strip().strip("'\"")
-                        for value in required_values_str.split(",")
-                        if value.strip()
-                    ]
-
-                    if isinstance(actual_value, (list, tuple, set)):
-                        actual_values = {str(value) for value in actual_value}
-                        result = not any(
-                            value in actual_values for value in required_values
-                        )
-                    else:
-                        result = str(actual_value) not in required_values
-
-                    _LOGGER.debug(
-                        "Evaluating condition '%s': variable=%s, required=%s, actual=%s, result=%s",
-                        condition,
-                        variable_name,
-                        required_values,
-                        actual_value,
-                        result,
-                    )
-                    return result
-            except (ValueError, IndexError) as e:
-                _LOGGER.warning("Invalid condition '%s': %s", condition, str(e))
-                return False
-        elif " in " in condition:
-            try:
-                parts = condition.split(" in ")
-                if len(parts) == 2:
-                    variable_name = parts[0].strip()
-                    required_values_str = parts[1].strip()
-
-                    actual_value = dynamic_config.get(variable_name)
-
-                    if required_values_str.startswith(
-                        "["
-                    ) and required_values_str.endswith("]"):
-                        required_values_str = required_values_str[1:-1]
-                    required_values = [
-                        value.strip().strip("'\"")
-                        for value in required_values_str.split(",")
-                        if value.strip()
-                    ]
-
-                    if isinstance(actual_value, (list, tuple, set)):
-                        actual_values = {str(value) for value in actual_value}
-                        result = any(
-                            value in actual_values for value in required_values
-                        )
-                    else:
-                        result = str(actual_value) in required_values
-
-                    _LOGGER.debug(
-                        "Evaluating condition '%s': variable=%s, required=%s, actual=%s, result=%s",
-                        condition,
-                        variable_name,
-                        required_values,
-                        actual_value,
-                        result,
-                    )
-                    return result
-            except (ValueError, IndexError) as e:
-                _LOGGER.warning("Invalid condition '%s': %s", condition, str(e))
-                return False
-        elif "!=" in condition:
-            try:
-                parts = condition.split("!=")
-                if len(parts) == 2:
-                    variable_name = parts[0].strip()
-                    required_value_str = parts[1].strip().strip("'\"")
-
-                    actual_value = dynamic_config.get(variable_name)
-
-                    if required_value_str.lower() in ["true", "false"]:
-                        required_value = required_value_str.lower() == "true"
-                        actual_value = (
-                            bool(actual_value) if actual_value is not None else False
-                        )
-                    else:
-                        try:
-                            required_value = int(required_value_str)
-                            actual_value = (
-                                int(actual_value) if actual_value is not None else 0
-                            )
-                        except (ValueError, TypeError):
-                            required_value = required_value_str
-                            actual_value = (
-                                str(actual_value) if actual_value is not None else ""
-                            )
-
-                    result = actual_value != required_value
-                    _LOGGER.debug(
-                        "Evaluating condition '%s': variable=%s, required=%s, actual=%s, result=%s",
-                        condition,
-                        variable_name,
-                        required_value,
-                        actual_value,
-                        result,
-                    )
-                    return result
-            except (ValueError, IndexError) as e:
-                _LOGGER.warning("Invalid condition '%s': %s", condition, str(e))
-                return False
-        elif "==" in condition:
-            try:
-                parts = condition.split("==")
-                if len(parts) == 2:
-                    variable_name = parts[0].strip()
-                    required_value_str = parts[1].strip().strip("'\"")
-
-                    actual_value = dynamic_config.get(variable_name)
-
-                    if required_value_str.lower() in ["true", "false"]:
-                        required_value = required_value_str.lower() == "true"
-                        actual_value = (
-                            bool(actual_value) if actual_value is not None else False
-                        )
-                    else:
-                        try:
-                            required_value = int(required_value_str)
-                            actual_value = (
-                                int(actual_value) if actual_value is not None else 0
-                            )
-                        except (ValueError, TypeError):
-                            required_value = required_value_str
-                            actual_value = (
-                                str(actual_value) if actual_value is not None else ""
-                            )
-
-                    result = actual_value == required_value
-                    _LOGGER.debug(
-                        "Evaluating condition '%s': variable=%s, required=%s, actual=%s, result=%s",
-                        condition,
-                        variable_name,
-                        required_value,
-                        actual_value,
-                        result,
-                    )
-                    return result
-            except (ValueError, IndexError) as e:
-                _LOGGER.warning("Invalid condition '%s': %s", condition, str(e))
-                return False
-        elif ">=" in condition:
-            try:
-                parts = condition.split(">=")
-                if len(parts) == 2:
-                    variable_name = parts[0].strip()
-                    required_value_str = parts[1].strip()
-
-                    try:
-                        required_value = int(required_value_str)
-                        actual_value = dynamic_config.get(variable_name, 0)
-                        if isinstance(actual_value, str):
-                            actual_value = int(actual_value)
-                        return actual_value >= required_value
-                    except ValueError:
-                        return False
-            except (ValueError, IndexError) as e:
-                _LOGGER.warning("Invalid condition '%s': %s", condition, str(e))
-                return False
-
-        _LOGGER.warning("Unknown condition format '%s', including entity", condition)
-        return True
-
     def _get_register_range_debug_info(self, range_obj) -> str:
         """Build debug string with entity names/ids for a register range."""
         names = []
@@ -1972,6 +2631,24 @@ class ModbusCoordinator(DataUpdateCoordinator):
             return f"Modbus error ({exc_name})"
         return f"{exc_name}: {str(e)}"
 
+    def _resolve_read_call_type(self, register: Dict[str, Any]) -> str:
+        """Return the pymodbus call type for reading a register config."""
+        register_type = register.get("input_type", "holding")
+
+        # Check for custom read function code
+        read_function_code = register.get("read_function_code")
+        if read_function_code:
+            from .modbus_utils import get_read_call_type
+
+            return get_read_call_type(register_type, read_function_code)
+
+        # Auto-detect based on input_type
+        return (
+            CALL_TYPE_REGISTER_INPUT
+            if register_type == "input"
+            else CALL_TYPE_REGISTER_HOLDING
+        )
+
     async def _read_register_range(self, range_obj) -> Optional[List[int]]:
         """Read a range of registers from Modbus."""
         register_type = "unknown"
@@ -1997,26 +2674,7 @@ class ModbusCoordinator(DataUpdateCoordinator):
                 )
 
             register_type = range_obj.registers[0].get("input_type", "holding")
-
-            # Check for custom read function code
-            read_function_code = range_obj.registers[0].get("read_function_code")
-            if read_function_code:
-                from .modbus_utils import get_read_call_type
-
-                call_type = get_read_call_type(register_type, read_function_code)
-                _LOGGER.debug(
-                    "Using custom read function code %d for register range %d-%d",
-                    read_function_code,
-                    range_obj.start_address,
-                    range_obj.end_address,
-                )
-            else:
-                # Auto-detect based on input_type
-                call_type = (
-                    CALL_TYPE_REGISTER_INPUT
-                    if register_type == "input"
-                    else CALL_TYPE_REGISTER_HOLDING
-                )
+            call_type = self._resolve_read_call_type(range_obj.registers[0])
 
             # Get slave ID from first register
             slave_id = range_obj.registers[0].get("slave_id", 1)
@@ -2033,13 +2691,21 @@ class ModbusCoordinator(DataUpdateCoordinator):
                     slave_id,
                 )
 
-            # Read registers
-            result = await self.hub.async_pb_call(
+            # Read registers (span incl. bridged padding words); the timed
+            # round-trip feeds the cost-model planner
+            request_started = asyncio.get_running_loop().time()
+            result = await self._async_call_read(
                 slave_id,
                 range_obj.start_address,
-                range_obj.register_count,
+                range_obj.count,
                 call_type,
             )
+            self.performance_monitor.record_request(
+                f"{self.entry.data.get('prefix', 'unknown')}:{slave_id}",
+                range_obj.count,
+                asyncio.get_running_loop().time() - request_started,
+                bool(result and hasattr(result, "registers")),
+            )
 
             if not result or not hasattr(result, "registers"):
                 # Check if coordinator is being unloaded/reloaded
@@ -2103,57 +2769,94 @@ class ModbusCoordinator(DataUpdateCoordinator):
             )
             return None
 
-    def _distribute_data(self, raw_data: List[int], range_obj) -> None:
-        """Distribute raw register data to individual registers."""
+    def _distribute_data(self, raw_data: List[int], range_obj) -> int:
+        """Distribute raw register data to individual registers.
+
+        Registers whose raw words equal the words their current register_data
+        entry was decoded from are not decoded again. The comparison is per
+        register, so reads of the same register through other ranges (other
+        interval sets, post-write readback) are taken into account.
+
+        Returns:
+            Number of registers skipped because their words were unchanged.
+        """
+        start_address = range_obj.start_address
+        register_words: List[tuple] = []
+        unchanged_flags: List[bool] = []
+        for register in range_obj.registers:
+            offset = register.get("address", 0) - start_address
+            end = register_end_address(register) - start_address
+            words = tuple(raw_data[offset : end + 1])
+            record = self.register_data.get(self._create_register_key(register))
+            register_words.append(words)
+            unchanged_flags.append(
+                record is not None
+                and record.register_config is register
+                and record.raw_words == words
+            )
+        unchanged = sum(unchanged_flags)
+        if unchanged == len(range_obj.registers):
+            return unchanged
+
+        timestamp = asyncio.get_running_loop().time()
+        decoded = RangeDecoder.for_range(range_obj).decode(raw_data)
         try:
-            for register in range_obj.registers:
+            for index, register in enumerate(range_obj.registers):
+                if unchanged_flags[index]:
+                    continue
                 try:
-                    # Extract value for this register
-                    processed_value = self.register_optimizer.get_register_value(
-                        register, raw_data, range_obj.start_address
-                    )
-
                     # Create unique key for this register
                     register_key = self._create_register_key(register)
 
-                    # Process value with mapping (for display)
-                    mapped_value = self._process_register_value(
-                        processed_value, register
-                    )
+                    if decoded is not None:
+                        # Batch-decoded: only scale/offset/mapping remain
+                        processed_value, typed_value = decoded[index]
+                        mapped_value = self._finish_register_value(
+                            typed_value, register
+                        )
+                    else:
+                        # Extract value for this register
+                        processed_value = self.register_optimizer.get_register_value(
+                            register, raw_data, range_obj.start_address
+                        )
+                        typed_value = None
+                        # Process value with mapping (for display)
+                        mapped_value = self._process_register_value(
+                            processed_value, register
+                        )
 
                     # For registers with flags/mapping, also keep numeric value
                     # This allows templates to use bitwise operations on the numeric value
-                    has_mapping = bool(
-                        register.get("map")
-                        or register.get("options")
-                        or register.get("flags")
-                    )
                     numeric_value = None
-                    if has_mapping:
-                        from .value_processor import coerce_numeric_register_value
-
-                        numeric_config = register.copy()
-                        numeric_config.pop("map", None)
-                        numeric_config.pop("flags", None)
-                        numeric_config.pop("options", None)
+                    if self._get_value_pipelines(register)[1] is not None:
                         # uint32/int32 values arrive as register lists from the optimizer;
                         # decode via coordinator (swap/byte_order) without flag/map labels
-                        numeric_value = self._process_register_value(
-                            processed_value, numeric_config
-                        )
+                        if decoded is not None:
+                            numeric_value = self._finish_register_value(
+                                typed_value, register, numeric=True
+                            )
+                        else:
+                            numeric_value = self._process_register_value(
+                                processed_value, register, numeric=True
+                            )
                         if not isinstance(numeric_value, (int, float)):
                             numeric_value = coerce_numeric_register_value(numeric_value)
 
-                    # Store processed data
-                    register_data = {
-                        "raw_value": processed_value,
-                        "processed_value": mapped_value,
-                        "register_config": register,
-                        "timestamp": asyncio.get_running_loop().time(),
-                    }
-                    if numeric_value is not None:
-                        register_data["numeric_value"] = numeric_value
-                    self.register_data[register_key] = register_data
+                    # Update the register's record in place
+                    record = self.register_data.get(register_key)
+                    if record is None or record.register_config is not register:
+                        record = RegisterValue(register)
+                        self.register_data[register_key] = record
+                        self._changed_keys.add(register_key)
+                        self._index_register_key(register_key, register)
+                    if record.set_value(
+                        processed_value,
+                        mapped_value,
+                        numeric_value,
+                        timestamp,
+                        register_words[index],
+                    ):
+                        self._changed_keys.add(register_key)
 
                 except Exception as e:
                     _LOGGER.error(
@@ -2165,11 +2868,15 @@ class ModbusCoordinator(DataUpdateCoordinator):
         except Exception as e:
             _LOGGER.error("Error distributing data: %s", str(e))
 
+        return unchanged
+
     def _create_register_key(self, register: Dict[str, Any]) -> str:
         """Create unique key for register."""
         return f"{register.get('unique_id', 'unknown')}_{register.get('address', 0)}"
 
-    def _process_register_value(self, raw_value: Any, register: Dict[str, Any]) -> Any:
+    def _process_register_value(
+        self, raw_value: Any, register: Dict[str, Any], numeric: bool = False
+    ) -> Any:
         """Process register value according to register configuration."""
         try:
             if raw_value is None:
@@ -2268,27 +2975,7 @@ class ModbusCoordinator(DataUpdateCoordinator):
                     # Default: return as-is
                     processed_value = raw_value
 
-            # Use centralized value processing (handles scale, offset, bit ops, precision, mapping)
-            # Note: For select entities, skip mapping as they need raw numeric values
-            apply_mapping = register.get("type") != "select"
-
-            if apply_mapping:
-                # Full processing: scale, offset, bit ops, precision, mapping
-                processed_value = process_register_value(
-                    processed_value, register, apply_precision=True
-                )
-            else:
-                # For select: only scale, offset, precision (no mapping, no bit ops)
-                scale = register.get("scale", 1.0)
-                offset = register.get("offset", 0.0)
-                if isinstance(processed_value, (int, float)):
-                    processed_value = (processed_value * scale) + offset
-
-                precision = register.get("precision")
-                if precision is not None and isinstance(processed_value, (int, float)):
-                    processed_value = round(processed_value, precision)
-
-            return processed_value
+            return self._finish_register_value(processed_value, register, numeric)
 
         except Exception as e:
             _LOGGER.error(
@@ -2300,10 +2987,127 @@ class ModbusCoordinator(DataUpdateCoordinator):
             )
             return None
 
+    def _finish_register_value(
+        self, value: Any, register: Dict[str, Any], numeric: bool = False
+    ) -> Any:
+        """Apply the register's compiled value pipeline to a decoded value.
+
+        numeric=True uses the pipeline without map/flags/options labels.
+        """
+        try:
+            if value is None:
+                return None
+            display_pipeline, numeric_pipeline = self._get_value_pipelines(register)
+            if numeric and numeric_pipeline is not None:
+                return numeric_pipeline(value)
+            return display_pipeline(value)
+
+        except Exception as e:
+            _LOGGER.error(
+                "Error processing value for register %s (value: %s): %s",
+                register.get("name", "unknown"),
+                value,
+                str(e),
+            )
+            return None
+
+    def _get_value_pipelines(
+        self, register: Dict[str, Any]
+    ) -> Tuple[ValuePipeline, Optional[ValuePipeline]]:
+        """Return the (display, numeric) pipelines of a register, compiling once.
+
+        The numeric pipeline (without map/flags/options labels) is None for
+        registers without a mapping.
+        """
+        cached = self._value_pipelines.get(id(register))
+        if cached is None or cached[0] is not register:
+            numeric_pipeline = None
+            if register.get("map") or register.get("options") or register.get("flags"):
+                numeric_pipeline = self._compile_value_pipeline(
+                    {
+                        key: value
+                        for key, value in register.items()
+                        if key not in ("map", "flags", "options")
+                    }
+                )
+            cached = (
+                register,
+                self._compile_value_pipeline(register),
+                numeric_pipeline,
+            )
+            self._value_pipelines[id(register)] = cached
+        return cached[1], cached[2]
+
+    @staticmethod
+    def _compile_value_pipeline(register: Dict[str, Any]) -> ValuePipeline:
+        """Compile scale, offset, bit operations, precision and mapping of a register."""
+        # Use centralized value processing (handles scale, offset, bit ops, precision, mapping)
+        # Note: For select entities, skip mapping as they need raw numeric values
+        if register.get("type") != "select":
+            return compile_value_pipeline(register, apply_precision=True)
+
+        # For select: only scale, offset, precision (no mapping, no bit ops)
+        scale = register.get("scale", 1.0)
+        offset = register.get("offset", 0.0)
+        precision = register.get("precision")
+
+        def select_pipeline(value: Any) -> Any:
+            if isinstance(value, (int, float)):
+                value = (value * scale) + offset
+                if precision is not None:
+                    value = round(value, precision)
+            return value
+
+        return select_pipeline
+
     def get_register_data(self, register_key: str) -> Optional[Dict[str, Any]]:
         """Get data for a specific register."""
         return self.register_data.get(register_key)
 
+    def _index_register_key(self, register_key: str, register: Dict[str, Any]) -> None:
+        """Add a register_data key to the unique_id index."""
+        unique_id = str(register.get("unique_id") or "").lower()
+        if unique_id:
+            self._register_keys_by_unique_id.setdefault(unique_id, register_key)
+        self._register_key_lookups.clear()
+
+    def get_register_data_by_unique_id(self, unique_id: str) -> Optional[RegisterValue]:
+        """Get data for a register by its unique_id (case-insensitive)."""
+        register_key = self._register_keys_by_unique_id.get(str(unique_id).lower())
+        return self.register_data.get(register_key) if register_key else None
+
+    def find_register_key(
+        self, fragment: str, case_sensitive: bool = False
+    ) -> Optional[str]:
+        """Return the register_data key for a unique_id or unique_id fragment.
+
+        An exact unique_id match is answered from the index. Otherwise the first
+        key containing the fragment (e.g. a role suffix such as
+        "inverter_firmware_info") is searched once and memoised until new
+        registers appear.
+        """
+        fragment = str(fragment)
+        register_key = self._register_keys_by_unique_id.get(fragment.lower())
+        if register_key is not None and (
+            not case_sensitive or fragment in register_key
+        ):
+            return register_key
+
+        lookup = (fragment, case_sensitive)
+        if lookup in self._register_key_lookups:
+            return self._register_key_lookups[lookup]
+        needle = fragment if case_sensitive else fragment.lower()
+        register_key = next(
+            (
+                key
+                for key in self.register_data
+                if needle in (key if case_sensitive else key.lower())
+            ),
+            None,
+        )
+        self._register_key_lookups[lookup] = register_key
+        return register_key
+
     def get_all_register_data(self) -> Dict[str, Any]:
         """Get all register data."""
         return self.register_data.copy()
@@ -2319,7 +3123,7 @@ class ModbusCoordinator(DataUpdateCoordinator):
             if not isinstance(interval, (int, float)):
                 interval = 30
 
-            interval = int(interval)  # Ensure it's an integer
+            interval = max(1, int(interval))  # Whole seconds, at least 1
 
             if interval not in grouped:
                 grouped[interval] = []
@@ -2327,54 +3131,65 @@ class ModbusCoordinator(DataUpdateCoordinator):
 
         return grouped
 
-    def _get_registers_due_for_update(self) -> List[Dict[str, Any]]:
-        """Get registers that are due for update based on their scan_interval."""
-        try:
-            if not self._cached_registers_by_interval:
-                return []
-
-            current_time = asyncio.get_running_loop().time()
-            registers_to_read = []
-
-            # Track which intervals are being updated
-            intervals_to_update = []
-
-            for interval, registers in self._cached_registers_by_interval.items():
-                last_update = self._last_update_time.get(interval, 0)
-                time_since_update = current_time - last_update
+    def _get_due_intervals(self) -> FrozenSet[int]:
+        """Return the scan_intervals whose deadline has been reached."""
+        if not self._cached_registers_by_interval:
+            return frozenset()
 
-                # Check if this interval group is due for update
-                if time_since_update >= interval:
-                    registers_to_read.extend(registers)
-                    intervals_to_update.append((interval, len(registers)))
+        horizon = asyncio.get_running_loop().time() + _DEADLINE_COALESCE_S
+        return frozenset(
+            interval
+            for interval in self._cached_registers_by_interval
+            if self._next_due_time.get(interval, 0) <= horizon
+        )
 
-            return registers_to_read
+    def _advance_deadlines(self, intervals: FrozenSet[int], started: float) -> None:
+        """Move read groups to their next deadline and record their lateness.
 
-        except Exception as e:
-            _LOGGER.error("Error determining registers due for update: %s", str(e))
-            # Fallback: return all registers
-            return [
-                reg
-                for regs in self._cached_registers_by_interval.values()
-                for reg in regs
-            ]
+        Deadlines stay on the group's grid (epoch + phase + n * interval), so
+        groups do not drift; a group that fell a full interval behind skips to
+        the next grid point instead of catching up in a burst.
+        """
+        device_id = self.entry.data.get("prefix", "unknown")
+        for interval in intervals:
+            scheduled = self._next_due_time.get(interval, started)
+            self.performance_monitor.record_lateness(
+                device_id, interval, started - scheduled
+            )
+            base = self._schedule_epoch + self._group_phase.get(interval, 0)
+            periods = math.floor((max(started, scheduled) - base) / interval) + 1
+            self._next_due_time[interval] = base + periods * interval
+
+    def _schedule_next_update(self) -> None:
+        """Sleep exactly until the earliest interval group is due."""
+        if not self._next_due_time:
+            self._schedule_refresh_in(_IDLE_UPDATE_DELAY_S)
+            return
+        delay = min(self._next_due_time.values()) - asyncio.get_running_loop().time()
+        self._schedule_refresh_in(max(_MIN_UPDATE_DELAY_S, delay))
 
-    def _update_coordinator_interval(self, interval: int) -> None:
-        """Update the coordinator's update interval to match minimum scan_interval."""
-        try:
-            new_interval = timedelta(seconds=interval)
-            current_interval = self.update_interval
+    def _schedule_refresh_in(self, delay: float) -> None:
+        """Run the next refresh after delay seconds (replaces a pending one)."""
+        self._cancel_deadline_timer()
+        if self._is_unloading:
+            return
+        loop = asyncio.get_running_loop()
+        self._deadline_timer = loop.call_at(
+            loop.time() + delay, self._async_handle_deadline
+        )
 
-            # Only update if the new interval is different
-            if new_interval != current_interval:
-                self.update_interval = new_interval
-                _LOGGER.debug(
-                    "Updated coordinator update interval to %s",
-                    new_interval,
-                )
+    def _cancel_deadline_timer(self) -> None:
+        if self._deadline_timer is not None:
+            self._deadline_timer.cancel()
+            self._deadline_timer = None
 
-        except Exception as e:
-            _LOGGER.error("Error updating coordinator interval: %s", str(e))
+    @callback
+    def _async_handle_deadline(self) -> None:
+        """Refresh when the scheduled deadline is reached."""
+        self._deadline_timer = None
+        if self._is_unloading:
+            return
+        self.hass.async_create_task(self.async_refresh())
 
     _FIRMWARE_REGISTER_ROLES = {
         "inverter_firmware_info": "inverter",
@@ -2383,12 +3198,7 @@ class ModbusCoordinator(DataUpdateCoordinator):
 
     def _extract_firmware_register_value(self, key_substring: str) -> Optional[str]:
         """Return the cleaned live string for a firmware register, if available."""
-        firmware_key = None
-        for key in self.register_data.keys():
-            if key_substring in key.lower():
-                firmware_key = key
-                break
-
+        firmware_key = self.find_register_key(key_substring)
         if not firmware_key:
             return None
 
@@ -2396,8 +3206,8 @@ class ModbusCoordinator(DataUpdateCoordinator):
         if not firmware_value or firmware_value in ["unknown", "unavailable", None, ""]:
             return None
 
-        # Extract processed_value if firmware_value is a dictionary
-        if isinstance(firmware_value, dict):
+        # Extract processed_value if firmware_value is a register record
+        if isinstance(firmware_value, Mapping):
             firmware_value = firmware_value.get("processed_value")
             if not firmware_value:
                 return None
@@ -2470,7 +3280,10 @@ class ModbusCoordinator(DataUpdateCoordinator):
         """Shutdown the coordinator."""
         _LOGGER.debug("Shutting down ModbusCoordinator")
         # Cancel any pending updates
+        self._cancel_deadline_timer()
         if hasattr(self, "_update_task") and self._update_task:
             self._update_task.cancel()
         # Clear data
         self.register_data.clear()
+        self._register_keys_by_unique_id.clear()
+        self._register_key_lookups.clear()
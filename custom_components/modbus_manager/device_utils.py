@@ -423,11 +423,13 @@ def _coerce_compare_value(value: Any) -> Any:
 def is_register_dependency_met(
     coordinator_data: Optional[dict],
     dependency: Optional[dict],
+    coordinator: Any = None,
 ) -> bool:
     """True if depends_on_register is unset, unmet data is missing (fail open), or value matches.
 
     ``required_value`` or ``required_values`` (list) are accepted. Mapped select
-    states are compared via ``numeric_value`` when present.
+    states are compared via ``numeric_value`` when present. Pass the coordinator
+    to resolve the register through its unique_id index instead of a scan.
     """
     if not dependency:
         return True
@@ -449,10 +451,16 @@ def is_register_dependency_met(
     if dep_address is not None:
         register_data = coordinator_data.get(f"{dep_register_id}_{dep_address}")
     if not register_data:
-        for register_key, data in coordinator_data.items():
-            if dep_register_id in str(register_key):
-                register_data = data
-                break
+        if hasattr(coordinator, "find_register_key"):
+            register_key = coordinator.find_register_key(
+                dep_register_id, case_sensitive=True
+            )
+            register_data = coordinator_data.get(register_key) if register_key else None
+        else:
+            for register_key, data in coordinator_data.items():
+                if dep_register_id in str(register_key):
+                    register_data = data
+                    break
     if not register_data:
         return True
 
@@ -0,0 +1,339 @@
+"""Compile simple calculated-entity templates to Python closures."""
+
+from __future__ import annotations
+
+import operator
+import re
+from ast import literal_eval
+from typing import Any, Callable, Dict, List, Optional
+
+from homeassistant.core import valid_entity_id
+from jinja2 import Environment, TemplateSyntaxError, nodes
+
+from .logger import ModbusManagerLogger
+
+_LOGGER = ModbusManagerLogger(__name__)
+
+Evaluator = Callable[[Any], Any]
+
+# Only used to parse templates into an AST (nothing is rendered with it)
+_PARSER = Environment(autoescape=True)
+_MISSING = object()
+_STATE_UNKNOWN = "unknown"
+
+# Same test HA uses to decide whether a rendered number is returned as number
+_IS_NUMERIC = re.compile(r"^[+-]?(?!0\d)\d*(?:\.\d*)?$")
+
+_BINARY_OPS = {
+    nodes.Add: operator.add,
+    nodes.Sub: operator.sub,
+    nodes.Mul: operator.mul,
+    nodes.Div: operator.truediv,
+    nodes.FloorDiv: operator.floordiv,
+    nodes.Mod: operator.mod,
+    nodes.Pow: operator.pow,
+}
+_COMPARE_OPS = {
+    "eq": operator.eq,
+    "ne": operator.ne,
+    "gt": operator.gt,
+    "gteq": operator.ge,
+    "lt": operator.lt,
+    "lteq": operator.le,
+    "in": lambda a, b: a in b,
+    "notin": lambda a, b: a not in b,
+}
+
+# Source -> compiled expression (None: needs Jinja)
+_COMPILED: Dict[str, Optional[CompiledExpression]] = {}
+
+
+class UnsupportedExpression(Exception):
+    """Template uses syntax outside the compiled subset."""
+
+
+class CompiledExpression:
+    """A template of the form ``{{ expression }}`` compiled to a closure.
+
+    Supported: literals and lists, ``states('entity_id')``, arithmetic,
+    comparisons (incl. ``in``), ``and``/``or``/``not``, ``a if c else b``,
+    ``min``/``max`` and the ``float``, ``int``, ``round``, ``abs``, ``min``
+    and ``max`` filters. The result is converted like HA's ``async_render``
+    (rendered to text, then parsed back to a number/bool where HA would).
+    """
+
+    __slots__ = ("source", "_evaluate", "fallback_logged")
+
+    def __init__(self, source: str, evaluate: Evaluator) -> None:
+        self.source = source
+        self._evaluate = evaluate
+        # Set once a render fell back to Jinja (logged only the first time)
+        self.fallback_logged = False
+
+    def async_render(self, hass: Any) -> Any:
+        """Evaluate against the current states; raises if Jinja is needed."""
+        return _as_rendered(self._evaluate(hass))
+
+
+def compile_expression(source: Optional[str]) -> Optional[CompiledExpression]:
+    """Return a compiled expression, or None if the template needs Jinja."""
+    if not source or not isinstance(source, str):
+        return None
+    if source in _COMPILED:
+        return _COMPILED[source]
+    try:
+        compiled: Optional[CompiledExpression] = CompiledExpression(
+            source, _compile_template(source)
+        )
+    except (UnsupportedExpression, TemplateSyntaxError) as e:
+        _LOGGER.debug("Template rendered with Jinja (%s): %s", e, source)
+        compiled = None
+    # Sources with unresolved [[mm:…]] markers are temporary
+    if "[[mm:" not in source:
+        _COMPILED[source] = compiled
+    return compiled
+
+
+def get_expression_stats() -> Dict[str, int]:
+    """Return how many distinct templates use the compiled path and Jinja."""
+    fast_path = sum(1 for compiled in _COMPILED.values() if compiled is not None)
+    return {"fast_path": fast_path, "jinja": len(_COMPILED) - fast_path}
+
+
+def _as_rendered(value: Any) -> Any:
+    """Convert a value like Jinja output followed by HA result parsing."""
+    value_type = type(value)
+    if value_type is bool or value_type is int or value is None:
+        return value
+    if value_type is float:
+        text = str(value)
+        return value if _IS_NUMERIC.match(text) else text
+    if value_type is not str:
+        raise UnsupportedExpression(f"result type {value_type.__name__}")
+    text = value.strip()
+    try:
+        result = literal_eval(text)
+    except (ValueError, TypeError, SyntaxError, MemoryError):
+        return text
+    if isinstance(result, (list, dict, set, tuple)):
+        raise UnsupportedExpression("collection result")
+    if not isinstance(result, (str, complex)) and (
+        not isinstance(result, (int, float))
+        or isinstance(result, bool)
+        or _IS_NUMERIC.match(text) is not None
+    ):
+        return result
+    return text
+
+
+def _compile_template(source: str) -> Evaluator:
+    body = _PARSER.parse(source).body
+    if len(body) != 1 or not isinstance(body[0], nodes.Output):
+        raise UnsupportedExpression("not a single output")
+    expressions = []
+    for node in body[0].nodes:
+        if isinstance(node, nodes.TemplateData):
+            if node.data.strip():
+                raise UnsupportedExpression("literal text around expression")
+        else:
+            expressions.append(node)
+    if len(expressions) != 1:
+        raise UnsupportedExpression("not a single expression")
+    return _compile_node(expressions[0])
+
+
+def _constant_args(args: List[nodes.Expr], what: str) -> List[Any]:
+    if not all(isinstance(arg, nodes.Const) for arg in args):
+        raise UnsupportedExpression(f"non-constant {what} argument")
+    return [arg.value for arg in args]
+
+
+def _compile_node(node: nodes.Node) -> Evaluator:
+    if isinstance(node, nodes.Const):
+        value = node.value
+        return lambda hass: value
+
+    if isinstance(node, (nodes.List, nodes.Tuple)):
+        items = [_compile_node(item) for item in node.items]
+        if isinstance(node, nodes.Tuple):
+            return lambda hass: tuple(item(hass) for item in items)
+        return lambda hass: [item(hass) for item in items]
+
+    if isinstance(node, nodes.Call):
+        return _compile_call(node)
+
+    if isinstance(node, nodes.Filter):
+        return _compile_filter(node)
+
+    binary_op = _BINARY_OPS.get(type(node))
+    if binary_op is not None:
+        left, right = _compile_node(node.left), _compile_node(node.right)
+        return lambda hass: binary_op(left(hass), right(hass))
+
+    if isinstance(node, nodes.And):
+        left, right = _compile_node(node.left), _compile_node(node.right)
+        return lambda hass: left(hass) and right(hass)
+
+    if isinstance(node, nodes.Or):
+        left, right = _compile_node(node.left), _compile_node(node.right)
+        return lambda hass: left(hass) or right(hass)
+
+    if isinstance(node, nodes.Not):
+        operand = _compile_node(node.node)
+        return lambda hass: not operand(hass)
+
+    if isinstance(node, nodes.Neg):
+        operand = _compile_node(node.node)
+        return lambda hass: -operand(hass)
+
+    if isinstance(node, nodes.Pos):
+        operand = _compile_node(node.node)
+        return lambda hass: +operand(hass)
+
+    if isinstance(node, nodes.Compare):
+        return _compile_compare(node)
+
+    if isinstance(node, nodes.CondExpr):
+        if node.expr2 is None:
+            raise UnsupportedExpression("conditional without else")
+        test = _compile_node(node.test)
+        then, otherwise = _compile_node(node.expr1), _compile_node(node.expr2)
+        return lambda hass: then(hass) if test(hass) else otherwise(hass)
+
+    raise UnsupportedExpression(type(node).__name__)
+
+
+def _compile_compare(node: nodes.Compare) -> Evaluator:
+    first = _compile_node(node.expr)
+    operands = []
+    for operand in node.ops:
+        if operand.op not in _COMPARE_OPS:
+            raise UnsupportedExpression(f"comparison {operand.op}")
+        operands.append((_COMPARE_OPS[operand.op], _compile_node(operand.expr)))
+
+    def compare(hass: Any) -> bool:
+        left = first(hass)
+        for compare_op, right_node in operands:
+            right = right_node(hass)
+            if not compare_op(left, right):
+                return False
+            left = right
+        return True
+
+    return compare
+
+
+def _compile_call(node: nodes.Call) -> Evaluator:
+    if (
+        not isinstance(node.node, nodes.Name)
+        or node.kwargs
+        or node.dyn_args is not None
+        or node.dyn_kwargs is not None
+    ):
+        raise UnsupportedExpression("call")
+    name = node.node.name
+
+    if name == "states":
+        entity_ids = _constant_args(node.args, "states")
+        if len(entity_ids) != 1 or not isinstance(entity_ids[0], str):
+            raise UnsupportedExpression("states() needs one entity_id")
+        entity_id = entity_ids[0]
+        if not valid_entity_id(entity_id):
+            # Jinja raises for invalid ids (e.g. unresolved [[mm:…]] markers)
+            raise UnsupportedExpression(f"invalid entity_id {entity_id}")
+
+        def states(hass: Any) -> str:
+            state = hass.states.get(entity_id)
+            return _STATE_UNKNOWN if state is None else state.state
+
+        return states
+
+    if name in ("min", "max") and node.args:
+        builtin = min if name == "min" else max
+        args = [_compile_node(arg) for arg in node.args]
+        if len(args) == 1:
+            return lambda hass: _numeric_min_max(builtin, args[0](hass))
+        return lambda hass: _numeric_min_max(builtin, [arg(hass) for arg in args])
+
+    raise UnsupportedExpression(f"function {name}")
+
+
+def _numeric_min_max(builtin: Callable, values: Any) -> Any:
+    # Jinja compares strings case-insensitively; leave those to Jinja
+    values = list(values)
+    if any(isinstance(value, str) for value in values):
+        raise UnsupportedExpression("min/max of strings")
+    return builtin(values)
+
+
+def _compile_filter(node: nodes.Filter) -> Evaluator:
+    if node.node is None or node.dyn_args is not None or node.dyn_kwargs is not None:
+        raise UnsupportedExpression("filter")
+    value_node = _compile_node(node.node)
+    args = _constant_args(node.args, node.name)
+    kwargs = {
+        keyword.key: value
+        for keyword, value in zip(
+            node.kwargs, _constant_args([k.value for k in node.kwargs], node.name)
+        )
+    }
+    name = node.name
+
+    if name == "float" and len(args) <= 1 and set(kwargs) <= {"default"}:
+        default = args[0] if args else kwargs.get("default", _MISSING)
+
+        def to_float(hass: Any) -> Any:
+            value = value_node(hass)
+            try:
+                return float(value)
+            except (ValueError, TypeError):
+                if default is _MISSING:
+                    raise
+                return default
+
+        return to_float
+
+    if name == "int" and len(args) <= 1 and set(kwargs) <= {"default"}:
+        default = args[0] if args else kwargs.get("default", _MISSING)
+
+        def to_int(hass: Any) -> Any:
+            value = value_node(hass)
+            try:
+                return int(value, 10) if isinstance(value, str) else int(value)
+            except (ValueError, TypeError):
+                pass
+            try:
+                return int(float(value))
+            except (ValueError, TypeError):
+                if default is _MISSING:
+                    raise
+                return default
+
+        return to_int
+
+    if name == "round" and len(args) <= 1 and set(kwargs) <= {"default"}:
+        precision = args[0] if args else 0
+        default = kwargs.get("default", _MISSING)
+        if not isinstance(precision, int) or isinstance(precision, bool):
+            raise UnsupportedExpression("round precision")
+
+        def to_round(hass: Any) -> Any:
+            value = value_node(hass)
+            try:
+                value = round(float(value), precision)
+                return int(value) if precision == 0 else value
+            except (ValueError, TypeError):
+                if default is _MISSING:
+                    raise
+                return default
+
+        return to_round
+
+    if name == "abs" and not args and not kwargs:
+        return lambda hass: abs(value_node(hass))
+
+    if name in ("min", "max") and not args and not kwargs:
+        builtin = min if name == "min" else max
+        return lambda hass: _numeric_min_max(builtin, value_node(hass))
+
+    raise UnsupportedExpression(f"filter {name}")
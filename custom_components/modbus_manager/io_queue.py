@@ -0,0 +1,142 @@
+"""Prioritised access to the Modbus connection."""
+
+from __future__ import annotations
+
+import asyncio
+import heapq
+import itertools
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Dict, Hashable, List, Optional, Tuple
+
+from .logger import ModbusManagerLogger
+
+_LOGGER = ModbusManagerLogger(__name__)
+
+# Lower value = served first
+PRIORITY_WRITE = 0
+PRIORITY_FAST_READ = 1
+PRIORITY_SLOW_READ = 2
+
+# Pause before a request that addresses a different slave than the last one
+DEFAULT_SLAVE_TURNAROUND_S = 0.05
+
+
+class PriorityIOQueue:
+    """Mutex for Modbus I/O that hands the bus to the most urgent waiter.
+
+    Callers hold a slot for one request (or one write incl. settle and
+    readback) and release it afterwards, so a control write waits for at
+    most one in-flight read instead of a whole poll cycle.
+
+    One queue is shared by all coordinators on the same host:port. Within a
+    priority, clients (config entries) are served round-robin so one entry's
+    long poll cycle cannot starve another, and a turnaround pause is kept
+    whenever the addressed slave changes.
+    """
+
+    def __init__(self, slave_turnaround: float = 0.0) -> None:
+        self.slave_turnaround = max(0.0, slave_turnaround)
+        self._locked = False
+        self._waiters: List[Tuple[int, int, int, asyncio.Future, Hashable]] = []
+        self._sequence = itertools.count()
+        self._client_rounds: Dict[Hashable, int] = {}
+        self._client_grants: Dict[Hashable, int] = {}
+        self._current_round = 0
+        self._last_slave: Optional[int] = None
+        self._last_release = 0.0
+
+    @property
+    def locked(self) -> bool:
+        """Return True while a slot is held."""
+        return self._locked
+
+    def _next_round(self, client: Hashable) -> int:
+        """Round-robin position of a client's next request."""
+        round_ = max(self._client_rounds.get(client, 0), self._current_round)
+        self._client_rounds[client] = round_ + 1
+        return round_
+
+    def _grant(self, round_: int, client: Hashable) -> None:
+        self._current_round = max(self._current_round, round_)
+        self._client_grants[client] = self._client_grants.get(client, 0) + 1
+
+    async def acquire(self, priority: int, client: Hashable = None) -> None:
+        """Wait until the bus is granted to this caller."""
+        round_ = self._next_round(client)
+        if not self._locked and not self._waiters:
+            self._locked = True
+            self._grant(round_, client)
+            return
+        future = asyncio.get_running_loop().create_future()
+        heapq.heappush(
+            self._waiters,
+            (priority, round_, next(self._sequence), future, client),
+        )
+        try:
+            await future
+        except asyncio.CancelledError:
+            # Granted just before cancellation: pass the bus on
+            if future.done() and not future.cancelled():
+                self.release()
+            raise
+        self._grant(round_, client)
+
+    def release(self) -> None:
+        """Hand the bus to the next waiter, or unlock it."""
+        self._last_release = asyncio.get_running_loop().time()
+        while self._waiters:
+            future = heapq.heappop(self._waiters)[3]
+            if not future.done():
+                # Ownership passes directly; _locked stays True
+                future.set_result(True)
+                return
+        self._locked = False
+
+    async def _async_turnaround(self, slave_id: Optional[int]) -> None:
+        """Keep the bus quiet briefly when switching to another slave."""
+        if slave_id is None:
+            return
+        if (
+            self.slave_turnaround
+            and self._last_slave is not None
+            and slave_id != self._last_slave
+        ):
+            remaining = (
+                self._last_release
+                + self.slave_turnaround
+                - asyncio.get_running_loop().time()
+            )
+            if remaining > 0:
+                await asyncio.sleep(remaining)
+        self._last_slave = slave_id
+
+    @asynccontextmanager
+    async def slot(
+        self,
+        priority: int,
+        client: Hashable = None,
+        slave_id: Optional[int] = None,
+    ) -> AsyncIterator[None]:
+        """Hold the bus for one I/O step."""
+        await self.acquire(priority, client)
+        try:
+            await self._async_turnaround(slave_id)
+            yield
+        finally:
+            self.release()
+
+    def forget_client(self, client: Hashable) -> None:
+        """Drop round-robin state of a client (e.g. on entry unload)."""
+        self._client_rounds.pop(client, None)
+        self._client_grants.pop(client, None)
+
+    def get_status(self) -> Dict[str, Any]:
+        """Return queue state for diagnostics."""
+        return {
+            "locked": self._locked,
+            "waiting": sum(1 for entry in self._waiters if not entry[3].done()),
+            "slave_turnaround_s": self.slave_turnaround,
+            "grants_by_client": {
+                str(client): grants for client, grants in self._client_grants.items()
+            },
+        }
@@ -9,7 +9,10 @@ from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity import DeviceInfo, EntityCategory
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
+from homeassistant.helpers.update_coordinator import (
+    BaseCoordinatorEntity,
+    CoordinatorEntity,
+)
 
 from .const import DOMAIN
 from .coordinator import ModbusCoordinator
@@ -201,21 +204,18 @@ class ModbusCoordinatorNumber(CoordinatorEntity, NumberEntity):
         else:
             return None
 
-        register_data_source = self.coordinator.register_data
-        if not register_data_source:
-            return fallback
-
         # Match case-insensitively (PREFIX may be lowercased in template, keys use original case)
-        register_unique_id_lower = register_unique_id.lower()
-        for register_key, data in register_data_source.items():
-            if register_unique_id_lower in register_key.lower():
-                processed_value = data.get("processed_value")
-                if processed_value is not None:
-                    try:
-                        return float(processed_value)
-                    except (ValueError, TypeError):
-                        pass
-                break
+        register_key = self.coordinator.find_register_key(register_unique_id)
+        data = (
+            self.coordinator.get_register_data(register_key) if register_key else None
+        )
+        if data:
+            processed_value = data.get("processed_value")
+            if processed_value is not None:
+                try:
+                    return float(processed_value)
+                except (ValueError, TypeError):
+                    pass
         return fallback
 
     @callback
@@ -439,13 +439,32 @@ class ModbusCoordinatorNumber(CoordinatorEntity, NumberEntity):
         if not is_coordinator_connected(self.coordinator) or not super().available:
             return False
         return is_register_dependency_met(
-            self.coordinator.data, self._register_dependency
+            self.coordinator.data, self._register_dependency, self.coordinator
         )
 
     async def async_added_to_hass(self) -> None:
         """When entity is added to hass."""
-        await super().async_added_to_hass()
-        # CoordinatorEntity already handles listener registration, but we can add custom logic here if needed
+        if (
+            self._max_value_from_register
+            or self._min_value_from_register
+            or self._register_dependency
+            or self._attr_force_update
+        ):
+            # Limits or availability follow other registers, or force_update
+            # writes every poll: keep the per-poll listener
+            await super().async_added_to_hass()
+            return
+        # Skip BaseCoordinatorEntity, which registers the per-poll listener:
+        # the coordinator calls back only when this register's value or
+        # availability changed
+        await super(BaseCoordinatorEntity, self).async_added_to_hass()
+        self.async_on_remove(
+            self.coordinator.async_add_register_listener(
+                self.register_key, self._handle_coordinator_update
+            )
+        )
+        if self.coordinator.get_register_data(self.register_key):
+            self._handle_coordinator_update()
 
 
 async def async_setup_entry(
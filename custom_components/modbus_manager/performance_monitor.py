@@ -3,14 +3,19 @@
 from __future__ import annotations
 
 import time
+from collections import deque
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
-from typing import Any, Dict, List, Optional
+from typing import Any, Deque, Dict, List, Optional, Tuple
 
 from .logger import ModbusManagerLogger
 
 _LOGGER = ModbusManagerLogger(__name__)
 
+# Round-trip samples kept per request key and needed before a latency fit is used
+_REQUEST_SAMPLE_HISTORY = 200
+_MIN_REQUEST_SAMPLES = 10
+
 
 @dataclass
 class OperationMetrics:
@@ -24,6 +29,9 @@ class OperationMetrics:
     register_count: int = 0
     bytes_transferred: int = 0
     optimized_ranges_count: int = 0  # Number of batch reads (optimized ranges)
+    estimated_duration: Optional[float] = None  # Read plan cost-model estimate (s)
+    skipped_ranges_count: int = 0  # Ranges skipped by an open circuit breaker
+    unchanged_registers_count: int = 0  # Registers not decoded (raw words unchanged)
 
     @property
     def duration(self) -> float:
@@ -40,6 +48,51 @@ class OperationMetrics:
         return self.bytes_transferred / self.duration
 
 
+@dataclass
+class RequestStats:
+    """Round-trip samples of single Modbus read requests (word count, seconds)."""
+
+    samples: Deque[Tuple[int, float]] = field(
+        default_factory=lambda: deque(maxlen=_REQUEST_SAMPLE_HISTORY)
+    )
+    failures: int = 0
+
+    def latency_model(self) -> Optional[Tuple[float, float]]:
+        """Fit duration = per_request + per_word * words (least squares).
+
+        Returns (per_request_s, per_word_s) or None with too few samples.
+        """
+        if len(self.samples) < _MIN_REQUEST_SAMPLES:
+            return None
+        n = len(self.samples)
+        mean_w = sum(w for w, _ in self.samples) / n
+        mean_d = sum(d for _, d in self.samples) / n
+        var_w = sum((w - mean_w) ** 2 for w, _ in self.samples)
+        per_word = 0.0
+        if var_w > 0:
+            per_word = sum((w - mean_w) * (d - mean_d) for w, d in self.samples) / var_w
+        per_word = max(0.0, per_word)
+        per_request = max(0.0, mean_d - per_word * mean_w)
+        return per_request, per_word
+
+
+@dataclass
+class ScheduleStats:
+    """Lateness (actual minus scheduled read start) of one scan_interval group."""
+
+    reads: int = 0
+    total_lateness: float = 0.0
+    max_lateness: float = 0.0
+    last_lateness: float = 0.0
+
+    @property
+    def average_lateness(self) -> float:
+        """Calculate average lateness in seconds."""
+        if self.reads == 0:
+            return 0.0
+        return self.total_lateness / self.reads
+
+
 @dataclass
 class DeviceMetrics:
     """Metrics for a specific device."""
@@ -83,6 +136,8 @@ class PerformanceMonitor:
         self.max_history = max_history
         self.devices: Dict[str, DeviceMetrics] = {}
         self.global_metrics = DeviceMetrics(device_id="global")
+        self.request_stats: Dict[str, RequestStats] = {}
+        self.schedule_stats: Dict[str, Dict[int, ScheduleStats]] = {}
         _LOGGER.debug(
             "Performance monitor initialized with max_history: %d", max_history
         )
@@ -184,6 +239,31 @@ class PerformanceMonitor:
         except Exception as e:
             _LOGGER.error("Error ending operation: %s", str(e))
 
+    def record_request(
+        self, key: str, word_count: int, duration: float, success: bool
+    ) -> None:
+        """Record one Modbus read round-trip (key is e.g. "<prefix>:<slave_id>")."""
+        stats = self.request_stats.setdefault(key, RequestStats())
+        if success:
+            stats.samples.append((int(word_count), float(duration)))
+        else:
+            stats.failures += 1
+
+    def record_lateness(self, device_id: str, interval: int, lateness: float) -> None:
+        """Record how late a scan_interval group was read versus its deadline."""
+        stats = self.schedule_stats.setdefault(device_id, {}).setdefault(
+            interval, ScheduleStats()
+        )
+        stats.reads += 1
+        stats.total_lateness += lateness
+        stats.max_lateness = max(stats.max_lateness, lateness)
+        stats.last_lateness = lateness
+
+    def get_latency_model(self, key: str) -> Optional[Tuple[float, float]]:
+        """Return the measured (per_request_s, per_word_s) model for a request key."""
+        stats = self.request_stats.get(key)
+        return stats.latency_model() if stats else None
+
     def get_device_metrics(self, device_id: str) -> Optional[DeviceMetrics]:
         """Get metrics for a specific device."""
         return self.devices.get(device_id)
@@ -223,6 +303,17 @@ class PerformanceMonitor:
                         if device_metrics.last_operation
                         else None
                     ),
+                    "schedule": {
+                        interval: {
+                            "reads": stats.reads,
+                            "average_lateness": round(stats.average_lateness, 3),
+                            "max_lateness": round(stats.max_lateness, 3),
+                            "last_lateness": round(stats.last_lateness, 3),
+                        }
+                        for interval, stats in sorted(
+                            self.schedule_stats.get(device_id, {}).items()
+                        )
+                    },
                 }
 
             return summary
@@ -259,6 +350,13 @@ class PerformanceMonitor:
                     "error_message": op.error_message,
                     "register_count": op.register_count,
                     "optimized_ranges_count": op.optimized_ranges_count,
+                    "skipped_ranges_count": op.skipped_ranges_count,
+                    "unchanged_registers_count": op.unchanged_registers_count,
+                    "estimated_duration": (
+                        round(op.estimated_duration, 3)
+                        if op.estimated_duration is not None
+                        else None
+                    ),
                     "throughput": round(op.throughput, 2),
                     "timestamp": datetime.fromtimestamp(op.start_time).isoformat(),
                 }
@@ -291,8 +389,15 @@ class PerformanceMonitor:
                 if device_id in self.devices:
                     self.devices[device_id] = DeviceMetrics(device_id=device_id)
                     _LOGGER.debug("Metrics reset for device %s", device_id)
+                for key in [
+                    k for k in self.request_stats if k.startswith(f"{device_id}:")
+                ]:
+                    del self.request_stats[key]
+                self.schedule_stats.pop(device_id, None)
             else:
                 self.devices.clear()
+                self.request_stats.clear()
+                self.schedule_stats.clear()
                 self.global_metrics = DeviceMetrics(device_id="global")
                 _LOGGER.debug("All metrics reset")
 
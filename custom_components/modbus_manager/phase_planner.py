@@ -0,0 +1,94 @@
+"""Phase planning for scan_interval groups (spread or align slow groups)."""
+
+from __future__ import annotations
+
+import math
+from typing import Callable, Dict, FrozenSet, Iterable
+
+from .logger import ModbusManagerLogger
+
+_LOGGER = ModbusManagerLogger(__name__)
+
+PHASE_STRATEGY_ALIGN = "align"
+PHASE_STRATEGY_SPREAD = "spread"
+PHASE_STRATEGIES = (PHASE_STRATEGY_ALIGN, PHASE_STRATEGY_SPREAD)
+
+# Simulated schedule length (seconds) used to place phases and count requests
+_MIN_PHASE_HORIZON_S = 3600
+
+
+def _horizon(intervals: Iterable[int]) -> int:
+    """Length of one repeating schedule, capped to keep simulation cheap."""
+    intervals = list(intervals)
+    hyperperiod = 1
+    for interval in intervals:
+        hyperperiod = hyperperiod * interval // math.gcd(hyperperiod, interval)
+    return min(hyperperiod, max(max(intervals), _MIN_PHASE_HORIZON_S))
+
+
+def plan_phases(
+    intervals: Iterable[int],
+    weights: Dict[int, int],
+    strategy: str,
+) -> Dict[int, int]:
+    """Return a start offset (seconds) per scan_interval group.
+
+    ``align`` keeps every group at offset 0, so groups coincide whenever their
+    intervals line up and the read plan merges their ranges into fewer
+    requests. ``spread`` shifts slower groups onto ticks of the fastest group
+    with the lowest expected load (weights = requests per group), flattening
+    bus load without adding wake-ups.
+    """
+    intervals = sorted(set(intervals))
+    phases = {interval: 0 for interval in intervals}
+    if strategy != PHASE_STRATEGY_SPREAD or len(intervals) < 2:
+        return phases
+
+    fastest = intervals[0]
+    horizon = _horizon(intervals)
+    load: Dict[int, int] = {}
+    for time in range(0, horizon, fastest):
+        load[time] = weights.get(fastest, 1)
+
+    slow_groups = sorted(
+        intervals[1:], key=lambda i: (weights.get(i, 1), i), reverse=True
+    )
+    for interval in slow_groups:
+        candidates = range(0, interval, fastest) if interval >= 2 * fastest else [0]
+        best_phase, best_cost = 0, None
+        for phase in candidates:
+            times = range(phase, horizon, interval)
+            cost = (
+                max(load.get(time, 0) for time in times),
+                sum(load.get(time, 0) for time in times),
+            )
+            if best_cost is None or cost < best_cost:
+                best_phase, best_cost = phase, cost
+        phases[interval] = best_phase
+        for time in range(best_phase, horizon, interval):
+            load[time] = load.get(time, 0) + weights.get(interval, 1)
+    return phases
+
+
+def expected_tick_load(
+    phases: Dict[int, int],
+    requests_for: Callable[[FrozenSet[int]], int],
+) -> Dict[str, float]:
+    """Simulate one schedule period and count read requests per wake-up.
+
+    requests_for(due_intervals) returns the number of requests the read plan
+    for that set of due groups needs.
+    """
+    if not phases:
+        return {"ticks": 0, "average_requests": 0.0, "max_requests": 0}
+    horizon = _horizon(phases)
+    due_at: Dict[int, set] = {}
+    for interval, phase in phases.items():
+        for time in range(phase % interval, horizon, interval):
+            due_at.setdefault(time, set()).add(interval)
+    counts = [requests_for(frozenset(due)) for due in due_at.values()]
+    return {
+        "ticks": len(counts),
+        "average_requests": round(sum(counts) / len(counts), 2),
+        "max_requests": max(counts),
+    }
@@ -0,0 +1,179 @@
+"""Pipelined Modbus TCP transport with several outstanding transactions."""
+
+from __future__ import annotations
+
+import asyncio
+import struct
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+
+from .logger import ModbusManagerLogger
+
+_LOGGER = ModbusManagerLogger(__name__)
+
+DEFAULT_MAX_IN_FLIGHT = 4
+
+# MBAP header: transaction id, protocol id (0), length (unit id + PDU), unit id
+_MBAP_HEADER = struct.Struct(">HHHB")
+_READ_REQUEST = struct.Struct(">BHH")
+_READ_FUNCTION_CODES = (3, 4)
+
+
+class ModbusTransportError(Exception):
+    """Read failed: timeout, lost connection or Modbus exception response."""
+
+    def __init__(self, message: str, exception_code: Optional[int] = None) -> None:
+        super().__init__(message)
+        # Modbus exception code of an exception response, None for other failures
+        self.exception_code = exception_code
+
+
+@dataclass
+class ReadResponse:
+    """Registers returned by a read request (mirrors the pymodbus attribute)."""
+
+    registers: List[int]
+
+
+class PipelinedModbusTcpTransport:
+    """Persistent Modbus TCP connection with a window of in-flight requests.
+
+    Requests are written without waiting for earlier responses; responses are
+    matched to their request by MBAP transaction id. Only register reads
+    (function codes 3 and 4) are supported - writes keep using the hub.
+    """
+
+    def __init__(
+        self,
+        host: str,
+        port: int,
+        timeout: float = 5.0,
+        max_in_flight: int = DEFAULT_MAX_IN_FLIGHT,
+    ) -> None:
+        self.host = host
+        self.port = port
+        self.timeout = timeout
+        self.max_in_flight = max(1, int(max_in_flight))
+        self._window = asyncio.Semaphore(self.max_in_flight)
+        self._connect_lock = asyncio.Lock()
+        self._reader: Optional[asyncio.StreamReader] = None
+        self._writer: Optional[asyncio.StreamWriter] = None
+        self._reader_task: Optional[asyncio.Task] = None
+        self._pending: Dict[int, asyncio.Future] = {}
+        self._transaction_id = 0
+
+    @property
+    def connected(self) -> bool:
+        """Return True while the TCP connection is open."""
+        return self._writer is not None and not self._writer.is_closing()
+
+    async def async_connect(self) -> None:
+        """Open the TCP connection if it is not open yet."""
+        async with self._connect_lock:
+            if self.connected:
+                return
+            try:
+                self._reader, self._writer = await asyncio.wait_for(
+                    asyncio.open_connection(self.host, self.port), self.timeout
+                )
+            except (asyncio.TimeoutError, OSError) as e:
+                raise ModbusTransportError(
+                    f"cannot connect to {self.host}:{self.port}: {e}"
+                ) from e
+            self._reader_task = asyncio.create_task(self._async_read_loop())
+            _LOGGER.debug(
+                "Pipelined Modbus TCP connected to %s:%s (window %d)",
+                self.host,
+                self.port,
+                self.max_in_flight,
+            )
+
+    async def async_close(self) -> None:
+        """Close the connection and fail outstanding requests."""
+        self._drop_connection(ModbusTransportError("transport closed"))
+
+    def _drop_connection(self, error: Exception) -> None:
+        # Stop the reader of this connection so it cannot outlive a reconnect
+        reader_task = self._reader_task
+        self._reader_task = None
+        if reader_task is not None and reader_task is not asyncio.current_task():
+            reader_task.cancel()
+        if self._writer is not None:
+            self._writer.close()
+        self._reader = None
+        self._writer = None
+        for future in self._pending.values():
+            if not future.done():
+                future.set_exception(error)
+        self._pending.clear()
+
+    async def _async_read_loop(self) -> None:
+        """Dispatch responses to waiting requests by transaction id."""
+        reader = self._reader
+        try:
+            while reader is not None:
+                header = await reader.readexactly(_MBAP_HEADER.size)
+                transaction_id, _, length, unit_id = _MBAP_HEADER.unpack(header)
+                pdu = await reader.readexactly(max(0, length - 1))
+                future = self._pending.pop(transaction_id, None)
+                if future is not None and not future.done():
+                    future.set_result((unit_id, pdu))
+        except (asyncio.IncompleteReadError, ConnectionError, OSError) as e:
+            _LOGGER.debug("Pipelined Modbus TCP connection lost: %s", str(e))
+            # A reader of an already replaced connection must not drop the new one
+            if self._reader is reader:
+                self._drop_connection(ModbusTransportError(f"connection lost: {e}"))
+
+    def _next_transaction_id(self) -> int:
+        while True:
+            self._transaction_id = (self._transaction_id + 1) & 0xFFFF
+            if self._transaction_id and self._transaction_id not in self._pending:
+                return self._transaction_id
+
+    async def read_registers(
+        self, slave_id: int, address: int, count: int, function_code: int = 3
+    ) -> ReadResponse:
+        """Read holding (3) or input (4) registers."""
+        if function_code not in _READ_FUNCTION_CODES:
+            raise ValueError(f"Unsupported read function code {function_code}")
+        async with self._window:
+            await self.async_connect()
+            if self._writer is None:
+                raise ModbusTransportError("not connected")
+            transaction_id = self._next_transaction_id()
+            future: asyncio.Future[
+                Tuple[int, bytes]
+            ] = asyncio.get_running_loop().create_future()
+            self._pending[transaction_id] = future
+            pdu = _READ_REQUEST.pack(function_code, address, count)
+            try:
+                self._writer.write(
+                    _MBAP_HEADER.pack(transaction_id, 0, len(pdu) + 1, slave_id) + pdu
+                )
+                await self._writer.drain()
+                _, response = await asyncio.wait_for(future, self.timeout)
+            except asyncio.TimeoutError as e:
+                raise ModbusTransportError(
+                    f"timeout reading {count} registers at {address}"
+                ) from e
+            except (ConnectionError, OSError) as e:
+                self._drop_connection(ModbusTransportError(str(e)))
+                raise ModbusTransportError(f"connection error: {e}") from e
+            finally:
+                self._pending.pop(transaction_id, None)
+
+        if not response:
+            raise ModbusTransportError("empty response")
+        if response[0] & 0x80:
+            code = response[1] if len(response) > 1 else 0
+            raise ModbusTransportError(f"Modbus exception code {code}", code)
+        byte_count = response[1] if len(response) > 1 else 0
+        if (
+            response[0] != function_code
+            or byte_count != 2 * count
+            or len(response) < 2 + byte_count
+        ):
+            raise ModbusTransportError(
+                f"unexpected response (function {response[0]}, {byte_count} bytes)"
+            )
+        return ReadResponse(list(struct.unpack_from(f">{count}H", response, 2)))
@@ -0,0 +1,179 @@
+"""Batch decoder for the registers of one read range."""
+
+from __future__ import annotations
+
+import struct
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from .logger import ModbusManagerLogger
+from .modbus_utils import _is_word_swap_enabled, _normalize_byte_order
+from .register_optimizer import register_end_address
+
+_LOGGER = ModbusManagerLogger(__name__)
+
+# struct codes for multi-word types (decoded as big-endian byte stream)
+_MULTI_WORD_CODES = {
+    "uint32": "I",
+    "int32": "i",
+    "float": "f",
+    "float32": "f",
+    "float64": "d",
+}
+
+
+class RangeDecoder:
+    """Decode every register of a read range with precompiled struct layouts.
+
+    The response words are packed once into a big-endian buffer (and, if any
+    field needs it, a buffer with little-endian words). Word swap and byte
+    order are folded into the layout: a field is read from the big or the
+    little word buffer with ``>`` or ``<`` byte order, which reproduces
+    ``registers_to_bytes`` for every swap/byte_order combination. Fields that
+    do not overlap share one ``struct.Struct``, so a range usually decodes
+    with one or two ``unpack_from`` calls.
+
+    Values match ``RegisterOptimizer.get_register_value`` (raw value) and the
+    data type conversion of ``ModbusCoordinator._process_register_value``.
+    """
+
+    def __init__(self, start_address: int, registers: Sequence[Dict[str, Any]]):
+        self.start_address = start_address
+        self.register_count = len(registers)
+        self.word_count = 0
+        # Per register: (offset, kind, width); kind is "word", "int16", "multi"
+        # or "string"
+        self._fields: List[Tuple[int, str, int]] = []
+        self._layouts: List[Tuple[bool, struct.Struct, List[int]]] = []
+        self._strings: List[Tuple[int, int, int, bool, bool, str]] = []
+        self._needs_little = False
+
+        grouped: Dict[Tuple[bool, str], List[Tuple[int, str, int]]] = {}
+        for index, register in enumerate(registers):
+            offset = register.get("address", 0) - start_address
+            width = register_end_address(register) - register.get("address", 0) + 1
+            self.word_count = max(self.word_count, offset + width)
+            data_type = register.get("data_type", "uint16")
+
+            if data_type == "string":
+                little = _normalize_byte_order(register.get("byte_order")) == "little"
+                swap = _is_word_swap_enabled(register.get("swap", "none"))
+                self._needs_little |= little
+                self._strings.append(
+                    (
+                        index,
+                        offset,
+                        width,
+                        little,
+                        swap,
+                        register.get("encoding", "utf-8"),
+                    )
+                )
+                self._fields.append((offset, "string", width))
+            elif data_type in _MULTI_WORD_CODES:
+                little = _normalize_byte_order(register.get("byte_order")) == "little"
+                swap = _is_word_swap_enabled(register.get("swap", "none"))
+                # Reversed byte order swaps words; little words undo the byte swap
+                use_little_words = little != swap
+                self._needs_little |= use_little_words
+                code = _MULTI_WORD_CODES[data_type]
+                grouped.setdefault((use_little_words, "<" if swap else ">"), []).append(
+                    (offset, code, index)
+                )
+                self._fields.append((offset, "multi", width))
+            else:
+                # 16-bit values ignore byte_order/swap (as in the per-value path)
+                code = "h" if data_type == "int16" else "H"
+                grouped.setdefault((False, ">"), []).append((offset, code, index))
+                self._fields.append((offset, "int16" if code == "h" else "word", 1))
+
+        for (use_little_words, endian), fields in grouped.items():
+            for layout in self._pack_layouts(fields):
+                fmt, indices = endian, []
+                cursor = 0
+                for offset, code, index in layout:
+                    if offset > cursor:
+                        fmt += f"{2 * (offset - cursor)}x"
+                    fmt += code
+                    cursor = offset + struct.calcsize(f"<{code}") // 2
+                    indices.append(index)
+                self._layouts.append((use_little_words, struct.Struct(fmt), indices))
+
+        self._big_words = struct.Struct(f">{self.word_count}H")
+        self._little_words = struct.Struct(f"<{self.word_count}H")
+
+    @staticmethod
+    def _pack_layouts(
+        fields: List[Tuple[int, str, int]]
+    ) -> List[List[Tuple[int, str, int]]]:
+        """Split fields into layouts without overlapping words (first fit)."""
+        layouts: List[List[Tuple[int, str, int]]] = []
+        ends: List[int] = []
+        for field in sorted(fields):
+            offset, code, _ = field
+            for position, end in enumerate(ends):
+                if offset >= end:
+                    layouts[position].append(field)
+                    ends[position] = offset + struct.calcsize(f"<{code}") // 2
+                    break
+            else:
+                layouts.append([field])
+                ends.append(offset + struct.calcsize(f"<{code}") // 2)
+        return layouts
+
+    @classmethod
+    def for_range(cls, range_obj) -> "RangeDecoder":
+        """Compile (once) and return the decoder of a RegisterRange."""
+        decoder = range_obj.decoder
+        if decoder is None or decoder.register_count != len(range_obj.registers):
+            decoder = cls(range_obj.start_address, range_obj.registers)
+            range_obj.decoder = decoder
+        return decoder
+
+    def decode(self, words: Sequence[int]) -> Optional[List[Tuple[Any, Any]]]:
+        """Return (raw_value, decoded_value) per register, in range order.
+
+        Returns None if the response is too short or holds invalid words; the
+        caller then falls back to the per-value path.
+        """
+        if len(words) < self.word_count:
+            return None
+        words = words[: self.word_count]
+        try:
+            buffers = {False: self._big_words.pack(*words)}
+            if self._needs_little:
+                buffers[True] = self._little_words.pack(*words)
+        except struct.error as e:
+            _LOGGER.debug("Cannot batch-decode range at %d: %s", self.start_address, e)
+            return None
+
+        values: List[Any] = [None] * self.register_count
+        for use_little_words, layout, indices in self._layouts:
+            for index, value in zip(
+                indices, layout.unpack_from(buffers[use_little_words])
+            ):
+                values[index] = value
+
+        for index, offset, width, little, swap, encoding in self._strings:
+            data = buffers[little][2 * offset : 2 * (offset + width)]
+            if swap:
+                data = b"".join(
+                    data[position : position + 2]
+                    for position in range(len(data) - 2, -1, -2)
+                )
+            try:
+                # Null-terminated: cut at the first \x00 (stray bytes may follow)
+                values[index] = (
+                    data.decode(encoding, errors="ignore").split("\x00", 1)[0].strip()
+                )
+            except LookupError as e:
+                _LOGGER.error("Cannot decode string register: %s", str(e))
+
+        result: List[Tuple[Any, Any]] = []
+        for (offset, kind, width), value in zip(self._fields, values):
+            if kind == "word":
+                result.append((words[offset], value))
+            elif kind == "int16":
+                result.append((value, value))
+            else:
+                result.append((list(words[offset : offset + width]), value))
+        return result
@@ -0,0 +1,105 @@
+"""Probe the largest reliable Modbus read block size for a device."""
+
+from __future__ import annotations
+
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+from .logger import ModbusManagerLogger
+from .register_optimizer import DeviceReadOptions, register_end_address
+
+_LOGGER = ModbusManagerLogger(__name__)
+
+# Block sizes tried in increasing order (125 = Modbus specification maximum)
+PROBE_SIZES = (8, 16, 32, 64, 96, 125)
+
+# Every probe must succeed this many times in a row to count as reliable
+_PROBE_ATTEMPTS = 2
+
+
+def probe_window(
+    registers: List[Dict[str, Any]],
+    size: int,
+    input_type: str,
+    options: DeviceReadOptions,
+    exclude: Optional[Tuple[int, int]] = None,
+) -> Optional[Tuple[int, int]]:
+    """Return the widest (start, end) span of template registers fitting in size.
+
+    Probes only start and end on addresses the template defines and never
+    touch never_read windows. A span can still contain unmapped addresses
+    between template registers; among equally wide spans the one with the
+    fewest unmapped words wins. Spans overlapping ``exclude`` are skipped.
+    """
+    spans = sorted(
+        (reg.get("address", 0), register_end_address(reg))
+        for reg in registers
+        if exclude is None
+        or register_end_address(reg) < exclude[0]
+        or reg.get("address", 0) > exclude[1]
+    )
+    best: Optional[Tuple[int, int]] = None
+    best_rank: Tuple[int, int] = (0, 0)
+    for i, (start, _) in enumerate(spans):
+        end = -1
+        mapped = set()
+        for reg_start, reg_end in spans[i:]:
+            if reg_end - start + 1 > size:
+                if reg_start - start + 1 > size:
+                    break
+                continue
+            end = max(end, reg_end)
+            mapped.update(range(reg_start, reg_end + 1))
+        if end < start or not options.hole_is_readable(input_type, start, end):
+            continue
+        if exclude is not None and start <= exclude[1] and end >= exclude[0]:
+            continue
+        width = end - start + 1
+        rank = (width, -(width - len(mapped)))
+        if best is None or rank > best_rank:
+            best, best_rank = (start, end), rank
+    return best
+
+
+async def _async_probe(
+    read: Callable[[int, int], Awaitable[bool]], window: Tuple[int, int]
+) -> bool:
+    start, end = window
+    span = end - start + 1
+    for _ in range(_PROBE_ATTEMPTS):
+        if not await read(start, span):
+            _LOGGER.debug(
+                "Read size probe %d-%d (%d registers) failed", start, end, span
+            )
+            return False
+    return True
+
+
+async def async_calibrate_read_size(
+    read: Callable[[int, int], Awaitable[bool]],
+    registers: List[Dict[str, Any]],
+    input_type: str,
+    options: DeviceReadOptions,
+) -> Optional[int]:
+    """Return the largest block size that read reliably, or None if none did.
+
+    read(start, count) performs one request and returns True on a complete
+    response. A device may also reject a probe because of an unmapped
+    address inside the window, so a failing size is retried once on a
+    disjoint window; probing stops when that fails too. Sizes beyond the
+    widest template span are never needed by read plans and are not probed.
+    """
+    verified = 0
+    for size in PROBE_SIZES:
+        window = probe_window(registers, size, input_type, options)
+        if window is None or window[1] - window[0] + 1 <= verified:
+            continue
+        if not await _async_probe(read, window):
+            window = probe_window(registers, size, input_type, options, window)
+            if (
+                window is None
+                or window[1] - window[0] + 1 <= verified
+                or not await _async_probe(read, window)
+            ):
+                return verified or None
+        verified = window[1] - window[0] + 1
+    return verified or None
@@ -0,0 +1,182 @@
+"""Persistent read-planner state (calibrated read sizes) per config entry."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from typing import Any
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.storage import Store
+
+from .const import DOMAIN
+from .logger import ModbusManagerLogger
+
+_LOGGER = ModbusManagerLogger(__name__)
+
+STORAGE_VERSION = 1
+STORAGE_KEY = f"{DOMAIN}.read_planner"
+SAVE_DELAY_S = 10
+_SHARED_STORE_KEY = "read_planner_store"
+
+# Learned bad addresses are trusted this long, then probed again
+BAD_ADDRESS_TTL_S = 7 * 24 * 3600
+
+
+class _SharedReadPlannerStore:
+    """Read-planner data of all entries, shared through hass.data.
+
+    The store file is read once per process; afterwards the in-memory state is
+    authoritative, so entries saving at the same time cannot overwrite each
+    other. Changes schedule one delayed save, and pending data is written by
+    the Store's final-write listener when Home Assistant stops.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        self._store = Store(hass, STORAGE_VERSION, STORAGE_KEY)
+        self._load_lock = asyncio.Lock()
+        self._loaded = False
+        self.entries: dict[str, Any] = {}
+
+    @classmethod
+    def get(cls, hass: HomeAssistant) -> _SharedReadPlannerStore:
+        """Return the store shared by all config entries."""
+        domain_data = hass.data.setdefault(DOMAIN, {})
+        store = domain_data.get(_SHARED_STORE_KEY)
+        if store is None:
+            store = cls(hass)
+            domain_data[_SHARED_STORE_KEY] = store
+        return store
+
+    async def async_load(self) -> None:
+        """Read the store file (once)."""
+        async with self._load_lock:
+            if self._loaded:
+                return
+            stored = await self._store.async_load() or {}
+            entries = stored.get("entries", {})
+            self.entries = dict(entries) if isinstance(entries, dict) else {}
+            self._loaded = True
+
+    @callback
+    def async_schedule_save(self) -> None:
+        """Save all entries after SAVE_DELAY_S."""
+        self._store.async_delay_save(self._data_to_save, SAVE_DELAY_S)
+
+    @callback
+    def _data_to_save(self) -> dict[str, Any]:
+        return {"entries": dict(self.entries)}
+
+    async def async_remove_entry(self, entry_id: str) -> None:
+        """Drop an entry's data and persist the removal."""
+        await self.async_load()
+        if self.entries.pop(entry_id, None) is not None:
+            await self._store.async_save(self._data_to_save())
+
+
+async def async_remove_read_planner_data(hass: HomeAssistant, entry_id: str) -> None:
+    """Remove learned read-planner data of a deleted config entry."""
+    await _SharedReadPlannerStore.get(hass).async_remove_entry(entry_id)
+
+
+class ReadPlannerStore:
+    """Learned read-planner data for one Modbus config entry.
+
+    Data is tied to a configuration signature; when the device configuration
+    changes the stored values are discarded and learned again.
+    """
+
+    def __init__(self, hass: HomeAssistant, entry_id: str) -> None:
+        self._entry_id = entry_id
+        self._shared = _SharedReadPlannerStore.get(hass)
+        self._data: dict[str, Any] = {}
+        self._loaded = False
+
+    async def async_load(self, signature: str) -> None:
+        """Load persisted data for this entry, dropping it if the signature changed."""
+        if self._loaded and self._data.get("signature") == signature:
+            return
+        await self._shared.async_load()
+        entry_state = self._shared.entries.get(self._entry_id)
+        if isinstance(entry_state, dict) and entry_state.get("signature") == signature:
+            self._data = entry_state
+        else:
+            if entry_state:
+                _LOGGER.debug(
+                    "Configuration changed, discarding learned read planner data"
+                )
+            self._data = {"signature": signature}
+        self._loaded = True
+
+    def get_read_size(self, slave_id: int, key: str) -> int | None:
+        """Return the calibrated max read size for a slave/function-code key."""
+        value = self._data.get("read_sizes", {}).get(f"{slave_id}:{key}")
+        return int(value) if isinstance(value, int) and value > 0 else None
+
+    def set_read_size(self, slave_id: int, key: str, size: int) -> None:
+        """Remember a calibrated max read size (persist with async_schedule_save)."""
+        self._data.setdefault("read_sizes", {})[f"{slave_id}:{key}"] = int(size)
+
+    def get_bad_addresses(self) -> dict[int, list[tuple[int, int, str | None]]]:
+        """Return learned, not yet expired bad address windows by slave id."""
+        now = time.time()
+        result: dict[int, list[tuple[int, int, str | None]]] = {}
+        for slave_id, windows in self._data.get("bad_addresses", {}).items():
+            try:
+                result[int(slave_id)] = [
+                    (int(window[0]), int(window[1]), window[2])
+                    for window in windows
+                    if _bad_address_expiry(window) > now
+                ]
+            except (IndexError, TypeError, ValueError):
+                _LOGGER.debug("Ignoring invalid stored bad addresses: %s", windows)
+        return result
+
+    def next_bad_address_expiry(self) -> float | None:
+        """Return the wall-clock time the next learned window expires."""
+        now = time.time()
+        expiries = [
+            expiry
+            for windows in self._data.get("bad_addresses", {}).values()
+            for expiry in map(_bad_address_expiry, windows)
+            if expiry > now
+        ]
+        return min(expiries, default=None)
+
+    def add_bad_addresses(
+        self, slave_id: int, windows: list[tuple[int, int, str | None]]
+    ) -> None:
+        """Remember bad address windows for a slave (persist with async_schedule_save).
+
+        Windows expire after BAD_ADDRESS_TTL_S; expired ones are dropped here.
+        """
+        now = time.time()
+        relearned = {tuple(window) for window in windows}
+        stored = [
+            window
+            for window in self._data.setdefault("bad_addresses", {}).get(
+                str(slave_id), []
+            )
+            if _bad_address_expiry(window) > now and tuple(window[:3]) not in relearned
+        ]
+        stored.extend(
+            [start, end, input_type, now] for start, end, input_type in windows
+        )
+        self._data["bad_addresses"][str(slave_id)] = stored
+
+    @callback
+    def async_schedule_save(self) -> None:
+        """Persist this entry's data with the next (delayed) save."""
+        self._shared.entries[self._entry_id] = self._data
+        self._shared.async_schedule_save()
+
+
+def _bad_address_expiry(window: Any) -> float:
+    """Expiry of a stored [start, end, input_type, learned_at] window.
+
+    Windows stored without learned_at count as expired and are probed again.
+    """
+    try:
+        return float(window[3]) + BAD_ADDRESS_TTL_S
+    except (IndexError, TypeError, ValueError):
+        return 0.0
@@ -2,8 +2,9 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Any, Dict, List, Tuple
+import math
+from dataclasses import dataclass, field
+from typing import Any, Dict, FrozenSet, List, Optional, Tuple
 
 from .const import DEFAULT_MAX_REGISTER_READ
 from .logger import ModbusManagerLogger
@@ -14,6 +15,18 @@ _LOGGER = ModbusManagerLogger(__name__)
 # Do not exceed Modbus specification for read register count
 _MAX_MODBUS_READ_REGISTERS = 125
 
+# Planner strategies: greedy sweep (default) or cost-model partitioning
+READ_STRATEGY_GREEDY = "greedy"
+READ_STRATEGY_COST = "cost"
+
+# Cost model defaults until measured round-trips are available:
+# per request ~ default 100 ms message wait + response, per word ~ RS485 @ 9600 baud
+DEFAULT_REQUEST_COST_S = 0.15
+DEFAULT_WORD_COST_S = 0.002
+
+# Relative change of a measured cost input that triggers a re-plan
+_COST_MODEL_REPLAN_THRESHOLD = 0.25
+
 
 def _register_width_for_merge(reg: Dict[str, Any]) -> int:
     """How many 16-bit registers this entity needs (aligns with RegisterRange.register_count)."""
@@ -30,6 +43,102 @@ def _register_width_for_merge(reg: Dict[str, Any]) -> int:
     return int(count) if count else 1
 
 
+def register_end_address(reg: Dict[str, Any]) -> int:
+    """Last 16-bit address occupied by this entity (inclusive)."""
+    return reg.get("address", 0) + _register_width_for_merge(reg) - 1
+
+
+def read_size_key(input_type: str, read_function_code: Any = None) -> str:
+    """Key for per-function-code read size limits (e.g. "holding:3")."""
+    return f"{input_type or 'holding'}:{read_function_code or 0}"
+
+
+def parse_never_read_windows(raw: Any) -> List[Tuple[int, int, Optional[str]]]:
+    """Parse `never_read` address windows from template/device config.
+
+    Accepted entries:
+    - ``[start, end]`` (applies to holding and input registers)
+    - ``{start: 5036, end: 5048, input_type: input}``
+    - a single address (``5036``)
+    """
+    windows: List[Tuple[int, int, Optional[str]]] = []
+    if not raw:
+        return windows
+    if not isinstance(raw, (list, tuple)):
+        raw = [raw]
+    for item in raw:
+        try:
+            input_type = None
+            if isinstance(item, dict):
+                start = int(item.get("start", item.get("address")))
+                end = int(item.get("end", start))
+                input_type = item.get("input_type")
+            elif isinstance(item, (list, tuple)) and item:
+                start = int(item[0])
+                end = int(item[1]) if len(item) > 1 else start
+            else:
+                start = end = int(item)
+        except (TypeError, ValueError):
+            _LOGGER.warning("Ignoring invalid never_read window: %s", item)
+            continue
+        if end < start:
+            start, end = end, start
+        windows.append((start, end, str(input_type) if input_type else None))
+    return windows
+
+
+@dataclass
+class DeviceReadOptions:
+    """Per-device (slave) settings for the read planner."""
+
+    max_gap: int = 0
+    never_read: List[Tuple[int, int, Optional[str]]] = field(default_factory=list)
+    strategy: str = READ_STRATEGY_GREEDY
+    request_cost_s: float = DEFAULT_REQUEST_COST_S
+    word_cost_s: float = DEFAULT_WORD_COST_S
+    max_read_size: Optional[int] = None
+    auto_read_size: bool = False
+    read_size_limits: Dict[str, int] = field(default_factory=dict)
+    # Addresses the device rejected at runtime (learned, persisted separately)
+    bad_addresses: List[Tuple[int, int, Optional[str]]] = field(default_factory=list)
+
+    def read_size_limit(
+        self, input_type: str, read_function_code: Any, default: int
+    ) -> int:
+        """Largest span for one request: calibrated, then configured, then default."""
+        limit = self.read_size_limits.get(read_size_key(input_type, read_function_code))
+        if limit is None:
+            limit = self.max_read_size or default
+        return max(1, min(limit, _MAX_MODBUS_READ_REGISTERS))
+
+    def range_cost(self, word_count: int) -> float:
+        """Estimated seconds for one read request of word_count registers."""
+        return self.request_cost_s + self.word_cost_s * word_count
+
+    def hole_is_readable(self, input_type: str, first: int, last: int) -> bool:
+        """Return False if padding words first..last touch a never-read or bad window."""
+        for start, end, window_type in (*self.never_read, *self.bad_addresses):
+            if window_type and window_type != input_type:
+                continue
+            if start <= last and first <= end:
+                return False
+        return True
+
+    def is_bad_register(self, reg: Dict[str, Any]) -> bool:
+        """Return True if the register overlaps an address the device rejected."""
+        if not self.bad_addresses:
+            return False
+        input_type = reg.get("input_type", "holding")
+        first = reg.get("address", 0)
+        last = register_end_address(reg)
+        for start, end, window_type in self.bad_addresses:
+            if window_type and window_type != input_type:
+                continue
+            if start <= last and first <= end:
+                return True
+        return False
+
+
 @dataclass
 class RegisterRange:
     """Represents a range of consecutive registers."""
@@ -37,12 +146,23 @@ class RegisterRange:
     start_address: int
     end_address: int
     registers: List[Dict[str, Any]]
+    # RangeDecoder, compiled on first use (see range_decoder.py)
+    decoder: Any = field(default=None, repr=False, compare=False)
 
     @property
     def count(self) -> int:
-        """Return the number of registers in this range."""
+        """Return the number of registers in this range (span incl. padding)."""
         return self.end_address - self.start_address + 1
 
+    @property
+    def padding_count(self) -> int:
+        """Return the number of unused words read to bridge gaps."""
+        covered = set()
+        for reg in self.registers:
+            start = reg.get("address", 0)
+            covered.update(range(start, start + _register_width_for_merge(reg)))
+        return max(0, self.count - len(covered))
+
     @property
     def register_count(self) -> int:
         """Return the actual register count needed for reading."""
@@ -68,11 +188,32 @@ class RegisterRange:
         return total_count
 
 
+@dataclass
+class ReadPlan:
+    """Precompiled read ranges for one combination of due scan intervals."""
+
+    intervals: FrozenSet[int]
+    ranges: List[RegisterRange]
+    register_count: int
+    total_bytes: int
+    estimated_duration: float = 0.0
+    piggyback_count: int = 0
+
+    @property
+    def range_count(self) -> int:
+        """Return the number of Modbus requests in this plan."""
+        return len(self.ranges)
+
+
 class RegisterOptimizer:
     """Optimizes register reading by grouping consecutive registers."""
 
-    def __init__(self, max_read_size: int | None = None):
-        """Initialize the optimizer."""
+    def __init__(self, max_read_size: int | None = None, max_gap: int = 0):
+        """Initialize the optimizer.
+
+        max_gap is the default number of unused words the planner may read
+        to merge two ranges; per-slave values set via configure_device win.
+        """
         if max_read_size is None:
             raw = DEFAULT_MAX_REGISTER_READ
         elif isinstance(max_read_size, list):
@@ -84,10 +225,180 @@ class RegisterOptimizer:
         except (TypeError, ValueError):
             n = DEFAULT_MAX_REGISTER_READ
         self.max_read_size = max(1, min(n, _MAX_MODBUS_READ_REGISTERS))
+        self.default_read_options = DeviceReadOptions(max_gap=max(0, int(max_gap)))
+        self._device_read_options: Dict[int, DeviceReadOptions] = {}
         _LOGGER.debug(
             "Register optimizer initialized with max_read_size: %d", self.max_read_size
         )
 
+    def configure_device(
+        self,
+        slave_id: int,
+        max_gap: int | None = None,
+        never_read: Any = None,
+        strategy: str | None = None,
+        max_read_size: Any = None,
+    ) -> None:
+        """Set gap-bridging options for one slave.
+
+        Several devices on the same slave_id share one option set: the smallest
+        max_gap and max_read_size win, never_read windows are combined and
+        conflicting strategies fall back to greedy. ``max_read_size: auto``
+        marks the slave for read size calibration.
+        """
+        try:
+            gap = max(0, int(max_gap)) if max_gap is not None else 0
+        except (TypeError, ValueError):
+            _LOGGER.warning(
+                "Invalid max_gap %s for slave_id %s, using 0", max_gap, slave_id
+            )
+            gap = 0
+        windows = parse_never_read_windows(never_read)
+        strategy = str(strategy or READ_STRATEGY_GREEDY).strip().lower()
+        if strategy not in (READ_STRATEGY_GREEDY, READ_STRATEGY_COST):
+            _LOGGER.warning(
+                "Unknown read planner strategy %s for slave_id %s, using greedy",
+                strategy,
+                slave_id,
+            )
+            strategy = READ_STRATEGY_GREEDY
+        auto_read_size = str(max_read_size).strip().lower() == "auto"
+        read_size = None
+        if max_read_size is not None and not auto_read_size:
+            try:
+                read_size = max(1, min(int(max_read_size), _MAX_MODBUS_READ_REGISTERS))
+            except (TypeError, ValueError):
+                _LOGGER.warning(
+                    "Invalid max_read_size %s for slave_id %s, using default",
+                    max_read_size,
+                    slave_id,
+                )
+        slave_id = int(slave_id)
+        existing = self._device_read_options.get(slave_id)
+        if existing is not None:
+            existing.max_gap = min(existing.max_gap, gap)
+            existing.never_read.extend(windows)
+            if existing.strategy != strategy:
+                existing.strategy = READ_STRATEGY_GREEDY
+            if read_size is not None:
+                existing.max_read_size = min(
+                    existing.max_read_size or read_size, read_size
+                )
+            existing.auto_read_size = existing.auto_read_size or auto_read_size
+        else:
+            self._device_read_options[slave_id] = DeviceReadOptions(
+                max_gap=gap,
+                never_read=windows,
+                strategy=strategy,
+                max_read_size=read_size,
+                auto_read_size=auto_read_size,
+            )
+        _LOGGER.debug(
+            "Read planner for slave_id %s: strategy=%s, max_gap=%d, never_read=%s",
+            slave_id,
+            self._device_read_options[slave_id].strategy,
+            self._device_read_options[slave_id].max_gap,
+            self._device_read_options[slave_id].never_read,
+        )
+
+    def reset_device_options(self) -> None:
+        """Drop all per-slave planner options (e.g. before a cache rebuild)."""
+        self._device_read_options.clear()
+
+    def read_options_for(self, slave_id: Any) -> DeviceReadOptions:
+        """Return planner options for a slave (falls back to defaults)."""
+        try:
+            return self._device_read_options.get(
+                int(slave_id), self.default_read_options
+            )
+        except (TypeError, ValueError):
+            return self.default_read_options
+
+    def auto_read_size_slaves(self) -> List[int]:
+        """Return slave ids configured with ``max_read_size: auto``."""
+        return [
+            slave_id
+            for slave_id, options in self._device_read_options.items()
+            if options.auto_read_size
+        ]
+
+    def set_read_size_limit(
+        self, slave_id: int, input_type: str, read_function_code: Any, size: int
+    ) -> None:
+        """Apply a calibrated max read size for one slave and function code."""
+        options = self._device_read_options.setdefault(
+            int(slave_id), DeviceReadOptions()
+        )
+        options.read_size_limits[read_size_key(input_type, read_function_code)] = int(
+            size
+        )
+
+    def set_bad_addresses(
+        self, slave_id: int, windows: List[Tuple[int, int, Optional[str]]]
+    ) -> None:
+        """Replace the learned bad address windows for one slave."""
+        options = self._device_read_options.setdefault(
+            int(slave_id), DeviceReadOptions()
+        )
+        options.bad_addresses = list(windows)
+
+    def cost_model_slaves(self) -> List[int]:
+        """Return slave ids planned with the cost-model strategy."""
+        return [
+            slave_id
+            for slave_id, options in self._device_read_options.items()
+            if options.strategy == READ_STRATEGY_COST
+        ]
+
+    def update_cost_model(
+        self, slave_id: int, request_cost_s: float, word_cost_s: float
+    ) -> bool:
+        """Apply measured costs for a slave; return True if plans should be rebuilt.
+
+        Costs are kept for every slave, whatever its strategy, so cycle-time
+        estimates use measured values; only cost-model plans change shape.
+        """
+        options = self._device_read_options.get(int(slave_id))
+        if options is None:
+            options = self._device_read_options.setdefault(
+                int(slave_id),
+                DeviceReadOptions(max_gap=self.default_read_options.max_gap),
+            )
+
+        def _changed(old: float, new: float) -> bool:
+            return abs(new - old) > _COST_MODEL_REPLAN_THRESHOLD * max(old, 1e-4)
+
+        if not (
+            _changed(options.request_cost_s, request_cost_s)
+            or _changed(options.word_cost_s, word_cost_s)
+        ):
+            return False
+        options.request_cost_s = request_cost_s
+        options.word_cost_s = word_cost_s
+        _LOGGER.debug(
+            "Cost model for slave_id %s: %.4fs per request, %.5fs per word",
+            slave_id,
+            request_cost_s,
+            word_cost_s,
+        )
+        return True
+
+    def estimate_cycle_time(self, ranges: List[RegisterRange]) -> float:
+        """Estimate seconds needed to read all ranges with the current cost model."""
+        return sum(
+            self.read_options_for(range_obj.registers[0].get("slave_id", 1)).range_cost(
+                range_obj.count
+            )
+            for range_obj in ranges
+            if range_obj.registers
+        )
+
+    def _is_plannable(self, reg: Dict[str, Any]) -> bool:
+        """Valid address and not a register the device is known to reject."""
+        if not is_valid_modbus_address(reg.get("address")):
+            return False
+        return not self.read_options_for(reg.get("slave_id", 1)).is_bad_register(reg)
+
     def optimize_registers(
         self, registers: List[Dict[str, Any]]
     ) -> List[RegisterRange]:
@@ -96,10 +407,8 @@ class RegisterOptimizer:
             if not registers:
                 return []
 
-            # Keep zero-based addresses and filter only invalid/negative addresses.
-            filtered_registers = [
-                reg for reg in registers if is_valid_modbus_address(reg.get("address"))
-            ]
+            # Keep zero-based addresses; drop invalid/negative and known-bad ones.
+            filtered_registers = [reg for reg in registers if self._is_plannable(reg)]
 
             # Sort registers by slave_id first, then by address
             # This ensures registers with the same slave_id are grouped together
@@ -108,69 +417,37 @@ class RegisterOptimizer:
                 key=lambda x: (x.get("slave_id", 1), x.get("address", 0)),
             )
 
-            ranges = []
-            current_range = None
-
+            cost_groups: Dict[Tuple[Any, str, Any], List[Dict[str, Any]]] = {}
+            greedy_registers = []
             for reg in sorted_registers:
-                address = reg.get("address", 0)
-                count = reg.get("count", 1)
-                if count is None:
-                    count = 1
-                end_address = address + count - 1
-
-                if current_range is None:
-                    # Start new range
-                    current_range = RegisterRange(
-                        start_address=address, end_address=end_address, registers=[reg]
+                slave_id = reg.get("slave_id", 1)
+                if self.read_options_for(slave_id).strategy == READ_STRATEGY_COST:
+                    key = (
+                        slave_id,
+                        reg.get("input_type", "holding"),
+                        reg.get("read_function_code"),
                     )
+                    cost_groups.setdefault(key, []).append(reg)
                 else:
-                    # Check if register can be appended to current range
-                    # Must have same input_type, slave_id, and compatible function codes to be grouped together
-                    current_input_type = current_range.registers[0].get(
-                        "input_type", "holding"
-                    )
-                    reg_input_type = reg.get("input_type", "holding")
-
-                    # Check if registers have the same slave_id
-                    current_slave_id = current_range.registers[0].get("slave_id", 1)
-                    reg_slave_id = reg.get("slave_id", 1)
-                    slave_ids_match = current_slave_id == reg_slave_id
-
-                    # Check if registers have compatible function codes
-                    current_read_fc = current_range.registers[0].get(
-                        "read_function_code"
-                    )
-                    reg_read_fc = reg.get("read_function_code")
-                    function_codes_compatible = current_read_fc == reg_read_fc or (
-                        current_read_fc is None and reg_read_fc is None
-                    )
-
-                    add_w = _register_width_for_merge(reg)
-                    if (
-                        address <= current_range.end_address + 1
-                        and current_range.register_count + add_w <= self.max_read_size
-                        and current_input_type
-                        == reg_input_type  # Same input_type required
-                        and slave_ids_match  # Same slave_id required
-                        and function_codes_compatible  # Same function code required
-                    ):
-                        # Extend range
-                        current_range.end_address = max(
-                            current_range.end_address, end_address
-                        )
-                        current_range.registers.append(reg)
-                    else:
-                        # Finish current range and start new one
-                        ranges.append(current_range)
-                        current_range = RegisterRange(
-                            start_address=address,
-                            end_address=end_address,
-                            registers=[reg],
+                    greedy_registers.append(reg)
+
+            ranges = self._merge_greedy(greedy_registers)
+            if cost_groups:
+                for (slave_id, input_type, read_fc), group in cost_groups.items():
+                    options = self.read_options_for(slave_id)
+                    ranges.extend(
+                        self._merge_cost_model(
+                            group,
+                            input_type,
+                            options,
+                            options.read_size_limit(
+                                input_type, read_fc, self.max_read_size
+                            ),
                         )
-
-            # Add last range
-            if current_range:
-                ranges.append(current_range)
+                    )
+                ranges.sort(
+                    key=lambda r: (r.registers[0].get("slave_id", 1), r.start_address)
+                )
 
             return ranges
 
@@ -180,12 +457,206 @@ class RegisterOptimizer:
             return [
                 RegisterRange(
                     start_address=reg.get("address", 0),
-                    end_address=reg.get("address", 0) + (reg.get("count", 1) or 1) - 1,
+                    end_address=register_end_address(reg),
                     registers=[reg],
                 )
                 for reg in registers
             ]
 
+    def _merge_greedy(
+        self, sorted_registers: List[Dict[str, Any]]
+    ) -> List[RegisterRange]:
+        """Single sweep: extend the current range while the next register fits."""
+        ranges = []
+        current_range = None
+
+        for reg in sorted_registers:
+            address = reg.get("address", 0)
+            end_address = register_end_address(reg)
+
+            if current_range is None:
+                # Start new range
+                current_range = RegisterRange(
+                    start_address=address, end_address=end_address, registers=[reg]
+                )
+            else:
+                # Check if register can be appended to current range
+                # Must have same input_type, slave_id, and compatible function codes to be grouped together
+                current_input_type = current_range.registers[0].get(
+                    "input_type", "holding"
+                )
+                reg_input_type = reg.get("input_type", "holding")
+
+                # Check if registers have the same slave_id
+                current_slave_id = current_range.registers[0].get("slave_id", 1)
+                reg_slave_id = reg.get("slave_id", 1)
+                slave_ids_match = current_slave_id == reg_slave_id
+
+                # Check if registers have compatible function codes
+                current_read_fc = current_range.registers[0].get("read_function_code")
+                reg_read_fc = reg.get("read_function_code")
+                function_codes_compatible = current_read_fc == reg_read_fc or (
+                    current_read_fc is None and reg_read_fc is None
+                )
+
+                # Gap bridging: read up to max_gap unused words between two
+                # entities unless the hole touches a never_read window.
+                read_options = self.read_options_for(reg_slave_id)
+                hole_start = current_range.end_address + 1
+                gap_ok = address <= hole_start + read_options.max_gap and (
+                    address <= hole_start
+                    or read_options.hole_is_readable(
+                        reg_input_type, hole_start, address - 1
+                    )
+                )
+                new_span = (
+                    max(current_range.end_address, end_address)
+                    - current_range.start_address
+                    + 1
+                )
+                if (
+                    gap_ok
+                    and new_span
+                    <= read_options.read_size_limit(
+                        reg_input_type, reg_read_fc, self.max_read_size
+                    )
+                    and current_input_type == reg_input_type  # Same input_type required
+                    and slave_ids_match  # Same slave_id required
+                    and function_codes_compatible  # Same function code required
+                ):
+                    # Extend range
+                    current_range.end_address = max(
+                        current_range.end_address, end_address
+                    )
+                    current_range.registers.append(reg)
+                else:
+                    # Finish current range and start new one
+                    ranges.append(current_range)
+                    current_range = RegisterRange(
+                        start_address=address,
+                        end_address=end_address,
+                        registers=[reg],
+                    )
+
+        # Add last range
+        if current_range:
+            ranges.append(current_range)
+
+        return ranges
+
+    def _merge_cost_model(
+        self,
+        registers: List[Dict[str, Any]],
+        input_type: str,
+        options: DeviceReadOptions,
+        max_read_size: int,
+    ) -> List[RegisterRange]:
+        """Partition one slave/function-code group to minimise estimated cycle time.
+
+        Dynamic programming over the address-sorted registers: best[j] is the
+        cheapest way to read the first j registers, each range costing
+        request_cost_s + word_cost_s * span. Holes are bridged only up to
+        max_gap words and never across never_read windows.
+        """
+        n = len(registers)
+        starts = [reg.get("address", 0) for reg in registers]
+        ends = [register_end_address(reg) for reg in registers]
+
+        # bridgeable[k]: the hole before register k may be read as padding
+        bridgeable = [True] * n
+        covered_end = ends[0]
+        for k in range(1, n):
+            hole_first = covered_end + 1
+            hole_last = starts[k] - 1
+            if hole_last >= hole_first:
+                bridgeable[k] = hole_last - hole_first + 1 <= options.max_gap and (
+                    options.hole_is_readable(input_type, hole_first, hole_last)
+                )
+            covered_end = max(covered_end, ends[k])
+
+        best = [0.0] + [math.inf] * n
+        split = [0] * (n + 1)
+        for j in range(1, n + 1):
+            range_end = -1
+            for i in range(j, 0, -1):
+                range_end = max(range_end, ends[i - 1])
+                span = range_end - starts[i - 1] + 1
+                if span > max_read_size and i < j:
+                    break
+                cost = best[i - 1] + options.range_cost(span)
+                if cost < best[j]:
+                    best[j] = cost
+                    split[j] = i - 1
+                if not bridgeable[i - 1]:
+                    break
+
+        ranges = []
+        j = n
+        while j > 0:
+            i = split[j]
+            ranges.append(
+                RegisterRange(
+                    start_address=starts[i],
+                    end_address=max(ends[i:j]),
+                    registers=list(registers[i:j]),
+                )
+            )
+            j = i
+        ranges.reverse()
+        return ranges
+
+    def build_read_plan(
+        self,
+        intervals: FrozenSet[int],
+        registers: List[Dict[str, Any]],
+        extra_registers: List[Dict[str, Any]] | None = None,
+    ) -> ReadPlan:
+        """Compile the ranges for a set of due intervals once so polling can reuse them.
+
+        For cost-model slaves, extra_registers (groups not due) that lie fully
+        inside a planned range ride along for free instead of waiting for
+        their own, separate read.
+        """
+        ranges = self.optimize_registers(registers)
+        piggyback_count = 0
+        if extra_registers:
+            piggyback_count = self._attach_piggyback_registers(ranges, extra_registers)
+        return ReadPlan(
+            intervals=frozenset(intervals),
+            ranges=ranges,
+            register_count=len(registers),
+            total_bytes=sum(range_obj.count * 2 for range_obj in ranges),
+            estimated_duration=self.estimate_cycle_time(ranges),
+            piggyback_count=piggyback_count,
+        )
+
+    def _attach_piggyback_registers(
+        self, ranges: List[RegisterRange], extra_registers: List[Dict[str, Any]]
+    ) -> int:
+        """Add not-due registers covered by a cost-model range; return how many."""
+        attached = 0
+        for range_obj in ranges:
+            first = range_obj.registers[0]
+            slave_id = first.get("slave_id", 1)
+            if self.read_options_for(slave_id).strategy != READ_STRATEGY_COST:
+                continue
+            input_type = first.get("input_type", "holding")
+            read_fc = first.get("read_function_code")
+            for reg in extra_registers:
+                address = reg.get("address")
+                if (
+                    not self._is_plannable(reg)
+                    or reg.get("slave_id", 1) != slave_id
+                    or reg.get("input_type", "holding") != input_type
+                    or reg.get("read_function_code") != read_fc
+                    or address < range_obj.start_address
+                    or register_end_address(reg) > range_obj.end_address
+                ):
+                    continue
+                range_obj.registers.append(reg)
+                attached += 1
+        return attached
+
     def get_register_value(
         self, register: Dict[str, Any], register_data: List[int], range_start: int
     ) -> Any:
@@ -248,9 +719,15 @@ class RegisterOptimizer:
             return None
 
     def calculate_optimization_stats(
-        self, registers: List[Dict[str, Any]]
+        self,
+        registers: List[Dict[str, Any]],
+        achieved_cycle_time_s: float | None = None,
     ) -> Dict[str, Any]:
-        """Calculate optimization statistics."""
+        """Calculate optimization statistics.
+
+        achieved_cycle_time_s is the measured duration of a full cycle (if
+        known) and is reported next to the cost-model estimate.
+        """
         try:
             total_registers = len(registers)
             total_addresses = sum(reg.get("count", 1) or 1 for reg in registers)
@@ -261,6 +738,7 @@ class RegisterOptimizer:
             # With optimization
             optimized_ranges = self.optimize_registers(registers)
             reads_with_optimization = len(optimized_ranges)
+            padding_words = sum(r.padding_count for r in optimized_ranges)
 
             # Calculate performance improvement
             improvement = (
@@ -280,7 +758,14 @@ class RegisterOptimizer:
                 "reads_with_optimization": reads_with_optimization,
                 "improvement_percent": round(improvement, 1),
                 "optimized_ranges": len(optimized_ranges),
+                "words_read": sum(r.count for r in optimized_ranges),
+                "padding_words": padding_words,
+                "estimated_cycle_time_s": round(
+                    self.estimate_cycle_time(optimized_ranges), 3
+                ),
             }
+            if achieved_cycle_time_s is not None:
+                stats["achieved_cycle_time_s"] = round(achieved_cycle_time_s, 3)
 
             _LOGGER.debug("Optimization statistics: %s", stats)
             return stats
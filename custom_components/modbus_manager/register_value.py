@@ -0,0 +1,83 @@
+"""Latest value of one register, stored as a compact record."""
+
+from __future__ import annotations
+
+from collections.abc import Mapping
+from typing import Any, Dict, Iterator
+
+_ALWAYS_PRESENT = ("raw_value", "processed_value", "register_config", "timestamp")
+
+
+class RegisterValue(Mapping):
+    """Slotted record that is updated in place on every poll.
+
+    It is a read-only Mapping with the keys of the former per-poll dict
+    (``raw_value``, ``processed_value``, ``register_config``, ``timestamp`` and
+    ``numeric_value`` when set), so ``coordinator.data[key].get(...)`` keeps
+    working for entities and other consumers. ``raw_words`` holds the Modbus
+    words the value was decoded from; it is not part of the mapping.
+    """
+
+    __slots__ = (
+        "raw_value",
+        "processed_value",
+        "numeric_value",
+        "register_config",
+        "timestamp",
+        "raw_words",
+    )
+
+    def __init__(self, register_config: Dict[str, Any]) -> None:
+        self.register_config = register_config
+        self.raw_value: Any = None
+        self.processed_value: Any = None
+        self.numeric_value: Any = None
+        self.timestamp = 0.0
+        self.raw_words: tuple | None = None
+
+    def set_value(
+        self,
+        raw_value: Any,
+        processed_value: Any,
+        numeric_value: Any,
+        timestamp: float,
+        raw_words: tuple | None = None,
+    ) -> bool:
+        """Store a new reading; return True if any value changed."""
+        changed = (
+            raw_value != self.raw_value
+            or processed_value != self.processed_value
+            or numeric_value != self.numeric_value
+        )
+        self.raw_value = raw_value
+        self.processed_value = processed_value
+        self.numeric_value = numeric_value
+        self.timestamp = timestamp
+        self.raw_words = raw_words
+        return changed
+
+    def __getitem__(self, key: str) -> Any:
+        if key in _ALWAYS_PRESENT:
+            return getattr(self, key)
+        if key == "numeric_value" and self.numeric_value is not None:
+            return self.numeric_value
+        raise KeyError(key)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Return a value like dict.get (without the KeyError round trip)."""
+        if key in _ALWAYS_PRESENT:
+            return getattr(self, key)
+        if key == "numeric_value" and self.numeric_value is not None:
+            return self.numeric_value
+        return default
+
+    def __iter__(self) -> Iterator[str]:
+        yield from _ALWAYS_PRESENT
+        if self.numeric_value is not None:
+            yield "numeric_value"
+
+    def __len__(self) -> int:
+        return len(_ALWAYS_PRESENT) + (self.numeric_value is not None)
+
+    def __repr__(self) -> str:
+        return f"RegisterValue({dict(self)!r})"
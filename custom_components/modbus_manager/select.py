@@ -9,7 +9,10 @@ from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity import DeviceInfo, EntityCategory
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
+from homeassistant.helpers.update_coordinator import (
+    BaseCoordinatorEntity,
+    CoordinatorEntity,
+)
 
 from .const import DOMAIN
 from .coordinator import ModbusCoordinator
@@ -372,13 +375,27 @@ class ModbusCoordinatorSelect(CoordinatorEntity, SelectEntity):
         if not is_coordinator_connected(self.coordinator) or not super().available:
             return False
         return is_register_dependency_met(
-            self.coordinator.data, self._register_dependency
+            self.coordinator.data, self._register_dependency, self.coordinator
         )
 
     async def async_added_to_hass(self) -> None:
         """When entity is added to hass."""
-        await super().async_added_to_hass()
-        # CoordinatorEntity already handles listener registration, but we can add custom logic here if needed
+        if self._register_dependency or self._attr_force_update:
+            # Availability follows another register, or force_update writes
+            # every poll: keep the per-poll listener
+            await super().async_added_to_hass()
+            return
+        # Skip BaseCoordinatorEntity, which registers the per-poll listener:
+        # the coordinator calls back only when this register's value or
+        # availability changed
+        await super(BaseCoordinatorEntity, self).async_added_to_hass()
+        self.async_on_remove(
+            self.coordinator.async_add_register_listener(
+                self.register_key, self._handle_coordinator_update
+            )
+        )
+        if self.coordinator.get_register_data(self.register_key):
+            self._handle_coordinator_update()
 
 
 async def async_setup_entry(
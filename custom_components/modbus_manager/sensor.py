@@ -10,7 +10,10 @@ from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers import entity_registry
 from homeassistant.helpers.entity import DeviceInfo, EntityCategory
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
+from homeassistant.helpers.update_coordinator import (
+    BaseCoordinatorEntity,
+    CoordinatorEntity,
+)
 
 from .combined_entities import CombinedPairTypeSensor, CombinedSumSensor
 from .combined_specs import COMBINED_SENSOR_METRIC_SPECS, combination_type_for_entry
@@ -300,8 +303,21 @@ class ModbusCoordinatorSensor(CoordinatorEntity, SensorEntity):
 
     async def async_added_to_hass(self) -> None:
         """When entity is added to hass."""
-        await super().async_added_to_hass()
-        # CoordinatorEntity already handles listener registration, but we can add custom logic here if needed
+        if self._attr_force_update:
+            # force_update writes every poll: keep the per-poll listener
+            await super().async_added_to_hass()
+            return
+        # Skip BaseCoordinatorEntity, which registers the per-poll listener:
+        # the coordinator calls back only when this register's value or
+        # availability changed
+        await super(BaseCoordinatorEntity, self).async_added_to_hass()
+        self.async_on_remove(
+            self.coordinator.async_add_register_listener(
+                self.register_key, self._handle_coordinator_update
+            )
+        )
+        if self.coordinator.get_register_data(self.register_key):
+            self._handle_coordinator_update()
 
 
 async def async_setup_entry(
@@ -1,15 +1,19 @@
 """Template Loader for Modbus Manager."""
 
 import asyncio
+import hashlib
+import json
 import logging
 import os
 import re
-from typing import Any, Dict, List, Optional
+import time
+from typing import Any, Dict, List, Optional, Tuple
 
 import yaml
 from homeassistant.core import HomeAssistant
 from homeassistant.util.async_ import run_callback_threadsafe
 
+from .condition_compiler import evaluate_condition
 from .device_utils import entity_allowed_for_protocol
 from .modbus_utils import is_valid_modbus_address
 
@@ -23,6 +27,28 @@ def set_hass_instance(hass: HomeAssistant) -> None:
     _hass_instance = hass
 
 
+# C YAML parser when libyaml is available (same results as SafeLoader, much faster)
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# Bump when the processed template structure changes
+_COMPILED_CACHE_FORMAT = 2
+# Modules whose code shapes processed templates (their mtimes are fingerprinted)
+_PROCESSING_MODULES = (
+    "template_loader.py",
+    "condition_compiler.py",
+    "const.py",
+    "device_utils.py",
+    "modbus_utils.py",
+)
+# JSON form of dicts with non-string keys (e.g. value maps with int keys)
+_JSON_ITEMS_KEY = "__mm_items__"
+
+
+def _load_yaml(stream: Any) -> Any:
+    """Parse YAML with the fastest available safe loader."""
+    return yaml.load(stream, Loader=_YAML_LOADER)  # nosec B506 - safe loader
+
+
 # Template cache with file modification time tracking
 _template_cache: Dict[str, Dict[str, Any]] = {}
 _base_template_cache: Optional[Dict[str, Dict[str, Any]]] = None
@@ -31,6 +57,10 @@ _cache_file_mtimes: Dict[str, float] = {}
 _template_name_to_path: Dict[str, str] = {}
 # Cache mapping template YAML `name` field to file stem (e.g. sungrow_shx_dynamic)
 _template_name_to_stem: Dict[str, str] = {}
+# Header-only template index: file path -> (mtime, header metadata)
+_template_header_cache: Dict[str, Tuple[float, Dict[str, Any]]] = {}
+# Template files that failed to load or validate -> their mtime at that time
+_invalid_template_mtimes: Dict[str, float] = {}
 
 
 def _get_file_mtime(file_path: str) -> float:
@@ -57,6 +87,8 @@ def _invalidate_cache() -> None:
     _cache_file_mtimes.clear()
     _template_name_to_path.clear()
     _template_name_to_stem.clear()
+    _template_header_cache.clear()
+    _invalid_template_mtimes.clear()
 
 
 from .const import (
@@ -89,22 +121,140 @@ def _register_template_name_stem(template_name: str, template_path: str) -> None
     _template_name_to_stem[str(template_name).strip()] = stem
 
 
-def _scan_template_directory_for_name_stems(template_dir: str) -> None:
-    """Scan a template directory and map YAML name fields to file stems."""
+# Top-level keys kept by the header-only template index
+_HEADER_KEYS = frozenset(
+    {
+        "name",
+        "display_name",
+        "description",
+        "manufacturer",
+        "model",
+        "version",
+        "type",
+        "firmware_version",
+        "default_prefix",
+        "default_slave_id",
+        "requires_connection_type",
+        "config_flow_note",
+        "extends",
+    }
+)
+
+
+def _compose_header_value(loader: Any) -> yaml.Node:
+    """Compose the node of a header value from the loader's event stream."""
+    event = loader.get_event()
+    if isinstance(event, yaml.ScalarEvent):
+        tag = event.tag
+        if tag is None or tag == "!":
+            tag = loader.resolve(yaml.ScalarNode, event.value, event.implicit)
+        return yaml.ScalarNode(
+            tag, event.value, event.start_mark, event.end_mark, style=event.style
+        )
+    if isinstance(event, yaml.SequenceStartEvent):
+        tag = event.tag
+        if tag is None or tag == "!":
+            tag = loader.resolve(yaml.SequenceNode, None, event.implicit)
+        items = []
+        while not loader.check_event(yaml.SequenceEndEvent):
+            items.append(_compose_header_value(loader))
+        end_event = loader.get_event()
+        return yaml.SequenceNode(tag, items, event.start_mark, end_event.end_mark)
+    if isinstance(event, yaml.MappingStartEvent):
+        tag = event.tag
+        if tag is None or tag == "!":
+            tag = loader.resolve(yaml.MappingNode, None, event.implicit)
+        pairs = []
+        while not loader.check_event(yaml.MappingEndEvent):
+            key_node = _compose_header_value(loader)
+            pairs.append((key_node, _compose_header_value(loader)))
+        end_event = loader.get_event()
+        return yaml.MappingNode(tag, pairs, event.start_mark, end_event.end_mark)
+    # Aliases are not used in template headers
+    raise yaml.YAMLError(f"Unsupported header value at {event.start_mark}")
+
+
+def _skip_yaml_value(loader: Any) -> None:
+    """Consume the events of one value without building it."""
+    depth = 0
+    while True:
+        event = loader.get_event()
+        if isinstance(event, (yaml.SequenceStartEvent, yaml.MappingStartEvent)):
+            depth += 1
+        elif isinstance(event, (yaml.SequenceEndEvent, yaml.MappingEndEvent)):
+            depth -= 1
+        if depth == 0:
+            return
+
+
+def _parse_template_header(stream: Any) -> Dict[str, Any]:
+    """Read the top-level header keys of a template YAML document.
+
+    Walks the parser events and only constructs the values of _HEADER_KEYS;
+    sensors, controls and the other sections are skipped without building
+    Python objects.
+    """
+    loader = _YAML_LOADER(stream)
+    header: Dict[str, Any] = {}
+    try:
+        loader.get_event()  # StreamStartEvent
+        if not loader.check_event(yaml.DocumentStartEvent):
+            return header
+        loader.get_event()
+        if not loader.check_event(yaml.MappingStartEvent):
+            return header
+        loader.get_event()
+        while not loader.check_event(yaml.MappingEndEvent):
+            key_event = loader.peek_event()
+            if isinstance(key_event, yaml.ScalarEvent) and key_event.value in (
+                _HEADER_KEYS
+            ):
+                loader.get_event()
+                node = _compose_header_value(loader)
+                header[key_event.value] = loader.construct_object(node, deep=True)
+            else:
+                _skip_yaml_value(loader)
+                _skip_yaml_value(loader)
+    finally:
+        loader.dispose()
+    return header
+
+
+def _read_template_header(template_path: str) -> Optional[Dict[str, Any]]:
+    """Return the header metadata of a template file (cached by mtime)."""
+    mtime = _get_file_mtime(template_path)
+    cached = _template_header_cache.get(template_path)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+    try:
+        with open(template_path, "r", encoding="utf-8") as handle:
+            header = _parse_template_header(handle)
+    except (OSError, yaml.YAMLError) as e:
+        _LOGGER.debug("Could not read template header %s: %s", template_path, str(e))
+        return None
+    _template_header_cache[template_path] = (mtime, header)
+    return header
+
+
+def _list_template_files(template_dir: str) -> List[str]:
+    """Return the YAML template files of a directory (no subdirectories)."""
     if not template_dir or not os.path.isdir(template_dir):
-        return
-    for filename in os.listdir(template_dir):
+        return []
+    template_paths = []
+    for filename in sorted(os.listdir(template_dir)):
         if not filename.endswith((".yaml", ".yml")):
             continue
         template_path = os.path.join(template_dir, filename)
-        if not os.path.isfile(template_path):
-            continue
-        try:
-            with open(template_path, "r", encoding="utf-8") as handle:
-                data = yaml.safe_load(handle) or {}
-        except (OSError, yaml.YAMLError):
-            continue
-        template_name = data.get("name")
+        if os.path.isfile(template_path):
+            template_paths.append(template_path)
+    return template_paths
+
+
+def _scan_template_directory_for_name_stems(template_dir: str) -> None:
+    """Scan a template directory and map YAML name fields to file stems."""
+    for template_path in _list_template_files(template_dir):
+        header = _read_template_header(template_path) or {}
+        template_name = header.get("name")
         if template_name:
             _register_template_name_stem(str(template_name).strip(), template_path)
 
@@ -254,6 +404,7 @@ async def load_templates() -> List[Dict[str, Any]]:
        Custom templates can override built-in templates with the same name.
     """
     try:
+        started = time.perf_counter()
         # Load base templates first
         base_templates = await load_base_templates()
 
@@ -322,11 +473,21 @@ async def load_templates() -> List[Dict[str, Any]]:
 
         templates = list(templates_dict.values())
 
+        cache_dir = _compiled_cache_dir()
+        if cache_dir:
+            await asyncio.get_running_loop().run_in_executor(
+                None,
+                _prune_compiled_templates,
+                cache_dir,
+                [TEMPLATE_DIR, BASE_TEMPLATE_DIR, MAPPING_DIR, custom_dir],
+            )
+
         _LOGGER.debug(
-            "Loaded %d templates total (%d built-in, %d custom)",
+            "Loaded %d templates total (%d built-in, %d custom) in %.1f ms",
             len(templates),
             len([t for t in templates if not t.get("_is_custom", False)]),
             len([t for t in templates if t.get("_is_custom", False)]),
+            (time.perf_counter() - started) * 1000,
         )
         return templates
 
@@ -471,6 +632,18 @@ async def load_single_template(
     template_path: str, base_templates: Dict[str, Dict[str, Any]] = None
 ) -> Optional[Dict[str, Any]]:
     """Load a single template file asynchronously with caching."""
+    result = await _load_single_template(template_path, base_templates)
+    if result is None:
+        # Keep the file out of the header index until it changes
+        _invalid_template_mtimes[template_path] = _get_file_mtime(template_path)
+    else:
+        _invalid_template_mtimes.pop(template_path, None)
+    return result
+
+
+async def _load_single_template(
+    template_path: str, base_templates: Optional[Dict[str, Dict[str, Any]]]
+) -> Optional[Dict[str, Any]]:
     try:
         # Check cache first
         cache_key = template_path
@@ -478,8 +651,23 @@ async def load_single_template(
             _LOGGER.debug("Using cached template: %s", template_path)
             return _template_cache[cache_key]
 
-        # Read file in thread-safe way
         loop = asyncio.get_running_loop()
+        started = time.perf_counter()
+        cache_dir = _compiled_cache_dir()
+        if cache_dir:
+            compiled = await loop.run_in_executor(
+                None, _read_compiled_template, cache_dir, template_path
+            )
+            if compiled is not None:
+                _remember_template(template_path, compiled)
+                _LOGGER.debug(
+                    "Template %s loaded from compiled cache in %.1f ms (warm)",
+                    compiled.get("name"),
+                    (time.perf_counter() - started) * 1000,
+                )
+                return compiled
+
+        # Read file in thread-safe way
         data = await loop.run_in_executor(None, _read_template_file, template_path)
 
         if not data:
@@ -698,6 +886,10 @@ async def load_single_template(
         if display_name is not None and str(display_name).strip():
             result["display_name"] = str(display_name).strip()
 
+        # Read planner options (gap bridging / never_read address windows)
+        if "read_planner" in data:
+            result["read_planner"] = data["read_planner"]
+
         # Extract SunSpec metadata if present
         if "sunspec_enabled" in data:
             result["sunspec_enabled"] = data["sunspec_enabled"]
@@ -716,13 +908,17 @@ async def load_single_template(
             result["extends"] = extends_name
 
         # Cache the result
-        cache_key = template_path
-        _template_cache[cache_key] = result
-        _cache_file_mtimes[template_path] = _get_file_mtime(template_path)
-        # Cache template name to path mapping
-        if template_name:
-            _template_name_to_path[template_name] = template_path
-            _register_template_name_stem(template_name, template_path)
+        _remember_template(template_path, result)
+        # Templates extending a base template also depend on the base file
+        if cache_dir and not extends_name:
+            await loop.run_in_executor(
+                None, _write_compiled_template, cache_dir, template_path, result
+            )
+        _LOGGER.debug(
+            "Template %s parsed and validated in %.1f ms (cold)",
+            template_name,
+            (time.perf_counter() - started) * 1000,
+        )
 
         return result
 
@@ -734,11 +930,140 @@ async def load_single_template(
         return None
 
 
+def _remember_template(template_path: str, result: Dict[str, Any]) -> None:
+    """Store a loaded template in the in-memory caches."""
+    _template_cache[template_path] = result
+    _cache_file_mtimes[template_path] = _get_file_mtime(template_path)
+    # Cache template name to path mapping
+    template_name = result.get("name")
+    if template_name:
+        _template_name_to_path[template_name] = template_path
+        _register_template_name_stem(template_name, template_path)
+
+
+def _compiled_cache_dir() -> Optional[str]:
+    """Directory for compiled templates (config/modbus_manager/template_cache)."""
+    if not _hass_instance:
+        return None
+    try:
+        return os.path.join(
+            _hass_instance.config.config_dir, "modbus_manager", "template_cache"
+        )
+    except Exception as e:
+        _LOGGER.debug("Compiled template cache unavailable: %s", str(e))
+        return None
+
+
+def _compiled_cache_file(cache_dir: str, template_path: str) -> str:
+    stem = os.path.splitext(os.path.basename(template_path))[0]
+    path_digest = hashlib.sha256(template_path.encode("utf-8")).hexdigest()[:12]
+    return os.path.join(cache_dir, f"{stem}-{path_digest}.json")
+
+
+def _template_fingerprint(template_path: str) -> list:
+    """Identify a template file version and the loader code that processed it."""
+    with open(template_path, "rb") as f:
+        content_hash = hashlib.sha256(f.read()).hexdigest()
+    module_dir = os.path.dirname(__file__)
+    return [
+        _COMPILED_CACHE_FORMAT,
+        [
+            _get_file_mtime(os.path.join(module_dir, name))
+            for name in _PROCESSING_MODULES
+        ],
+        _get_file_mtime(template_path),
+        content_hash,
+    ]
+
+
+def _to_json_value(value: Any) -> Any:
+    """Convert a processed template to JSON types, keeping non-string keys."""
+    if isinstance(value, dict):
+        if _JSON_ITEMS_KEY in value or not all(isinstance(k, str) for k in value):
+            return {_JSON_ITEMS_KEY: [[k, _to_json_value(v)] for k, v in value.items()]}
+        return {k: _to_json_value(v) for k, v in value.items()}
+    if isinstance(value, list):
+        return [_to_json_value(v) for v in value]
+    return value
+
+
+def _from_json_object(obj: Dict[str, Any]) -> Dict[str, Any]:
+    if len(obj) == 1 and _JSON_ITEMS_KEY in obj:
+        return {key: value for key, value in obj[_JSON_ITEMS_KEY]}
+    return obj
+
+
+def _read_compiled_template(
+    cache_dir: str, template_path: str
+) -> Optional[Dict[str, Any]]:
+    """Return the compiled template if it matches the file (called in executor)."""
+    cache_file = _compiled_cache_file(cache_dir, template_path)
+    if not os.path.exists(cache_file):
+        return None
+    try:
+        with open(cache_file, "r", encoding="utf-8") as f:
+            entry = json.load(f, object_hook=_from_json_object)
+        if (
+            isinstance(entry, dict)
+            and entry.get("path") == template_path
+            and entry.get("fingerprint") == _template_fingerprint(template_path)
+            and isinstance(entry.get("result"), dict)
+        ):
+            return entry["result"]
+    except Exception as e:
+        _LOGGER.debug("Ignoring compiled template %s: %s", cache_file, str(e))
+    return None
+
+
+def _write_compiled_template(
+    cache_dir: str, template_path: str, result: Dict[str, Any]
+) -> None:
+    """Store a validated template for the next start (called in executor)."""
+    cache_file = _compiled_cache_file(cache_dir, template_path)
+    try:
+        entry = {
+            "path": template_path,
+            "fingerprint": _template_fingerprint(template_path),
+            "result": result,
+        }
+        content = json.dumps(_to_json_value(entry))
+        # Only cache what reads back identically (e.g. no tuples or sets)
+        if json.loads(content, object_hook=_from_json_object) != entry:
+            _LOGGER.debug("Template %s is not cacheable as JSON", template_path)
+            return
+        os.makedirs(cache_dir, exist_ok=True)
+        temp_file = f"{cache_file}.tmp"
+        with open(temp_file, "w", encoding="utf-8") as f:
+            f.write(content)
+        os.replace(temp_file, cache_file)
+    except Exception as e:
+        _LOGGER.debug("Could not write compiled template %s: %s", cache_file, str(e))
+
+
+def _prune_compiled_templates(cache_dir: str, template_dirs: List[str]) -> None:
+    """Delete compiled templates whose template file no longer exists."""
+    if not os.path.isdir(cache_dir):
+        return
+    expected = {
+        os.path.basename(_compiled_cache_file(cache_dir, template_path))
+        for template_dir in template_dirs
+        for template_path in _list_template_files(template_dir)
+    }
+    for filename in os.listdir(cache_dir):
+        if filename in expected:
+            continue
+        try:
+            os.remove(os.path.join(cache_dir, filename))
+            _LOGGER.debug("Removed stale compiled template %s", filename)
+        except OSError as e:
+            _LOGGER.debug("Could not remove compiled template %s: %s", filename, e)
+
+
 def _read_template_file(template_path: str) -> Optional[Dict[str, Any]]:
     """Read template file synchronously (called in executor)."""
     try:
         with open(template_path, "r", encoding="utf-8") as f:
-            return yaml.safe_load(f)
+            return _load_yaml(f)
     except Exception as e:
         _LOGGER.error("Error reading template %s: %s", template_path, str(e))
         return None
@@ -792,7 +1117,7 @@ def _should_include_sensor(
     # Check condition filter first
     condition = sensor.get("condition")
     if condition:
-        if not _evaluate_condition(condition, dynamic_config):
+        if not evaluate_condition(condition, dynamic_config):
             _LOGGER.debug(
                 "Excluding sensor due to condition '%s': %s (unique_id: %s)",
                 condition,
@@ -802,7 +1127,7 @@ def _should_include_sensor(
             return False
 
     # Legacy condition parsing (kept for backward compatibility with old format)
-    # This handles old conditions that don't use the new _evaluate_single_condition function
+    # This handles old conditions that don't use the compiled evaluate_condition
     # Can be removed once all templates are migrated
     condition_legacy = sensor.get("condition")
     if condition_legacy and " or " not in condition_legacy:
@@ -1054,296 +1379,6 @@ def _should_include_sensor(
     return True
 
 
-def _evaluate_condition(condition: str, dynamic_config: dict) -> bool:
-    """Evaluate a condition with support for nested AND/OR operators and parentheses.
-
-    Supports:
-    - Simple conditions: "phases > 1", "meter_type == 'DTSU666'"
-    - AND conditions: "a == 1 and b == 2"
-    - OR conditions: "a == 1 or a == 2"
-    - Nested conditions: "(a == 1 or a == 2) and b > 1"
-
-    Args:
-        condition: The condition string to evaluate
-        dynamic_config: Dictionary containing dynamic configuration values
-
-    Returns:
-        True if condition is met, False otherwise
-    """
-    condition = condition.strip()
-
-    # Remove outer parentheses if present
-    while condition.startswith("(") and condition.endswith(")"):
-        # Check if parentheses are balanced
-        depth = 0
-        is_outer = True
-        for i, char in enumerate(condition):
-            if char == "(":
-                depth += 1
-            elif char == ")":
-                depth -= 1
-                if depth == 0 and i < len(condition) - 1:
-                    is_outer = False
-                    break
-        if is_outer:
-            condition = condition[1:-1].strip()
-        else:
-            break
-
-    # Find the operator with lowest precedence (outside parentheses)
-    # OR has lower precedence than AND
-    depth = 0
-    or_pos = -1
-    and_pos = -1
-
-    for i, char in enumerate(condition):
-        if char == "(":
-            depth += 1
-        elif char == ")":
-            depth -= 1
-        elif depth == 0:
-            # Check for " or " (with spaces)
-            if i + 4 <= len(condition) and condition[i : i + 4] == " or ":
-                or_pos = i + 2  # Position after "or"
-            # Check for " and " (with spaces)
-            elif i + 5 <= len(condition) and condition[i : i + 5] == " and ":
-                if and_pos == -1:  # Only record first AND at this level
-                    and_pos = i + 2  # Position after "and"
-
-    # Split by lowest precedence operator
-    if or_pos != -1:
-        # Split by OR
-        left = condition[: or_pos - 2].strip()
-        right = condition[or_pos + 2 :].strip()
-        return _evaluate_condition(left, dynamic_config) or _evaluate_condition(
-            right, dynamic_config
-        )
-    elif and_pos != -1:
-        # Split by AND
-        left = condition[: and_pos - 2].strip()
-        right = condition[and_pos + 3 :].strip()
-        return _evaluate_condition(left, dynamic_config) and _evaluate_condition(
-            right, dynamic_config
-        )
-    else:
-        # No operators found, evaluate as single condition
-        return _evaluate_single_condition(condition, dynamic_config)
-
-
-def _evaluate_single_condition(condition: str, dynamic_config: dict) -> bool:
-    """Evaluate a single condition (without OR/AND support).
-
-    Supports:
-    - "variable == value" (string, int, bool)
-    - "variable != value" (string, int, bool)
-    - "variable >= value" (int)
-    - "variable in [value1, value2]" (string list)
-    """
-    condition = condition.strip()
-
-    if " not in " in condition:
-        try:
-            parts = condition.split(" not in ")
-            if len(parts) == 2:
-                variable_name = parts[0].strip()
-                required_values_str = parts[1].strip()
-
-                actual_value = dynamic_config.get(variable_name)
-
-                if required_values_str.startswith("[") and required_values_str.endswith(
-                    "]"
-                ):
-                    required_values_str = required_values_str[1:-1]
-                required_values = [
-                    value.strip().strip("'\"")
-                    for value in required_values_str.split(",")
-                    if value.strip()
-                ]
-
-                if isinstance(actual_value, (list, tuple, set)):
-                    actual_values = {str(value) for value in actual_value}
-                    result = not any(
-                        value in actual_values for value in required_values
-                    )
-                else:
-                    result = str(actual_value) not in required_values
-
-                _LOGGER.debug(
-                    "Evaluating condition '%s': variable=%s, required=%s, actual=%s, result=%s",
-                    condition,
-                    variable_name,
-                    required_values,
-                    actual_value,
-                    result,
-                )
-                return result
-        except (ValueError, IndexError) as e:
-            _LOGGER.warning("Invalid condition '%s': %s", condition, str(e))
-            return False
-    elif " in " in condition:
-        try:
-            parts = condition.split(" in ")
-            if len(parts) == 2:
-                variable_name = parts[0].strip()
-                required_values_str = parts[1].strip()
-
-                actual_value = dynamic_config.get(variable_name)
-
-                if required_values_str.startswith("[") and required_values_str.endswith(
-                    "]"
-                ):
-                    required_values_str = required_values_str[1:-1]
-                required_values = [
-                    value.strip().strip("'\"")
-                    for value in required_values_str.split(",")
-                    if value.strip()
-                ]
-
-                if isinstance(actual_value, (list, tuple, set)):
-                    actual_values = {str(value) for value in actual_value}
-                    result = any(value in actual_values for value in required_values)
-                else:
-                    result = str(actual_value) in required_values
-
-                _LOGGER.debug(
-                    "Evaluating condition '%s': variable=%s, required=%s, actual=%s, result=%s",
-                    condition,
-                    variable_name,
-                    required_values,
-                    actual_value,
-                    result,
-                )
-                return result
-        except (ValueError, IndexError) as e:
-            _LOGGER.warning("Invalid condition '%s': %s", condition, str(e))
-            return False
-    elif "!=" in condition:
-        try:
-            parts = condition.split("!=")
-            if len(parts) == 2:
-                variable_name = parts[0].strip()
-                required_value_str = parts[1].strip().strip("'\"")  # Remove quotes
-
-                # Get actual value from dynamic_config
-                actual_value = dynamic_config.get(variable_name)
-
-                # Try to convert to bool first (for true/false)
-                if required_value_str.lower() in ["true", "false"]:
-                    required_value = required_value_str.lower() == "true"
-                    actual_value = (
-                        bool(actual_value) if actual_value is not None else False
-                    )
-                else:
-                    # Try to convert to int, then string
-                    try:
-                        required_value = int(required_value_str)
-                        actual_value = (
-                            int(actual_value) if actual_value is not None else 0
-                        )
-                    except (ValueError, TypeError):
-                        required_value = required_value_str
-                        actual_value = (
-                            str(actual_value) if actual_value is not None else ""
-                        )
-
-                result = actual_value != required_value
-                _LOGGER.debug(
-                    "Evaluating condition '%s': variable=%s, required=%s, actual=%s, result=%s",
-                    condition,
-                    variable_name,
-                    required_value,
-                    actual_value,
-                    result,
-                )
-                return result
-        except (ValueError, IndexError) as e:
-            _LOGGER.warning("Invalid condition '%s': %s", condition, str(e))
-            return False
-    elif "==" in condition:
-        try:
-            parts = condition.split("==")
-            if len(parts) == 2:
-                variable_name = parts[0].strip()
-                required_value_str = parts[1].strip().strip("'\"")  # Remove quotes
-
-                # Get actual value from dynamic_config
-                actual_value = dynamic_config.get(variable_name)
-
-                # Try to convert to bool first (for true/false)
-                if required_value_str.lower() in ["true", "false"]:
-                    required_value = required_value_str.lower() == "true"
-                    actual_value = (
-                        bool(actual_value) if actual_value is not None else False
-                    )
-                else:
-                    # Try to convert to int, then string
-                    try:
-                        required_value = int(required_value_str)
-                        actual_value = (
-                            int(actual_value) if actual_value is not None else 0
-                        )
-                    except (ValueError, TypeError):
-                        required_value = required_value_str
-                        actual_value = (
-                            str(actual_value) if actual_value is not None else ""
-                        )
-
-                result = actual_value == required_value
-                _LOGGER.debug(
-                    "Evaluating condition '%s': variable=%s, required=%s, actual=%s, result=%s",
-                    condition,
-                    variable_name,
-                    required_value,
-                    actual_value,
-                    result,
-                )
-                return result
-        except (ValueError, IndexError) as e:
-            _LOGGER.warning("Invalid condition '%s': %s", condition, str(e))
-            return False
-
-    elif ">=" in condition:
-        try:
-            parts = condition.split(">=")
-            if len(parts) == 2:
-                variable_name = parts[0].strip()
-                required_value_str = parts[1].strip()
-
-                try:
-                    required_value = int(required_value_str)
-                    actual_value = dynamic_config.get(variable_name, 0)
-                    if isinstance(actual_value, str):
-                        actual_value = int(actual_value)
-                    return actual_value >= required_value
-                except ValueError:
-                    return False
-        except (ValueError, IndexError) as e:
-            _LOGGER.warning("Invalid condition '%s': %s", condition, str(e))
-            return False
-    elif ">" in condition:
-        try:
-            parts = condition.split(">")
-            if len(parts) == 2:
-                variable_name = parts[0].strip()
-                required_value_str = parts[1].strip()
-
-                try:
-                    required_value = int(required_value_str)
-                    actual_value = dynamic_config.get(variable_name, 0)
-                    if isinstance(actual_value, str):
-                        actual_value = int(actual_value)
-                    return actual_value > required_value
-                except ValueError:
-                    return False
-        except (ValueError, IndexError) as e:
-            _LOGGER.warning("Invalid condition '%s': %s", condition, str(e))
-            return False
-
-    # Unknown condition format - return True to be safe (include sensor)
-    _LOGGER.warning("Unknown condition format '%s', including sensor", condition)
-    return True
-
-
 def _extract_mppt_number(search_text: str) -> int:
     """Extract MPPT number from sensor name or unique_id."""
     import re
@@ -1577,10 +1612,52 @@ def validate_control_settings(reg: Dict[str, Any], template_name: str) -> bool:
         return False
 
 
+def _build_template_index(custom_dir: Optional[str]) -> Dict[str, Dict[str, Any]]:
+    """Index template headers by name (same priority as load_templates)."""
+    index: Dict[str, Dict[str, Any]] = {}
+    sources = [(TEMPLATE_DIR, False, False), (MAPPING_DIR, False, True)]
+    if custom_dir:
+        sources.append((custom_dir, True, False))
+    for template_dir, is_custom, is_mapping in sources:
+        for template_path in _list_template_files(template_dir):
+            if template_path in _invalid_template_mtimes and (
+                _invalid_template_mtimes[template_path]
+                == _get_file_mtime(template_path)
+            ):
+                continue
+            header = _read_template_header(template_path)
+            if not header or not header.get("name"):
+                continue
+            if is_mapping and "extends" not in header:
+                continue
+            template_name = str(header["name"])
+            _register_template_name_stem(template_name.strip(), template_path)
+            index[template_name] = {
+                **header,
+                "_path": template_path,
+                "_is_custom": is_custom,
+            }
+    return index
+
+
+async def get_template_index() -> Dict[str, Dict[str, Any]]:
+    """Return header metadata of all templates, keyed by template name.
+
+    Only the top-level header (name, display_name, type, default_prefix,
+    requires_connection_type, ...) is parsed, so listing templates does not
+    load and process every sensor. Custom templates override built-in ones.
+    Files that failed a full load are left out until they change; a file
+    that was never fully loaded is listed on its header alone, so callers
+    must still handle get_template_by_name returning None.
+    """
+    custom_dir = await get_custom_template_dir()
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(None, _build_template_index, custom_dir)
+
+
 async def get_template_names() -> List[str]:
     """Get list of available template names."""
-    templates = await load_templates()
-    return [template["name"] for template in templates]
+    return list(await get_template_index())
 
 
 async def load_mapping_template(
@@ -1621,6 +1698,24 @@ async def get_template_by_name(template_name: str) -> Optional[Dict[str, Any]]:
         # Load base templates first (cached)
         base_templates = await load_base_templates()
 
+        # Header index knows the file of each name (custom overrides built-in)
+        indexed = (await get_template_index()).get(template_name)
+        if indexed:
+            template_path = indexed["_path"]
+            if os.path.dirname(template_path) == MAPPING_DIR:
+                template_data = await load_mapping_template(
+                    template_path, base_templates
+                )
+            else:
+                template_data = await load_single_template(
+                    template_path, base_templates
+                )
+            if template_data and template_data.get("name") == template_name:
+                if indexed["_is_custom"]:
+                    template_data["_is_custom"] = True
+                    template_data["_custom_path"] = template_path
+                return template_data
+
         # 1. Check custom templates first (highest priority)
         custom_dir = await get_custom_template_dir()
         if custom_dir:
@@ -239,9 +239,18 @@ class ModbusCoordinatorText(TextEntity):
     async def async_added_to_hass(self) -> None:
         """When entity is added to hass."""
         await super().async_added_to_hass()
-        self.async_on_remove(
-            self._coordinator.async_add_listener(self._handle_coordinator_update)
-        )
+        if self._attr_force_update:
+            # force_update writes every poll: update on every poll
+            remove_listener = self._coordinator.async_add_listener(
+                self._handle_coordinator_update
+            )
+        else:
+            remove_listener = self._coordinator.async_add_register_listener(
+                self._register_key, self._handle_coordinator_update
+            )
+        self.async_on_remove(remove_listener)
+        if self._coordinator.get_register_data(self._register_key):
+            self._handle_coordinator_update()
 
     def _handle_coordinator_update(self) -> None:
         """Handle updated data from the coordinator."""
@@ -4,7 +4,7 @@ This module provides centralized value processing functions that can be used
 by both legacy sensors and coordinator-based entities.
 """
 
-from typing import Any, Dict, Optional, Union
+from typing import Any, Callable, Dict, List, Optional, Union
 
 from .const import MAX_ENTITY_STATE_LENGTH
 from .logger import ModbusManagerLogger
@@ -13,6 +13,10 @@ _LOGGER = ModbusManagerLogger(__name__)
 
 NO_ACTIVE_FLAGS_LABEL = "No active flags"
 
+_MAPPING_KEYS = ("map", "flags", "options")
+
+ValuePipeline = Callable[[Any], Any]
+
 
 def apply_bit_operations(value: Any, config: Dict[str, Any]) -> Optional[int]:
     """Apply bit operations to a value.
@@ -253,6 +257,105 @@ def apply_value_mapping(value: Any, config: Dict[str, Any]) -> Any:
         return value
 
 
+def has_bit_operations(config: Dict[str, Any]) -> bool:
+    """Return True if at least one bit operation parameter is actually set."""
+    return any(
+        config.get(key) is not None for key in ("bitmask", "bit_position", "bit_range")
+    ) or any(config.get(key, 0) != 0 for key in ("bit_shift", "bit_rotate"))
+
+
+def compile_value_pipeline(
+    config: Dict[str, Any],
+    apply_precision: bool = True,
+) -> ValuePipeline:
+    """Compile the processing pipeline of one register config.
+
+    The returned callable behaves like process_register_value(value, config)
+    but only contains the steps the config uses; e.g. a uint16 with scale 0.1
+    and precision 1 becomes one multiply and round. Compile once per config
+    (at cache build time) and reuse it for every value.
+
+    Args:
+        config: Register configuration dict (must not change afterwards)
+        apply_precision: Whether to apply precision rounding
+
+    Returns:
+        Callable mapping a decoded value to the fully processed value
+    """
+    scale = config.get("scale", 1.0)
+    offset = config.get("offset", 0.0)
+    scaled = scale != 1.0 or offset != 0.0
+    precision = config.get("precision")
+    try:
+        rounded = apply_precision and precision is not None and precision > 0
+    except TypeError:
+        _LOGGER.warning(
+            "Invalid precision %r for %s, not rounding",
+            precision,
+            config.get("name", "unknown"),
+        )
+        rounded = False
+
+    numeric_op: Optional[ValuePipeline]
+    if has_bit_operations(config):
+        steps: List[ValuePipeline] = []
+        if scaled:
+            steps.append(lambda value: (value * scale) + offset)
+        steps.append(lambda value: apply_bit_operations(value, config))
+        if rounded:
+            # Bit operations can yield None; only numbers are rounded
+            steps.append(
+                lambda value: round(float(value), precision)
+                if isinstance(value, (int, float))
+                else value
+            )
+
+        def numeric_op(value: Any) -> Any:
+            for step in steps:
+                value = step(value)
+            return value
+
+    elif scaled and rounded:
+
+        def numeric_op(value: Any) -> Any:
+            return round(float((value * scale) + offset), precision)
+
+    elif scaled:
+
+        def numeric_op(value: Any) -> Any:
+            return (value * scale) + offset
+
+    elif rounded:
+
+        def numeric_op(value: Any) -> Any:
+            return round(float(value), precision)
+
+    else:
+        numeric_op = None
+
+    mapped = any(config.get(key) for key in _MAPPING_KEYS)
+
+    def pipeline(value: Any) -> Any:
+        if value is None:
+            return None
+        try:
+            processed_value = value
+            if numeric_op is not None and isinstance(processed_value, (int, float)):
+                processed_value = numeric_op(processed_value)
+            if mapped:
+                processed_value = apply_value_mapping(processed_value, config)
+            return processed_value
+        except Exception as e:
+            _LOGGER.error(
+                "Error processing register value for %s: %s",
+                config.get("name", "unknown"),
+                str(e),
+            )
+            return value
+
+    return pipeline
+
+
 def process_register_value(
     value: Any,
     config: Dict[str, Any],
@@ -266,6 +369,8 @@ def process_register_value(
     3. Precision/rounding (if applicable and requested)
     4. Value mapping (map/flags/options)
 
+    For repeated processing with the same config use compile_value_pipeline.
+
     Args:
         value: Raw register value
         config: Register configuration dict
@@ -274,45 +379,4 @@ def process_register_value(
     Returns:
         Fully processed value
     """
-    try:
-        if value is None:
-            return None
-
-        processed_value = value
-
-        # 1. Apply scale and offset (for numeric values)
-        if isinstance(processed_value, (int, float)):
-            scale = config.get("scale", 1.0)
-            offset = config.get("offset", 0.0)
-            if scale != 1.0 or offset != 0.0:
-                processed_value = (processed_value * scale) + offset
-
-        # 2. Apply bit operations (for numeric values)
-        # Only apply if at least one bit operation parameter is actually set
-        has_bit_ops = any(
-            config.get(key) is not None
-            for key in ["bitmask", "bit_position", "bit_range"]
-        ) or any(config.get(key, 0) != 0 for key in ["bit_shift", "bit_rotate"])
-
-        if isinstance(processed_value, (int, float)) and has_bit_ops:
-            processed_value = apply_bit_operations(processed_value, config)
-
-        # 3. Apply precision (after bit operations, before mapping)
-        if apply_precision and isinstance(processed_value, (int, float)):
-            precision = config.get("precision")
-            if precision is not None and precision > 0:
-                processed_value = round(float(processed_value), precision)
-
-        # 4. Apply value mapping (map, flags, options)
-        if any(config.get(key) for key in ["map", "flags", "options"]):
-            processed_value = apply_value_mapping(processed_value, config)
-
-        return processed_value
-
-    except Exception as e:
-        _LOGGER.error(
-            "Error processing register value for %s: %s",
-            config.get("name", "unknown"),
-            str(e),
-        )
-        return value
+    return compile_value_pipeline(config, apply_precision)(value)